@@ -1,18 +1,70 @@
+import asyncio
+import bisect
 import math
+import mmap
+import numbers
 import numpy
+import operator
+import pathlib
+import time
+import weakref
+from collections import (
+	Counter,
+	deque
+)
+from pandas import DataFrame
+from PyVarTools.math.graph_2D_align import get_aligned_values
+from PyVarTools.math.graph_2D_compression import CompressionPolicy
+from PyVarTools.math.graph_2D_downsample import (
+	get_downsample_indexes,
+	get_rdp_indexes
+)
+from PyVarTools.math.graph_2D_extrema import find_extrema_indexes
+from PyVarTools.math.graph_2D_range import (
+	AggregationPyramid,
+	BucketStatistics,
+	RangeStatistics,
+	RollingStatistics,
+	SegmentTree,
+	SparseTable,
+	get_rolling_statistics,
+	get_window_starts
+)
+from PyVarTools.math.graph_2D_vectorized import (
+	continues_straight_section,
+	get_mean_tolerance,
+	get_point_angles,
+	get_section_bounds,
+	get_section_summaries,
+	iterate_section_bounds
+)
 from typing import (
 	Any,
+	AsyncGenerator,
+	AsyncIterable,
 	Generator,
+	Hashable,
+	Iterable,
+	Iterator,
 	Literal,
 	Optional,
 	Union
 )
 
 
+STREAMING_BLOCK_SIZE = 1 << 20
+SCALAR_STATISTICS_SIZE = 32
+INT64_MIN = -(1 << 63)
+INT64_MAX = (1 << 63) - 1
+
+
 class GraphPoint:
 	"""
 	Represents a point on a graph with x and y coordinates.
 
+	The class uses __slots__, so a point only stores its two coordinates. Points are immutable, compare and hash by their
+	coordinates and unpack like an (x, y) pair, so they can be used in sets and as dict keys.
+
 	Attributes:
 		x (Union[int, float]): The x-coordinate of the point.
 		y (Union[int, float]): The y-coordinate of the point.
@@ -23,8 +75,12 @@ class GraphPoint:
 
 		point = GraphPoint(1.5, 2.5)
 		(1.5000, 2.5000)
+
+		x, y = GraphPoint(1, 2)
 	"""
 	
+	__slots__ = ("x", "y")
+	
 	def __init__(self, x: Union[int, float], y: Union[int, float]):
 		"""
 		Initializes a new GraphPoint.
@@ -33,8 +89,75 @@ class GraphPoint:
 			x (Union[int, float]): The x-coordinate.
 			y (Union[int, float]): The y-coordinate.
 		"""
-		self.x = x
-		self.y = y
+		object.__setattr__(self, "x", x)
+		object.__setattr__(self, "y", y)
+	
+	def __setattr__(self, name: str, value: Any):
+		"""
+		Prevents changing the coordinates.
+
+		Args:
+			name (str): The name of the attribute.
+			value (Any): The new value.
+
+		Raises:
+			AttributeError: Always, as points are immutable.
+		"""
+		raise AttributeError("GraphPoint is immutable")
+	
+	def __delattr__(self, name: str):
+		"""
+		Prevents deleting the coordinates.
+
+		Args:
+			name (str): The name of the attribute.
+
+		Raises:
+			AttributeError: Always, as points are immutable.
+		"""
+		raise AttributeError("GraphPoint is immutable")
+	
+	def __reduce__(self) -> tuple[type["GraphPoint"], tuple[Union[int, float], Union[int, float]]]:
+		"""
+		Pickles a point by its coordinates, as they cannot be set on an unpickled instance.
+
+		Returns:
+			tuple[type[GraphPoint], tuple[Union[int, float], Union[int, float]]]: The class and the coordinates.
+		"""
+		return GraphPoint, (self.x, self.y)
+	
+	def __eq__(self, other: Any) -> bool:
+		"""
+		Compares the coordinates of two points.
+
+		Args:
+			other (Any): The object to compare with.
+
+		Returns:
+			bool: True if other is a GraphPoint with the same coordinates.
+		"""
+		if not isinstance(other, GraphPoint):
+			return NotImplemented
+		
+		return self.x == other.x and self.y == other.y
+	
+	def __hash__(self) -> int:
+		"""
+		Hashes the coordinates, consistently with __eq__.
+
+		Returns:
+			int: The hash of the (x, y) pair.
+		"""
+		return hash((self.x, self.y))
+	
+	def __iter__(self) -> Iterator[Union[int, float]]:
+		"""
+		Iterates over the coordinates, so a point can be unpacked as x, y = point.
+
+		Returns:
+			Iterator[Union[int, float]]: An iterator over x and y.
+		"""
+		return iter((self.x, self.y))
 	
 	def __str__(self) -> str:
 		"""
@@ -85,368 +208,3042 @@ def calculate_angle_degree(start_point: GraphPoint, end_point: GraphPoint) -> fl
 		return math.degrees(math.atan(tanh))
 
 
-class GraphSection:
+class RunningStatistics:
 	"""
-	Represents a section of a graph defined by a list of GraphPoints.
+	Keeps running statistics of a sequence of values, updated in O(1) per added value.
+
+	The sum is accumulated with Neumaier compensated summation, the mean and variance with Welford's algorithm,
+	and the minimum and maximum are tracked together with the index of their first occurrence.
 
 	Attributes:
-		points (list[GraphPoint]): The list of points in the section.
-		angle_sensitivity (float): The sensitivity for determining the direction of the section.
-		min (GraphPoint): The point with the minimum y-value.
-		max (GraphPoint): The point with the maximum y-value.
-		average (float): The average y-value of the points.
+		count (int): The number of values.
+		min_value (Optional[Union[int, float]]): The minimum value, or None if there are no values.
+		min_index (Optional[int]): The index of the first minimum value, or None if there are no values.
+		max_value (Optional[Union[int, float]]): The maximum value, or None if there are no values.
+		max_index (Optional[int]): The index of the first maximum value, or None if there are no values.
 
 	:Usage:
-		points = [GraphPoint(1, 1), GraphPoint(2, 2), GraphPoint(3, 3)]
-		section = GraphSection(points)
-		[(1, 1), (2, 2), (3, 3)] (num_points: 3, min: (1, 1), max: (3, 3), average: 2.0000, direction: increasing)
+		statistics = RunningStatistics()
+		statistics.add(1)
+		statistics.add(3)
+		statistics.mean
+		2.0
 	"""
 	
-	def __init__(self, points: list[GraphPoint], angle_sensitivity: float = 0.0):
+	def __init__(self):
+		"""Initializes empty running statistics."""
+		self.count = 0
+		self.min_value: Optional[Union[int, float]] = None
+		self.min_index: Optional[int] = None
+		self.max_value: Optional[Union[int, float]] = None
+		self.max_index: Optional[int] = None
+		
+		self._sum = 0.0
+		self._compensation = 0.0
+		self._welford_mean = 0.0
+		self._welford_m2 = 0.0
+	
+	@classmethod
+	def from_values(cls, values: Any) -> "RunningStatistics":
 		"""
-		Initializes a new GraphSection.
+		Creates running statistics for the given values in one vectorized pass.
+
+		Fewer than SCALAR_STATISTICS_SIZE values are added one by one, which is cheaper than the numpy calls for short sections.
 
 		Args:
-			points (list[GraphPoint]): The list of GraphPoints.
-			angle_sensitivity (float): The angle sensitivity. Defaults to 0.0.
+			values (Any): The values (list, tuple, numpy array, etc.). Indexes of min and max are positions in values.
 
-		Raises:
-			ValueError: If angle_sensitivity is less than 0.0.
+		Returns:
+			RunningStatistics: The statistics of the values.
 		"""
-		if angle_sensitivity < 0.0:
-			raise ValueError("angle_sensitivity must be >= 0.0")
+		statistics = cls()
 		
-		self.points = points
-		self.angle_sensitivity = angle_sensitivity
+		if len(values) < SCALAR_STATISTICS_SIZE:
+			for value in values.tolist() if isinstance(values, numpy.ndarray) else values:
+				statistics.add(value)
 		
-		self.min = min(points, key=lambda point: point.y)
+			return statistics
 		
-		self.max = max(points, key=lambda point: point.y)
+		values = numpy.asarray(values)
 		
-		self.average = numpy.mean([point.y for point in self.points]).item()
+		statistics.count = len(values)
+		statistics._sum = math.fsum(values.tolist())
+		statistics._welford_mean = statistics._sum / statistics.count
+		statistics._welford_m2 = float(numpy.sum(numpy.square(values - statistics._welford_mean)))
+		
+		statistics.min_index = int(numpy.argmin(values))
+		statistics.min_value = values[statistics.min_index].item()
+		statistics.max_index = int(numpy.argmax(values))
+		statistics.max_value = values[statistics.max_index].item()
+		
+		return statistics
 	
-	def __str__(self) -> str:
+	@property
+	def mean(self) -> Optional[float]:
 		"""
-		Returns a string representation of the section.
+		Returns the mean of the values.
 
 		Returns:
-			str: String representation of the section.
+			Optional[float]: The compensated sum divided by the count, or None if there are no values.
 		"""
-		min_string = f"{self.min.y:.4f}" if isinstance(self.min.y, float) else str(self.min.y)
-		max_string = f"{self.max.y:.4f}" if isinstance(self.max.y, float) else str(self.max.y)
-		average_string = f"{self.average:.4f}" if isinstance(self.average, float) else str(self.average)
+		return self.sum / self.count if self.count else None
+	
+	@property
+	def std(self) -> Optional[float]:
+		"""
+		Returns the population standard deviation of the values.
+
+		Returns:
+			Optional[float]: The standard deviation, or None if there are no values.
+		"""
+		variance = self.variance
 		
-		return f"{self.points} (num_points: {len(self.points)}, min: ({self.min.x},{min_string}), max: ({self.max.x},{max_string}), average: {average_string}, direction: {self.get_direction()})"
+		return math.sqrt(variance) if variance is not None else None
 	
-	def __repr__(self) -> str:
+	@property
+	def sum(self) -> float:
 		"""
-		Returns a string representation of the section.
+		Returns the compensated sum of the values.
 
 		Returns:
-			str: String representation of the section.
+			float: The sum of the values.
 		"""
-		return str(self)
+		return self._sum + self._compensation
 	
-	def calculate_average(self):
-		"""Calculates and updates the average y-value."""
-		self.average = numpy.mean([point.y for point in self.points]).item()
+	@property
+	def variance(self) -> Optional[float]:
+		"""
+		Returns the population variance of the values.
+
+		Returns:
+			Optional[float]: The variance, or None if there are no values.
+		"""
+		return self._welford_m2 / self.count if self.count else None
 	
-	def add(self, point: GraphPoint):
+	def add(self, value: Union[int, float], index: Optional[int] = None):
 		"""
-		Adds a point to the section and updates min, max, and average.
+		Adds a value and updates all statistics in O(1).
 
 		Args:
-			point (GraphPoint): The point to add.
+			value (Union[int, float]): The value to add.
+			index (Optional[int]): The index of the value used for min_index and max_index. Defaults to the number of previously added values.
 		"""
-		self.points.append(point)
+		if index is None:
+			index = self.count
 		
-		if point.y < self.min.y:
-			self.min = point
+		float_value = float(value)
 		
-		if point.y > self.max.y:
-			self.max = point
+		total = self._sum + float_value
 		
-		self.calculate_average()
+		if abs(self._sum) >= abs(float_value):
+			self._compensation += (self._sum - total) + float_value
+		else:
+			self._compensation += (float_value - total) + self._sum
+		
+		self._sum = total
+		
+		self.count += 1
+		delta = float_value - self._welford_mean
+		self._welford_mean += delta / self.count
+		self._welford_m2 += delta * (float_value - self._welford_mean)
+		
+		if self.min_value is None or value < self.min_value:
+			self.min_value = value
+			self.min_index = index
+		
+		if self.max_value is None or value > self.max_value:
+			self.max_value = value
+			self.max_index = index
 	
-	def get_angle_degree(self) -> Optional[float]:
+	def add_values(self, values: Any, start_index: Optional[int] = None):
 		"""
-		Calculates the angle of the section.
+		Adds a block of values in one vectorized pass.
 
-		Returns:
-			Optional[float]: The angle in degrees, or None if the section has less than two points.
+		The statistics of the block are computed with numpy and merged into the current ones with the
+		parallel variance formula of Chan et al., so the result does not depend on how the values are split into blocks.
+
+		Args:
+			values (Any): The values (list, tuple, numpy array, etc.).
+			start_index (Optional[int]): The index of the first value used for min_index and max_index. Defaults to the number of previously added values.
 		"""
-		if len(self.points) >= 2:
-			return calculate_angle_degree(self.points[0], self.points[-1])
+		if start_index is None:
+			start_index = self.count
+		
+		statistics = RunningStatistics.from_values(values)
+		
+		if statistics.count == 0:
+			return
+		
+		if self.count == 0:
+			self.count = statistics.count
+			self.min_value, self.min_index = statistics.min_value, statistics.min_index + start_index
+			self.max_value, self.max_index = statistics.max_value, statistics.max_index + start_index
+			self._sum, self._compensation = statistics._sum, statistics._compensation
+			self._welford_mean, self._welford_m2 = statistics._welford_mean, statistics._welford_m2
+			return
+		
+		total = self._sum + statistics._sum
+		
+		if abs(self._sum) >= abs(statistics._sum):
+			self._compensation += (self._sum - total) + statistics._sum
 		else:
-			return None
+			self._compensation += (statistics._sum - total) + self._sum
+		
+		self._sum = total
+		self._compensation += statistics._compensation
+		
+		count = self.count + statistics.count
+		delta = statistics._welford_mean - self._welford_mean
+		
+		self._welford_m2 += statistics._welford_m2 + delta * delta * self.count * statistics.count / count
+		self._welford_mean += delta * statistics.count / count
+		self.count = count
+		
+		if statistics.min_value < self.min_value:
+			self.min_value = statistics.min_value
+			self.min_index = statistics.min_index + start_index
+		
+		if statistics.max_value > self.max_value:
+			self.max_value = statistics.max_value
+			self.max_index = statistics.max_index + start_index
+
+
+class SlidingStatistics(RunningStatistics):
+	"""
+	Running statistics of a sliding window of values: values are added at the end and removed from the start in O(1).
+
+	The sum and the mean are updated by compensated summation and Welford's algorithm in both directions. The minimum and
+	maximum come from monotonic deques of (position, value) pairs, so removing the current extremum never needs a rescan.
+	min_index and max_index are indexes in the window, i.e. they shift down by one with every removed value.
+
+	:Usage:
+		statistics = SlidingStatistics()
+		statistics.add_values([3, 1, 2])
+		statistics.remove_first(3)
+		(statistics.min_value, statistics.min_index, statistics.mean)
+		(1, 0, 1.5)
+	"""
 	
-	def get_direction(self) -> Optional[str]:
+	def __init__(self):
+		"""Initializes empty sliding statistics."""
+		super().__init__()
+		
+		self._num_removed = 0
+		self._min_deque: deque[tuple[int, Union[int, float]]] = deque()
+		self._max_deque: deque[tuple[int, Union[int, float]]] = deque()
+	
+	@classmethod
+	def from_values(cls, values: Any) -> "SlidingStatistics":
 		"""
-		Determines the direction of the section.
+		Creates sliding statistics for the given values.
+
+		Args:
+			values (Any): The values (list, tuple, numpy array, etc.).
 
 		Returns:
-			Optional[str]: The direction ("increasing", "decreasing", "straight"), or None if the section has less than two points.
+			SlidingStatistics: The statistics of the values.
 		"""
-		if len(self.points) >= 2:
-			angle = self.get_angle_degree()
-			if angle is None:
-				return None
+		statistics = cls()
+		statistics.add_values(values)
 		
-			if angle > self.angle_sensitivity:
-				return "increasing"
-			elif angle < -self.angle_sensitivity:
-				return "decreasing"
-			else:
-				return "straight"
+		return statistics
+	
+	def _update_extremes(self):
+		"""Copies the fronts of the deques to the min and max attributes."""
+		if self._min_deque:
+			self.min_index, self.min_value = self._min_deque[0][0] - self._num_removed, self._min_deque[0][1]
+			self.max_index, self.max_value = self._max_deque[0][0] - self._num_removed, self._max_deque[0][1]
 		else:
-			return None
+			self.min_index = self.min_value = self.max_index = self.max_value = None
 	
-	def get_graph_points_after_max(self) -> list[GraphPoint]:
+	def add(self, value: Union[int, float], index: Optional[int] = None):
 		"""
-		Returns the points after the maximum y-value point.
+		Adds a value at the end of the window and updates all statistics in O(1) amortized.
 
-		Returns:
-			list[GraphPoint]: The points after the maximum.
+		Args:
+			value (Union[int, float]): The value to add.
+			index (Optional[int]): Ignored, the value always gets the index after the last value in the window. Accepted for compatibility with RunningStatistics.add.
 		"""
-		return self.points[self.points.index(self.max):]
+		position = self._num_removed + self.count
+		
+		super().add(value)
+		
+		while self._min_deque and self._min_deque[-1][1] > value:
+			self._min_deque.pop()
+		
+		while self._max_deque and self._max_deque[-1][1] < value:
+			self._max_deque.pop()
+		
+		self._min_deque.append((position, value))
+		self._max_deque.append((position, value))
+		
+		self._update_extremes()
 	
-	def get_graph_points_after_min(self) -> list[GraphPoint]:
+	def add_values(self, values: Any, start_index: Optional[int] = None):
 		"""
-		Returns the points after the minimum y-value point.
+		Adds a block of values at the end of the window.
 
-		Returns:
-			list[GraphPoint]: The points after the minimum.
-		"""
-		return self.points[self.points.index(self.min):]
-	
-	def remove_point_after_max(self):
-		"""
-		Removes points in the section after the maximum y-value point and recalculates the average.
+		Args:
+			values (Any): The values (list, tuple, numpy array, etc.).
+			start_index (Optional[int]): Ignored, accepted for compatibility with RunningStatistics.add_values.
 		"""
-		self.points = self.points[: self.points.index(self.max) + 1]
-		self.calculate_average()
+		for value in values.tolist() if isinstance(values, numpy.ndarray) else values:
+			self.add(value)
 	
-	def remove_point_after_min(self):
+	def remove_first(self, value: Union[int, float]):
 		"""
-		Removes points in the section after the minimum y-value point and recalculates the average.
+		Removes the first value of the window and updates all statistics in O(1).
+
+		Args:
+			value (Union[int, float]): The removed value. Must be the first value of the window.
+
+		Raises:
+			ValueError: If there are no values.
 		"""
-		self.points = self.points[: self.points.index(self.min) + 1]
-		self.calculate_average()
+		if self.count == 0:
+			raise ValueError("no values to remove")
+		
+		if self.count == 1:
+			num_removed = self._num_removed + 1
+			self.__init__()
+			self._num_removed = num_removed
+			return
+		
+		float_value = -float(value)
+		total = self._sum + float_value
+		
+		if abs(self._sum) >= abs(float_value):
+			self._compensation += (self._sum - total) + float_value
+		else:
+			self._compensation += (float_value - total) + self._sum
+		
+		self._sum = total
+		
+		self.count -= 1
+		delta = -float_value - self._welford_mean
+		self._welford_mean -= delta / self.count
+		self._welford_m2 = max(self._welford_m2 - delta * (-float_value - self._welford_mean), 0.0)
+		
+		if self._min_deque[0][0] == self._num_removed:
+			self._min_deque.popleft()
+		
+		if self._max_deque[0][0] == self._num_removed:
+			self._max_deque.popleft()
+		
+		self._num_removed += 1
+		self._update_extremes()
 
 
-class ThresholdSensitivity:
+class GraphSection:
 	"""
-	Represents the sensitivity for threshold-based comparisons.
+	Represents a section of a graph: a contiguous range of points of a source.
+
+	The source is either a list of GraphPoints or a Graph, and the section only keeps the (start, stop) index range
+	into it. Sections created by Graph.get_sections are views of the graph, so no points are copied and the point list
+	is only materialized when the points attribute is read. The minimum and the maximum are tracked as indexes,
+	so trimming a section after its extremum is O(1) apart from recomputing the statistics.
 
 	Attributes:
-		threshold_sensitivity (float): The sensitivity value.
-		type_ (Literal["absolute", "relative"]): The type of sensitivity ("absolute" or "relative").
+		source (Union[list[GraphPoint], Graph]): The points the section is a range of.
+		start (int): The index of the first point of the section in the source.
+		stop (int): The index after the last point of the section in the source.
+		points (list[GraphPoint]): The list of points in the section. Materialized on the first access. Assigning a list makes it the source.
+		angle_sensitivity (float): The sensitivity for determining the direction of the section.
+		statistics (RunningStatistics): The running statistics of the y-values. Indexes are relative to start.
+		min (GraphPoint): The point with the minimum y-value. An assigned point is kept until the statistics change.
+		max (GraphPoint): The point with the maximum y-value. An assigned point is kept until the statistics change.
+		min_index (int): The index of the point with the minimum y-value in the source.
+		max_index (int): The index of the point with the maximum y-value in the source.
+		average (float): The average y-value of the points. An assigned value is kept until the statistics change.
+		variance (float): The population variance of the y-values.
+		std (float): The population standard deviation of the y-values.
 
 	:Usage:
-		sensitivity = ThresholdSensitivity(0.1, "relative")
-		sensitivity.get_increase_sensitive_point(1)
-		1.1
+		points = [GraphPoint(1, 1), GraphPoint(2, 2), GraphPoint(3, 3)]
+		section = GraphSection(points)
+		[(1, 1), (2, 2), (3, 3)] (num_points: 3, min: (1, 1), max: (3, 3), average: 2.0000, direction: increasing)
+
+		graph = Graph(points)
+		section = GraphSection.from_graph(graph, 1, 3)
+		[(2, 2), (3, 3)] (num_points: 2, min: (2, 2), max: (3, 3), average: 2.5000, direction: increasing)
 	"""
 	
-	def __init__(
-			self,
-			threshold_sensitivity: float = 0.0,
-			type_: Literal["absolute", "relative"] = "absolute"
-	):
+	def __init__(self, points: list[GraphPoint], angle_sensitivity: float = 0.0):
 		"""
-		Initializes a new ThresholdSensitivity object.
+		Initializes a new GraphSection.
 
 		Args:
-			threshold_sensitivity (float): The sensitivity value. Defaults to 0.0.
-			type_ (Literal["absolute", "relative"]): The type of sensitivity. Defaults to "absolute".
+			points (list[GraphPoint]): The list of GraphPoints. The section covers the whole list.
+			angle_sensitivity (float): The angle sensitivity. Defaults to 0.0.
 
 		Raises:
-			ValueError: If type_ is not "absolute" or "relative".
+			ValueError: If angle_sensitivity is less than 0.0 or points is empty.
 		"""
-		if type_ not in ["absolute", "relative"]:
-			raise ValueError('type_ must be "absolute" or "relative"')
-		
-		self.threshold_sensitivity = threshold_sensitivity
-		self.type_ = type_
+		self._initialize(points, 0, len(points), angle_sensitivity)
 	
-	def get_decrease_sensitive_point(self, point: Union[GraphPoint, int, float]) -> float:
+	def _initialize(
+			self,
+			source: Union[list[GraphPoint], "Graph"],
+			start: int,
+			stop: int,
+			angle_sensitivity: float
+	):
 		"""
-		Calculates the decreased sensitive point based on the sensitivity type.
+		Sets the source and the index range of the section and computes its statistics.
 
 		Args:
-			point (Union[GraphPoint, int, float]): The point or value to adjust.
+			source (Union[list[GraphPoint], Graph]): The points the section is a range of.
+			start (int): The index of the first point.
+			stop (int): The index after the last point.
+			angle_sensitivity (float): The angle sensitivity.
 
-		Returns:
-			float: The decreased sensitive point.
+		Raises:
+			ValueError: If angle_sensitivity is less than 0.0 or the range is empty.
 		"""
-		decrease_sensitive_point = point.y if isinstance(point, GraphPoint) else point
+		if angle_sensitivity < 0.0:
+			raise ValueError("angle_sensitivity must be >= 0.0")
 		
-		if self.type_ == "absolute":
-			return decrease_sensitive_point - self.threshold_sensitivity
+		if stop <= start:
+			raise ValueError("points must not be empty")
 		
-		if self.type_ == "relative":
-			return decrease_sensitive_point * (1 - self.threshold_sensitivity)
+		self.source = source
+		self.start = start
+		self.stop = stop
+		self.angle_sensitivity = angle_sensitivity
+		
+		self._points: Optional[list[GraphPoint]] = None
+		self._first_point = self._get_point(start)
+		self._assigned: dict[str, Any] = {}
+		
+		self.calculate_average()
 	
-	def get_increase_sensitive_point(self, point: Union[GraphPoint, int, float]) -> float:
+	@classmethod
+	def from_graph(cls, graph: "Graph", start: int, stop: int, angle_sensitivity: float = 0.0) -> "GraphSection":
 		"""
-		Calculates the increased sensitive point based on the sensitivity type.
+		Creates a section that is a view of the points of a graph in the given index range.
+
+		The graph keeps a weak reference to the section and detaches it (see detach) before its points are replaced.
 
 		Args:
-			point (Union[GraphPoint, int, float]): The point or value to adjust.
+			graph (Graph): The graph.
+			start (int): The index of the first point.
+			stop (int): The index after the last point.
+			angle_sensitivity (float): The angle sensitivity. Defaults to 0.0.
 
 		Returns:
-			float: The increased sensitive point.
+			GraphSection: The section.
+
+		Raises:
+			ValueError: If angle_sensitivity is less than 0.0 or the range is empty.
+			IndexError: If the range is out of the graph.
 		"""
-		increase_sensitive_point = point.y if isinstance(point, GraphPoint) else point
+		if start < 0 or stop > len(graph):
+			raise IndexError("section range out of graph range")
 		
-		if self.type_ == "absolute":
-			return increase_sensitive_point + self.threshold_sensitivity
+		section = cls.__new__(cls)
+		section._initialize(graph, start, stop, angle_sensitivity)
+		graph._views.add(section)
 		
-		if self.type_ == "relative":
-			return increase_sensitive_point * (1 + self.threshold_sensitivity)
-
-
-class Graph:
-	"""
-	Represents a graph composed of GraphPoints.
-
-	Attributes:
-		points (list[GraphPoint]): The list of points in the graph.
-		min (Optional[GraphPoint]): The point with the minimum y-value.
-		max (Optional[GraphPoint]): The point with the maximum y-value.
-		average (Optional[float]): The average y-value of all points.
-
-	:Usage:
-		graph = Graph([GraphPoint(1, 1), GraphPoint(2, 2)])
-		(num_points: 2, min: 1, max: 2, average: 1.5000)
-	"""
+		return section
 	
-	def __init__(self, points: Optional[list[GraphPoint]] = None):
+	def __len__(self) -> int:
 		"""
-		Initializes a new Graph object.
+		Returns the number of points in the section.
 
-		Args:
-			points (Optional[list[GraphPoint]]): Initial list of points. Defaults to None.
+		Returns:
+			int: The number of points.
 		"""
-		if points is not None:
-			self.points = points
-			
-			self.min = min(points, key=lambda point: point.y) if points else None
-			
-			self.max = max(points, key=lambda point: point.y) if points else None
-			
-			self.average = numpy.mean([point.y for point in self.points]).item() if points else None
-		else:
-			self.points = []
-			self.min = None
-			self.max = None
-			self.average = None
+		return self.stop - self.start
 	
 	def __str__(self) -> str:
 		"""
-		Returns a string representation of the graph.
+		Returns a string representation of the section.
 
 		Returns:
-			str: The string representation.
+			str: String representation of the section.
 		"""
-		min_string = f"{self.min.y:.4f}" if self.min and isinstance(self.min.y, float) else str(self.min)
-		max_string = f"{self.max.y:.4f}" if self.max and isinstance(self.max.y, float) else str(self.max)
-		average_string = (
-				f"{self.average:.4f}"
+		min_string = f"{self.min.y:.4f}" if isinstance(self.min.y, float) else str(self.min.y)
+		max_string = f"{self.max.y:.4f}" if isinstance(self.max.y, float) else str(self.max.y)
+		average_string = f"{self.average:.4f}" if isinstance(self.average, float) else str(self.average)
+		
+		return f"{self.points} (num_points: {len(self)}, min: ({self.min.x},{min_string}), max: ({self.max.x},{max_string}), average: {average_string}, direction: {self.get_direction()})"
+	
+	def __repr__(self) -> str:
+		"""
+		Returns a string representation of the section.
+
+		Returns:
+			str: String representation of the section.
+		"""
+		return str(self)
+	
+	@property
+	def average(self) -> float:
+		"""
+		Returns the average y-value of the points.
+
+		Returns:
+			float: The average y-value.
+		"""
+		if "average" in self._assigned:
+			return self._assigned["average"]
+		
+		return self.statistics.mean
+	
+	@average.setter
+	def average(self, average: float):
+		"""
+		Overrides the average y-value until the statistics change (add, calculate_average, trimming or assigning points).
+
+		Args:
+			average (float): The average y-value.
+		"""
+		self._assigned["average"] = average
+	
+	@property
+	def max(self) -> GraphPoint:
+		"""
+		Returns the point with the maximum y-value.
+
+		Returns:
+			GraphPoint: The first point with the maximum y-value.
+		"""
+		if "max" in self._assigned:
+			return self._assigned["max"]
+		
+		return self._get_point(self.max_index)
+	
+	@max.setter
+	def max(self, max_: GraphPoint):
+		"""
+		Overrides the point with the maximum y-value until the statistics change (add, calculate_average, trimming or assigning points).
+
+		Args:
+			max_ (GraphPoint): The point with the maximum y-value.
+		"""
+		self._assigned["max"] = max_
+	
+	@property
+	def max_index(self) -> int:
+		"""
+		Returns the index of the point with the maximum y-value in the source.
+
+		Returns:
+			int: The index of the first point with the maximum y-value.
+		"""
+		return self.start + self.statistics.max_index
+	
+	@property
+	def min(self) -> GraphPoint:
+		"""
+		Returns the point with the minimum y-value.
+
+		Returns:
+			GraphPoint: The first point with the minimum y-value.
+		"""
+		if "min" in self._assigned:
+			return self._assigned["min"]
+		
+		return self._get_point(self.min_index)
+	
+	@min.setter
+	def min(self, min_: GraphPoint):
+		"""
+		Overrides the point with the minimum y-value until the statistics change (add, calculate_average, trimming or assigning points).
+
+		Args:
+			min_ (GraphPoint): The point with the minimum y-value.
+		"""
+		self._assigned["min"] = min_
+	
+	@property
+	def min_index(self) -> int:
+		"""
+		Returns the index of the point with the minimum y-value in the source.
+
+		Returns:
+			int: The index of the first point with the minimum y-value.
+		"""
+		return self.start + self.statistics.min_index
+	
+	@property
+	def points(self) -> list[GraphPoint]:
+		"""
+		Returns the points of the section.
+
+		The list is materialized on the first access and reused until the section changes. A section that covers a whole
+		list source returns the list itself.
+
+		Returns:
+			list[GraphPoint]: The list of points.
+		"""
+		if self._points is None:
+			self._points = self._get_points(self.start, self.stop)
+		
+		return self._points
+	
+	@points.setter
+	def points(self, points: list[GraphPoint]):
+		"""
+		Replaces the points of the section with a list, which becomes its source, and recalculates the statistics.
+
+		Args:
+			points (list[GraphPoint]): The points.
+
+		Raises:
+			ValueError: If points is empty.
+		"""
+		self._initialize(points, 0, len(points), self.angle_sensitivity)
+	
+	@property
+	def std(self) -> float:
+		"""
+		Returns the population standard deviation of the y-values.
+
+		Returns:
+			float: The standard deviation.
+		"""
+		return self.statistics.std
+	
+	@property
+	def variance(self) -> float:
+		"""
+		Returns the population variance of the y-values.
+
+		Returns:
+			float: The variance.
+		"""
+		return self.statistics.variance
+	
+	def _get_point(self, index: int) -> GraphPoint:
+		"""
+		Returns the point of the source at the given index.
+
+		Args:
+			index (int): The index in the source.
+
+		Returns:
+			GraphPoint: The point.
+		"""
+		if isinstance(self.source, list):
+			return self.source[index]
+		
+		return self.source.get_point(index)
+	
+	def _get_points(self, start: int, stop: int) -> list[GraphPoint]:
+		"""
+		Returns the points of the source in the given index range.
+
+		Args:
+			start (int): The index of the first point.
+			stop (int): The index after the last point.
+
+		Returns:
+			list[GraphPoint]: The points.
+		"""
+		if isinstance(self.source, list):
+			if start == 0 and stop == len(self.source):
+				return self.source
+		
+			return self.source[start:stop]
+		
+		return self.source.get_points(start, stop)
+	
+	def _extend(self, point: GraphPoint):
+		"""
+		Extends the section over the next point of its source and updates the statistics in O(1).
+
+		Args:
+			point (GraphPoint): The next point of the source.
+		"""
+		self.stop += 1
+		self._points = None
+		self._assigned.clear()
+		
+		self.statistics.add(point.y, self.stop - self.start - 1)
+	
+	def get_y_values(self) -> Union[list[Union[int, float]], numpy.ndarray]:
+		"""
+		Returns the y-values of the points of the section.
+
+		Returns:
+			Union[list[Union[int, float]], numpy.ndarray]: A list for a list source, a numpy array for a graph source.
+		"""
+		if isinstance(self.source, list):
+			return [point.y for point in self.source[self.start:self.stop]]
+		
+		return self.source.get_y_values(self.start, self.stop)
+	
+	def calculate_average(self):
+		"""Recalculates the average y-value and the rest of the statistics from the points."""
+		self._assigned.clear()
+		self.statistics = RunningStatistics.from_values(self.get_y_values())
+	
+	def detach(self):
+		"""
+		Copies the points of a section that is a view of a graph into a list, which becomes its source.
+
+		The section then no longer changes with the graph, such as when later adds overwrite the slots of a "ring" graph.
+		Does nothing for a list source.
+		"""
+		if isinstance(self.source, list):
+			return
+		
+		self.source = self.source.get_points(self.start, self.stop)
+		self.stop -= self.start
+		self.start = 0
+		self._points = None
+	
+	def add(self, point: GraphPoint):
+		"""
+		Adds a point to the section and updates min, max, average and variance in O(1).
+
+		The point is appended to the list source. If the section is a view of a graph or does not end at the end of its
+		list, its points are first copied into a new list, so the source itself is never changed.
+
+		Args:
+			point (GraphPoint): The point to add.
+		"""
+		if not isinstance(self.source, list) or self.stop != len(self.source):
+			self.source = list(self.points)
+			self.stop -= self.start
+			self.start = 0
+		
+		self.source.append(point)
+		self._extend(point)
+	
+	def get_angle_degree(self) -> Optional[float]:
+		"""
+		Calculates the angle of the section.
+
+		Returns:
+			Optional[float]: The angle in degrees, or None if the section has less than two points.
+		"""
+		if len(self) >= 2:
+			return calculate_angle_degree(self._first_point, self._get_point(self.stop - 1))
+		else:
+			return None
+	
+	def get_direction(self) -> Optional[str]:
+		"""
+		Determines the direction of the section.
+
+		Returns:
+			Optional[str]: The direction ("increasing", "decreasing", "straight"), or None if the section has less than two points.
+		"""
+		if len(self) >= 2:
+			angle = self.get_angle_degree()
+			if angle is None:
+				return None
+		
+			if angle > self.angle_sensitivity:
+				return "increasing"
+			elif angle < -self.angle_sensitivity:
+				return "decreasing"
+			else:
+				return "straight"
+		else:
+			return None
+	
+	def get_graph_points_after_max(self) -> list[GraphPoint]:
+		"""
+		Returns the points after the maximum y-value point.
+
+		Returns:
+			list[GraphPoint]: The points after the maximum.
+		"""
+		return list(self._get_points(self.max_index, self.stop))
+	
+	def get_graph_points_after_min(self) -> list[GraphPoint]:
+		"""
+		Returns the points after the minimum y-value point.
+
+		Returns:
+			list[GraphPoint]: The points after the minimum.
+		"""
+		return list(self._get_points(self.min_index, self.stop))
+	
+	def remove_point_after_max(self):
+		"""
+		Removes points in the section after the maximum y-value point and recalculates the statistics.
+
+		Only the index range is shrunk, the source is not changed.
+		"""
+		self.stop = self.max_index + 1
+		self._points = None
+		
+		self.calculate_average()
+	
+	def remove_point_after_min(self):
+		"""
+		Removes points in the section after the minimum y-value point and recalculates the statistics.
+
+		Only the index range is shrunk, the source is not changed.
+		"""
+		self.stop = self.min_index + 1
+		self._points = None
+		
+		self.calculate_average()
+
+
+class ThresholdSensitivity:
+	"""
+	Represents the sensitivity for threshold-based comparisons.
+
+	Attributes:
+		threshold_sensitivity (float): The sensitivity value.
+		type_ (Literal["absolute", "relative"]): The type of sensitivity ("absolute" or "relative").
+
+	:Usage:
+		sensitivity = ThresholdSensitivity(0.1, "relative")
+		sensitivity.get_increase_sensitive_point(1)
+		1.1
+	"""
+	
+	def __init__(
+			self,
+			threshold_sensitivity: float = 0.0,
+			type_: Literal["absolute", "relative"] = "absolute"
+	):
+		"""
+		Initializes a new ThresholdSensitivity object.
+
+		Args:
+			threshold_sensitivity (float): The sensitivity value. Defaults to 0.0.
+			type_ (Literal["absolute", "relative"]): The type of sensitivity. Defaults to "absolute".
+
+		Raises:
+			ValueError: If type_ is not "absolute" or "relative".
+		"""
+		if type_ not in ["absolute", "relative"]:
+			raise ValueError('type_ must be "absolute" or "relative"')
+		
+		self.threshold_sensitivity = threshold_sensitivity
+		self.type_ = type_
+	
+	def get_decrease_sensitive_point(self, point: Union[GraphPoint, int, float]) -> float:
+		"""
+		Calculates the decreased sensitive point based on the sensitivity type.
+
+		Args:
+			point (Union[GraphPoint, int, float]): The point or value to adjust.
+
+		Returns:
+			float: The decreased sensitive point.
+		"""
+		decrease_sensitive_point = point.y if isinstance(point, GraphPoint) else point
+		
+		if self.type_ == "absolute":
+			return decrease_sensitive_point - self.threshold_sensitivity
+		
+		if self.type_ == "relative":
+			return decrease_sensitive_point * (1 - self.threshold_sensitivity)
+	
+	def get_increase_sensitive_point(self, point: Union[GraphPoint, int, float]) -> float:
+		"""
+		Calculates the increased sensitive point based on the sensitivity type.
+
+		Args:
+			point (Union[GraphPoint, int, float]): The point or value to adjust.
+
+		Returns:
+			float: The increased sensitive point.
+		"""
+		increase_sensitive_point = point.y if isinstance(point, GraphPoint) else point
+		
+		if self.type_ == "absolute":
+			return increase_sensitive_point + self.threshold_sensitivity
+		
+		if self.type_ == "relative":
+			return increase_sensitive_point * (1 + self.threshold_sensitivity)
+
+
+def get_graph_point(point: Union[GraphPoint, tuple[Union[int, float], Union[int, float]]]) -> GraphPoint:
+	"""
+	Converts an (x, y) pair to a GraphPoint.
+
+	Args:
+		point (Union[GraphPoint, tuple[Union[int, float], Union[int, float]]]): A GraphPoint or an (x, y) pair.
+
+	Returns:
+		GraphPoint: The point itself if it is already a GraphPoint, otherwise a new GraphPoint.
+	"""
+	if isinstance(point, GraphPoint):
+		return point
+	
+	x, y = point
+	
+	return GraphPoint(
+			x.item() if isinstance(x, numpy.generic) else x,
+			y.item() if isinstance(y, numpy.generic) else y
+	)
+
+
+class SegmentationStatistics:
+	"""
+	Collects statistics of a segmentation run, for finding out what drives the cost of get_sections.
+
+	Pass an instance to Graph.get_sections, SectionDetector or get_sections_async. Without one nothing is measured and
+	the segmentation only pays for one None check per point.
+
+	Every point after the first point of a section is handled by the branch of the direction the open section had
+	before the point: "increasing", "decreasing", "straight", or "none" for a section of a single point.
+
+	Attributes:
+		num_points (int): The number of processed points.
+		num_sections (int): The number of emitted sections.
+		branch_counts (dict[str, int]): The number of points handled by every direction branch.
+		branch_seconds (dict[str, float]): The time spent in every direction branch, in seconds.
+		carry_over_sizes (Counter[int]): How many times every number of points was carried over from a finished section into the next one.
+
+	:Usage:
+		statistics = SegmentationStatistics()
+		graph = Graph([GraphPoint(0, 1), GraphPoint(1, 2), GraphPoint(2, 3), GraphPoint(3, 2)])
+		list(graph.get_sections(statistics=statistics))
+		(statistics.num_points, statistics.num_sections, statistics.branch_counts["increasing"], statistics.max_carry_over)
+		(4, 2, 2, 1)
+	"""
+	
+	def __init__(self):
+		"""Initializes empty segmentation statistics."""
+		self.num_points = 0
+		self.num_sections = 0
+		self.branch_counts = {direction: 0 for direction in ["none", "increasing", "decreasing", "straight"]}
+		self.branch_seconds = {direction: 0.0 for direction in ["none", "increasing", "decreasing", "straight"]}
+		self.carry_over_sizes: Counter[int] = Counter()
+	
+	@property
+	def max_carry_over(self) -> int:
+		"""
+		Returns the largest number of points carried over into a new section.
+
+		Returns:
+			int: The largest carry-over, or 0 if no section was finished by a break.
+		"""
+		return max(self.carry_over_sizes, default=0)
+	
+	@property
+	def mean_carry_over(self) -> Optional[float]:
+		"""
+		Returns the average number of points carried over into a new section.
+
+		Returns:
+			Optional[float]: The average carry-over, or None if no section was finished by a break.
+		"""
+		num_breaks = sum(self.carry_over_sizes.values())
+		
+		if num_breaks == 0:
+			return None
+		
+		return sum(size * count for size, count in self.carry_over_sizes.items()) / num_breaks
+	
+	def record_point(
+			self,
+			direction: Optional[str],
+			seconds: float,
+			carry_over: Optional[int] = None
+	):
+		"""
+		Records a point handled by a direction branch.
+
+		Args:
+			direction (Optional[str]): The direction of the open section before the point, None for a single-point section.
+			seconds (float): The time spent on the point.
+			carry_over (Optional[int]): The number of points carried over into the next section if the point finished a section. Defaults to None.
+		"""
+		branch = "none" if direction is None else direction
+		
+		self.num_points += 1
+		self.branch_counts[branch] += 1
+		self.branch_seconds[branch] += seconds
+		
+		if carry_over is not None:
+			self.num_sections += 1
+			self.carry_over_sizes[carry_over] += 1
+	
+	def to_dict(self) -> dict[str, Any]:
+		"""
+		Returns the statistics as a dictionary of plain values, e.g. for logging as JSON.
+
+		Returns:
+			dict[str, Any]: The statistics.
+		"""
+		return {
+			"num_points": self.num_points,
+			"num_sections": self.num_sections,
+			"branch_counts": dict(self.branch_counts),
+			"branch_seconds": dict(self.branch_seconds),
+			"carry_over_sizes": dict(self.carry_over_sizes),
+			"max_carry_over": self.max_carry_over,
+			"mean_carry_over": self.mean_carry_over,
+		}
+
+
+class SectionDetector:
+	"""
+	Splits a stream of points into sections with the same rules as Graph.get_sections.
+
+	Points are pushed one at a time or in batches, and every section is returned as soon as it is final.
+	Only the open section is kept in memory, so unbounded feeds can be segmented with constant memory.
+
+	Attributes:
+		threshold_sensitivity (ThresholdSensitivity): The threshold sensitivity.
+		angle_sensitivity (float): The angle sensitivity.
+		section (Optional[GraphSection]): The open section, or None if no points were pushed since the last flush.
+		statistics (Optional[SegmentationStatistics]): The statistics the detector records into, or None.
+
+	:Usage:
+		section_detector = SectionDetector()
+		section_detector.push([(0, 1), (1, 2), (2, 3)])
+		[]
+
+		section_detector.push(GraphPoint(3, 2))
+		[[(0, 1), (1, 2), (2, 3)] (num_points: 3, min: (0,1), max: (2,3), average: 2.0000, direction: increasing)]
+
+		section_detector.flush()
+		[[(2, 3), (3, 2)] (num_points: 2, min: (3,2), max: (2,3), average: 2.5000, direction: decreasing)]
+	"""
+	
+	def __init__(
+			self,
+			threshold_sensitivity: ThresholdSensitivity = ThresholdSensitivity(),
+			angle_sensitivity: float = 0.0,
+			statistics: Optional[SegmentationStatistics] = None
+	):
+		"""
+		Initializes a new SectionDetector.
+
+		Args:
+			threshold_sensitivity (ThresholdSensitivity): The threshold sensitivity. Defaults to ThresholdSensitivity().
+			angle_sensitivity (float): The angle sensitivity. Defaults to 0.0.
+			statistics (Optional[SegmentationStatistics]): The statistics to record into. Defaults to None.
+
+		Raises:
+			ValueError: If angle_sensitivity is less than 0.0.
+		"""
+		if angle_sensitivity < 0.0:
+			raise ValueError("angle_sensitivity must be >= 0.0")
+		
+		self.threshold_sensitivity = threshold_sensitivity
+		self.angle_sensitivity = angle_sensitivity
+		self.section: Optional[GraphSection] = None
+		self.statistics = statistics
+	
+	def _start_section(self, section: GraphSection):
+		"""
+		Opens a section at the first point after a flush.
+
+		Args:
+			section (GraphSection): The single-point section.
+		"""
+		self.section = section
+		
+		if self.statistics is not None:
+			self.statistics.num_points += 1
+	
+	def _push_point(self, point: GraphPoint) -> Optional[GraphSection]:
+		"""
+		Pushes a single point into the open section.
+
+		Args:
+			point (GraphPoint): The point to push.
+
+		Returns:
+			Optional[GraphSection]: The section finished by the point, or None if the open section continues.
+		"""
+		if self.section is None:
+			self._start_section(GraphSection([point], self.angle_sensitivity))
+			return None
+		
+		if self.statistics is not None:
+			return self._push_next_point_recorded(point)
+		
+		return self._push_next_point(point)
+	
+	def _push_next_point(self, point: GraphPoint) -> Optional[GraphSection]:
+		"""
+		Pushes the point that follows the open section.
+
+		For a section that is a view of a graph, point must be the next point of the graph: the section then grows over it,
+		and the section that starts after a break is a view of the same graph. Sections over a list get the point appended
+		and a new list for the section that starts after a break, so finished points are not kept alive by the open section.
+
+		Args:
+			point (GraphPoint): The point to push.
+
+		Returns:
+			Optional[GraphSection]: The section finished by the point, or None if the open section continues.
+		"""
+		direction = self.section.get_direction()
+		
+		if direction is None:
+			new_section_start = None
+		elif direction == "increasing":
+			if point.y > self.threshold_sensitivity.get_decrease_sensitive_point(self.section.max):
+				new_section_start = None
+			else:
+				new_section_start = self.section.max_index
+		elif direction == "decreasing":
+			if point.y < self.threshold_sensitivity.get_increase_sensitive_point(self.section.min):
+				new_section_start = None
+			else:
+				new_section_start = self.section.min_index
+		else:
+			statistics = self.section.statistics
+		
+			if continues_straight_section(
+					point.y,
+					statistics.mean,
+					get_mean_tolerance(statistics.count, max(abs(statistics.min_value), abs(statistics.max_value))),
+					self.section.get_y_values,
+					self.threshold_sensitivity.threshold_sensitivity,
+					self.threshold_sensitivity.type_
+			):
+				new_section_start = None
+			else:
+				new_section_start = self.section.stop
+		
+		if new_section_start is None:
+			if isinstance(self.section.source, list):
+				self.section.add(point)
+			else:
+				self.section._extend(point)
+		
+			return None
+		
+		finished_section = self.section
+		
+		if isinstance(finished_section.source, list):
+			self.section = GraphSection(
+					finished_section.source[new_section_start:finished_section.stop] + [point],
+					self.angle_sensitivity
+			)
+		else:
+			self.section = GraphSection.from_graph(
+					finished_section.source,
+					new_section_start,
+					finished_section.stop + 1,
+					self.angle_sensitivity
+			)
+		
+		if direction == "increasing":
+			finished_section.remove_point_after_max()
+		elif direction == "decreasing":
+			finished_section.remove_point_after_min()
+		
+		return finished_section
+	
+	def _push_next_point_recorded(self, point: GraphPoint) -> Optional[GraphSection]:
+		"""
+		Pushes the point that follows the open section and records it into the statistics.
+
+		Kept apart from _push_next_point, so segmentation without statistics does not pay for the timing.
+
+		Args:
+			point (GraphPoint): The point to push.
+
+		Returns:
+			Optional[GraphSection]: The section finished by the point, or None if the open section continues.
+		"""
+		direction = self.section.get_direction()
+		start_time = time.perf_counter()
+		finished_section = self._push_next_point(point)
+		
+		self.statistics.record_point(
+				direction,
+				time.perf_counter() - start_time,
+				None if finished_section is None else len(self.section) - 1
+		)
+		
+		return finished_section
+	
+	def flush(self) -> list[GraphSection]:
+		"""
+		Finishes the open section.
+
+		Returns:
+			list[GraphSection]: The open section, or an empty list if there is none.
+		"""
+		if self.section is None:
+			return []
+		
+		finished_section = self.section
+		self.section = None
+		
+		if self.statistics is not None:
+			self.statistics.num_sections += 1
+		
+		return [finished_section]
+	
+	def push(
+			self,
+			points: Union[
+				GraphPoint,
+				tuple[Union[int, float], Union[int, float]],
+				Iterable[Union[GraphPoint, tuple[Union[int, float], Union[int, float]]]]
+			]
+	) -> list[GraphSection]:
+		"""
+		Pushes a point or a batch of points.
+
+		Args:
+			points (Union[GraphPoint, tuple[Union[int, float], Union[int, float]], Iterable[Union[GraphPoint, tuple[Union[int, float], Union[int, float]]]]]): A GraphPoint, an (x, y) pair, or an iterable of them.
+
+		Returns:
+			list[GraphSection]: The sections finished by the pushed points, in order.
+		"""
+		if isinstance(points, GraphPoint) or (
+				isinstance(points, tuple)
+				and len(points) == 2
+				and not isinstance(points[0], (GraphPoint, tuple))
+		):
+			points = [points]
+		
+		finished_sections = []
+		
+		for point in points:
+			finished_section = self._push_point(get_graph_point(point))
+		
+			if finished_section is not None:
+				finished_sections.append(finished_section)
+		
+		return finished_sections
+
+
+async def get_sections_async(
+		points: AsyncIterable[Union[GraphPoint, tuple[Union[int, float], Union[int, float]]]],
+		threshold_sensitivity: ThresholdSensitivity = ThresholdSensitivity(),
+		angle_sensitivity: float = 0.0,
+		batch_size: int = 1024,
+		statistics: Optional[SegmentationStatistics] = None
+) -> AsyncGenerator[GraphSection, None]:
+	"""
+	Divides an asynchronous stream of points into sections with the same rules as Graph.get_sections.
+
+	Every section is yielded as soon as it is final and only the open section is kept in memory.
+	After every batch_size consumed points control is handed back to the event loop, so a source that
+	always has points ready (e.g. a queue with a backlog) cannot starve other coroutines.
+
+	Args:
+		points (AsyncIterable[Union[GraphPoint, tuple[Union[int, float], Union[int, float]]]]): The source of GraphPoints or (x, y) pairs. Items may also be lists of them.
+		threshold_sensitivity (ThresholdSensitivity): The threshold sensitivity. Defaults to ThresholdSensitivity().
+		angle_sensitivity (float): The angle sensitivity. Defaults to 0.0.
+		batch_size (int): The number of points processed between two yields to the event loop. Defaults to 1024.
+		statistics (Optional[SegmentationStatistics]): The statistics to record into. Defaults to None.
+
+	Returns:
+		AsyncGenerator[GraphSection, None]: An asynchronous generator of GraphSections.
+
+	Raises:
+		ValueError: If batch_size is less than 1 or angle_sensitivity is less than 0.0.
+
+	:Usage:
+		async for section in get_sections_async(websocket_points(), ThresholdSensitivity(0.5)):
+			print(section)
+	"""
+	if batch_size < 1:
+		raise ValueError("batch_size must be >= 1")
+	
+	section_detector = SectionDetector(threshold_sensitivity, angle_sensitivity, statistics)
+	num_points_in_batch = 0
+	
+	async for point in points:
+		for section in section_detector.push(point):
+			yield section
+	
+		num_points_in_batch += 1 if isinstance(point, (GraphPoint, tuple)) else len(point)
+	
+		if num_points_in_batch >= batch_size:
+			num_points_in_batch = 0
+			await asyncio.sleep(0)
+	
+	for section in section_detector.flush():
+		yield section
+
+
+def iterate_detached_sections(sections: Iterable[GraphSection]) -> Generator[GraphSection, Any, None]:
+	"""
+	Detaches every section from its graph (see GraphSection.detach) before yielding it.
+
+	Args:
+		sections (Iterable[GraphSection]): The sections.
+
+	Returns:
+		Generator[GraphSection, Any, None]: A generator of the detached sections.
+	"""
+	for section in sections:
+		section.detach()
+		yield section
+
+
+def get_columnar_array(values: Any) -> numpy.ndarray:
+	"""
+	Converts coordinate values to a numpy array suitable for columnar storage.
+
+	Integers outside the int64 range are not rejected: like any other non-integer values, they make the array float64
+	(and are rounded to the nearest float).
+
+	Args:
+		values (Any): The coordinate values (list, tuple, numpy array, etc.).
+
+	Returns:
+		numpy.ndarray: An int64 array for integer values within the int64 range, a float64 array otherwise.
+	"""
+	array = numpy.asarray(values)
+	
+	if array.dtype == numpy.uint64 and array.size and array.max() > numpy.iinfo(numpy.int64).max:
+		return array.astype(numpy.float64)
+	
+	return array.astype(numpy.int64 if array.dtype.kind in "biu" else numpy.float64, copy=False)
+
+
+def open_memmap_array(file: Union[str, pathlib.Path], dtype: Any = numpy.float64, offset: int = 0) -> numpy.memmap:
+	"""
+	Maps an .npy file or a raw binary file into memory in read-only mode and advises the kernel that it will be read sequentially.
+
+	Args:
+		file (Union[str, pathlib.Path]): The file. Files with the ".npy" suffix are opened with numpy.load, other files are raw binary data.
+		dtype (Any): The dtype of raw binary files. Defaults to numpy.float64.
+		offset (int): The number of bytes to skip at the start of raw binary files. Defaults to 0.
+
+	Returns:
+		numpy.memmap: The mapped array.
+	"""
+	file = pathlib.Path(file)
+	
+	if file.suffix == ".npy":
+		values = numpy.load(file, mmap_mode="r")
+	else:
+		values = numpy.memmap(file, dtype=dtype, mode="r", offset=offset)
+	
+	memory_map = getattr(values, "_mmap", None)
+	
+	if memory_map is not None and hasattr(mmap, "MADV_SEQUENTIAL"):
+		memory_map.madvise(mmap.MADV_SEQUENTIAL)
+	
+	return values
+
+
+def get_value_dtype(value: Union[int, float]) -> numpy.dtype:
+	"""
+	Returns the numpy dtype used to store a coordinate value in columnar storage.
+
+	Integers outside the int64 range get float64, as in get_columnar_array, so appending them converts the storage to
+	float64 instead of overflowing.
+
+	Args:
+		value (Union[int, float]): The coordinate value.
+
+	Returns:
+		numpy.dtype: int64 for integer values within the int64 range, float64 otherwise.
+	"""
+	if isinstance(value, (int, numpy.integer)) and INT64_MIN <= value <= INT64_MAX:
+		return numpy.dtype(numpy.int64)
+	
+	return numpy.dtype(numpy.float64)
+
+
+def get_search_indexes(
+		values: numpy.ndarray,
+		keys: Any,
+		side: Literal["left", "right"] = "left"
+) -> numpy.ndarray:
+	"""
+	Finds the indexes where keys would be inserted into sorted values, as numpy.searchsorted.
+
+	numpy.searchsorted casts the values to a common dtype, so searching integer values for a float key would convert
+	the whole array on every call. Float keys are therefore rounded to integers first (up for "left", down for "right",
+	which finds the same indexes), and keys outside the range of the integer dtype are mapped to 0 or len(values).
+
+	Args:
+		values (numpy.ndarray): The non-decreasing values.
+		keys (Any): A key or an array of keys.
+		side (Literal["left", "right"]): "left" returns the index of the first value >= key, "right" the index of the first value > key. Defaults to "left".
+
+	Returns:
+		numpy.ndarray: The int64 insertion indexes, with the shape of keys.
+
+	:Usage:
+		get_search_indexes(numpy.array([0, 1, 2, 2, 3]), [1.5, 2.0, 9.5])
+		array([2, 2, 5])
+
+		get_search_indexes(numpy.array([0, 1, 2, 2, 3]), [1.5, 2.0, 9.5], side="right")
+		array([2, 4, 5])
+	"""
+	keys = numpy.asarray(keys)
+	
+	if values.dtype.kind not in "iu" or keys.dtype.kind != "f":
+		return numpy.searchsorted(values, keys, side=side).astype(numpy.int64)
+	
+	integer_info = numpy.iinfo(values.dtype)
+	keys = numpy.ceil(keys) if side == "left" else numpy.floor(keys)
+	is_below = keys < integer_info.min
+	is_above = (keys >= float(integer_info.max) + 1) | numpy.isnan(keys)
+	
+	indexes = numpy.searchsorted(values, numpy.where(is_below | is_above, 0, keys).astype(values.dtype), side=side)
+	
+	return numpy.where(is_below, 0, numpy.where(is_above, len(values), indexes)).astype(numpy.int64)
+
+
+class Graph:
+	"""
+	Represents a graph composed of GraphPoints.
+
+	The graph can keep its points in one of four storages:
+
+	- **"points"** keeps a Python list of GraphPoint objects (default).
+	- **"columnar"** keeps x and y values in growable contiguous numpy arrays (amortized-doubling append) and materializes GraphPoint objects only on demand, which greatly reduces memory usage for long series. The arrays are int64 while all values are integers within the int64 range, float64 otherwise (larger integers are rounded to the nearest float).
+	- **"memmap"** reads x and y values from files mapped with numpy.memmap (see Graph.from_memmap). The graph is read-only and its statistics are computed over the mapping in blocks, so series larger than RAM can be used.
+	- **"ring"** keeps only the last capacity points in circular numpy buffers, for live telemetry. Every value is written twice, at its slot and at slot + capacity, so the points in order are always a contiguous view of the buffer. Adding a point to a full graph evicts the oldest one in O(1), and the statistics (a SlidingStatistics) are updated without rescanning.
+
+	Points can also be filtered on ingestion by a compression policy (see graph_2D_compression), which stores only the
+	points a process historian would keep, such as DeadbandCompression or SwingingDoorCompression. The policy may hold
+	back the last added point until it knows whether it is needed, so call flush_compression once a series is complete.
+
+	Attributes:
+		storage (Literal["points", "columnar", "memmap", "ring"]): The storage used for the points.
+		capacity (Optional[int]): The maximum number of points of "ring" storage, None for other storages.
+		compression (Optional[CompressionPolicy]): The policy that decides which added points are stored, None to store all points.
+		points (list[GraphPoint]): The list of points in the graph. Materialized on every access for "columnar", "memmap" and "ring" storages. Assigning it replaces the stored points.
+		statistics (RunningStatistics): The running statistics of the y-values.
+		is_x_sorted (bool): Whether the x-values are non-decreasing, which value_at, nearest and slice_x require.
+		min (Optional[GraphPoint]): The point with the minimum y-value. An assigned point is kept until the statistics change.
+		max (Optional[GraphPoint]): The point with the maximum y-value. An assigned point is kept until the statistics change.
+		average (Optional[float]): The average y-value of all points. An assigned value is kept until the statistics change.
+		variance (Optional[float]): The population variance of the y-values.
+		std (Optional[float]): The population standard deviation of the y-values.
+
+	:Usage:
+		graph = Graph([GraphPoint(1, 1), GraphPoint(2, 2)])
+		(num_points: 2, min: 1, max: 2, average: 1.5000)
+
+		graph = Graph([GraphPoint(1, 1), GraphPoint(2, 2)], storage="columnar")
+		(num_points: 2, min: 1, max: 2, average: 1.5000)
+
+		graph = Graph(storage="ring", capacity=2)
+		graph.add(GraphPoint(1, 1))
+		graph.add(GraphPoint(2, 2))
+		graph.add(GraphPoint(3, 3))
+		(num_points: 2, min: 2, max: 3, average: 2.5000)
+	"""
+	
+	__array_ufunc__ = None
+	
+	def __init__(
+			self,
+			points: Optional[list[GraphPoint]] = None,
+			storage: Literal["points", "columnar", "ring"] = "points",
+			sort_x: bool = False,
+			capacity: Optional[int] = None,
+			compression: Optional[CompressionPolicy] = None
+	):
+		"""
+		Initializes a new Graph object.
+
+		Args:
+			points (Optional[list[GraphPoint]]): Initial list of points. Only the last capacity points are kept for "ring" storage. Defaults to None.
+			storage (Literal["points", "columnar", "ring"]): The storage used for the points. Defaults to "points".
+			sort_x (bool): Whether to sort the points by x (stable, the given list is not changed). Defaults to False.
+			capacity (Optional[int]): The maximum number of points of "ring" storage. Defaults to None.
+			compression (Optional[CompressionPolicy]): The policy that decides which points are stored. It is reset and the initial points are filtered by it, the last of them may be held until flush_compression. Defaults to None.
+
+		Raises:
+			ValueError: If storage is not "points", "columnar" or "ring", or capacity is missing or less than 1 for "ring" storage, or given for another storage.
+		"""
+		if storage not in ["points", "columnar", "ring"]:
+			raise ValueError('storage must be "points", "columnar" or "ring"')
+		
+		if storage == "ring" and (capacity is None or capacity < 1):
+			raise ValueError('capacity must be >= 1 for "ring" storage')
+		
+		if storage != "ring" and capacity is not None:
+			raise ValueError('capacity is only supported by "ring" storage')
+		
+		if sort_x and points:
+			points = sorted(points, key=operator.attrgetter("x"))
+		
+		if compression is not None:
+			points = points or []
+			indexes = compression.compress([point.x for point in points], [point.y for point in points])
+			points = [points[index] for index in indexes.tolist()]
+		
+		self.storage = storage
+		self.capacity = capacity
+		self.compression = compression
+		
+		self._set_points(points)
+		
+		if sort_x:
+			self._is_x_sorted = True
+	
+	def _reset(self):
+		"""
+		Empties the storage and resets the assigned statistics, the range index, the aggregation pyramid, the x-order and the set of section views.
+		"""
+		self._views: weakref.WeakSet[GraphSection] = weakref.WeakSet()
+		self._is_x_sorted: Optional[bool] = None
+		self._assigned: dict[str, Any] = {}
+		
+		self._points: list[GraphPoint] = []
+		self._x_values = numpy.empty(0 if self.capacity is None else 2 * self.capacity, dtype=numpy.int64)
+		self._y_values = numpy.empty(0 if self.capacity is None else 2 * self.capacity, dtype=numpy.int64)
+		self._num_points = 0
+		self._ring_start = 0
+		
+		self._range_index: Optional[Union[SegmentTree, SparseTable]] = None
+		self._range_index_type: type[Union[SegmentTree, SparseTable]] = SparseTable
+		self._range_index_offset = 0
+		self._pyramid: Optional[AggregationPyramid] = None
+		self._pyramid_offset = 0
+	
+	def _set_points(self, points: Optional[list[GraphPoint]]):
+		"""
+		Replaces the stored points, recalculates the statistics and resets the range index, the aggregation pyramid and the x-order.
+
+		Args:
+			points (Optional[list[GraphPoint]]): The points. The list itself is kept by "points" storage, only the last capacity points are kept by "ring" storage.
+		"""
+		self._reset()
+		
+		if self.storage == "points":
+			self._points = points if points is not None else []
+		elif points and self.storage == "columnar":
+			self._x_values = get_columnar_array([point.x for point in points])
+			self._y_values = get_columnar_array([point.y for point in points])
+			self._num_points = len(points)
+		elif points:
+			self._num_points = min(len(points), self.capacity)
+		
+			for attribute, values in [("_x_values", [point.x for point in points]), ("_y_values", [point.y for point in points])]:
+				values = get_columnar_array(values[-self.capacity:])
+				buffer = numpy.empty(2 * self.capacity, dtype=values.dtype)
+				buffer[:self._num_points] = values
+				buffer[self.capacity:self.capacity + self._num_points] = values
+				setattr(self, attribute, buffer)
+		
+		self.calculate_average()
+	
+	@classmethod
+	def _from_storage(
+			cls,
+			storage: Literal["points", "columnar", "memmap"],
+			points: Optional[list[GraphPoint]] = None,
+			x_values: Optional[numpy.ndarray] = None,
+			y_values: Optional[numpy.ndarray] = None,
+			is_x_sorted: Optional[bool] = None,
+			compression: Optional[CompressionPolicy] = None
+	) -> "Graph":
+		"""
+		Creates a graph from prepared storage, which is kept as is.
+
+		Args:
+			storage (Literal["points", "columnar", "memmap"]): The storage used for the points.
+			points (Optional[list[GraphPoint]]): The list of points of "points" storage. Defaults to None.
+			x_values (Optional[numpy.ndarray]): The x-values of "columnar" and "memmap" storages. Defaults to None.
+			y_values (Optional[numpy.ndarray]): The y-values of "columnar" and "memmap" storages. Defaults to None.
+			is_x_sorted (Optional[bool]): Whether the x-values are known to be sorted, None if unknown. Defaults to None.
+			compression (Optional[CompressionPolicy]): The policy that decides which added points are stored. Defaults to None.
+
+		Returns:
+			Graph: The graph.
+		"""
+		graph = cls.__new__(cls)
+		graph.storage = storage
+		graph.capacity = None
+		graph.compression = compression
+		
+		graph._reset()
+		
+		if storage == "points":
+			graph._points = points if points is not None else []
+		else:
+			graph._x_values = x_values
+			graph._y_values = y_values
+			graph._num_points = len(y_values)
+		
+		graph._is_x_sorted = is_x_sorted
+		graph.calculate_average()
+		
+		return graph
+	
+	@classmethod
+	def from_memmap(
+			cls,
+			file: Union[str, pathlib.Path],
+			y_file: Optional[Union[str, pathlib.Path]] = None,
+			dtype: Any = numpy.float64,
+			offset: int = 0
+	) -> "Graph":
+		"""
+		Creates a read-only graph backed by x/y data on disk, mapped with numpy.memmap.
+
+		Files with the ".npy" suffix are opened with numpy.load(mmap_mode="r"), any other file is treated as raw
+		binary data of the given dtype. With a single file the points are stored as interleaved (x, y) pairs
+		(a raw file or an .npy array of shape (num_points, 2)); with y_file the x-values and y-values are read from separate files.
+
+		The statistics are computed in one sequential pass over the mapping in blocks of STREAMING_BLOCK_SIZE points, and the
+		kernel is advised that the mapping is read sequentially, so the OS readahead does the I/O work. Only the pages that
+		are being read need to be resident, whatever the size of the file. Sections are read the same way: get_sections
+		walks the points in blocks, and the "vectorized" engine only touches the slices around the open section.
+
+		Args:
+			file (Union[str, pathlib.Path]): The file with interleaved (x, y) pairs, or with the x-values if y_file is given.
+			y_file (Optional[Union[str, pathlib.Path]]): The file with the y-values. Defaults to None.
+			dtype (Any): The dtype of raw binary files. Defaults to numpy.float64.
+			offset (int): The number of bytes to skip at the start of raw binary files. Defaults to 0.
+
+		Returns:
+			Graph: A graph with "memmap" storage.
+
+		Raises:
+			ValueError: If the x-values and the y-values have different lengths or the data has an unexpected shape.
+		"""
+		if y_file is None:
+			values = open_memmap_array(file, dtype, offset)
+		
+			if values.ndim == 1 and len(values) % 2 == 0:
+				values = values.reshape(-1, 2)
+		
+			if values.ndim != 2 or values.shape[1] != 2:
+				raise ValueError("interleaved data must have shape (num_points, 2)")
+		
+			x_values, y_values = values[:, 0], values[:, 1]
+		else:
+			x_values, y_values = open_memmap_array(file, dtype, offset), open_memmap_array(y_file, dtype, offset)
+		
+		if x_values.ndim != 1 or y_values.ndim != 1:
+			raise ValueError("x-values and y-values must be one-dimensional")
+		
+		if len(x_values) != len(y_values):
+			raise ValueError("x-values and y-values must have the same length")
+		
+		return cls._from_storage("memmap", x_values=x_values, y_values=y_values)
+	
+	@classmethod
+	def from_arrays(
+			cls,
+			x_values: Any,
+			y_values: Any,
+			storage: Literal["points", "columnar"] = "columnar",
+			sort_x: bool = False,
+			compression: Optional[CompressionPolicy] = None
+	) -> "Graph":
+		"""
+		Creates a graph from x-values and y-values without creating a GraphPoint per point.
+
+		The values are converted to int64 or float64 arrays (numpy arrays of these dtypes are used without copying) and the
+		statistics are computed in one vectorized pass.
+
+		Args:
+			x_values (Any): The x-values (list, tuple, numpy array, pandas Series, etc.).
+			y_values (Any): The y-values.
+			storage (Literal["points", "columnar"]): The storage used for the points. Defaults to "columnar".
+			sort_x (bool): Whether to sort the points by x (stable). Defaults to False.
+			compression (Optional[CompressionPolicy]): The policy that decides which points are stored (see Graph). Defaults to None.
+
+		Returns:
+			Graph: The graph.
+
+		Raises:
+			ValueError: If the values are not one-dimensional, have different lengths or storage is invalid.
+
+		:Usage:
+			graph = Graph.from_arrays([0, 1, 2], [3.0, 1.0, 2.0])
+			(num_points: 3, min: 1.0000, max: 3.0000, average: 2.0000)
+		"""
+		if storage not in ["points", "columnar"]:
+			raise ValueError('storage must be "points" or "columnar"')
+		
+		x_values = get_columnar_array(x_values)
+		y_values = get_columnar_array(y_values)
+		
+		if x_values.ndim != 1 or y_values.ndim != 1:
+			raise ValueError("x-values and y-values must be one-dimensional")
+		
+		if len(x_values) != len(y_values):
+			raise ValueError("x-values and y-values must have the same length")
+		
+		if sort_x:
+			order = numpy.argsort(x_values, kind="stable")
+			x_values, y_values = x_values[order], y_values[order]
+		
+		if compression is not None:
+			indexes = compression.compress(x_values, y_values)
+			x_values, y_values = x_values[indexes], y_values[indexes]
+		
+		if storage == "points":
+			points = [GraphPoint(x, y) for x, y in zip(x_values.tolist(), y_values.tolist())]
+		
+			return cls._from_storage(storage, points=points, is_x_sorted=True if sort_x else None, compression=compression)
+		
+		return cls._from_storage(storage, x_values=x_values, y_values=y_values, is_x_sorted=True if sort_x else None, compression=compression)
+	
+	@classmethod
+	def from_dataframe(
+			cls,
+			dataframe: DataFrame,
+			x: Optional[Hashable] = None,
+			y: Optional[Hashable] = None,
+			storage: Literal["points", "columnar"] = "columnar",
+			sort_x: bool = False,
+			compression: Optional[CompressionPolicy] = None
+	) -> "Graph":
+		"""
+		Creates a graph from two columns of a DataFrame without creating a GraphPoint per row.
+
+		Args:
+			dataframe (DataFrame): The DataFrame.
+			x (Optional[Hashable]): The column with the x-values. Defaults to None, which uses the index.
+			y (Optional[Hashable]): The column with the y-values. Defaults to None, which uses the only column other than x.
+			storage (Literal["points", "columnar"]): The storage used for the points. Defaults to "columnar".
+			sort_x (bool): Whether to sort the points by x (stable). Defaults to False.
+			compression (Optional[CompressionPolicy]): The policy that decides which points are stored (see Graph). Defaults to None.
+
+		Returns:
+			Graph: The graph.
+
+		Raises:
+			ValueError: If y is None and the DataFrame does not have exactly one column other than x, or storage is invalid.
+
+		:Usage:
+			dataframe = DataFrame({"time": [0, 1, 2], "value": [3.0, 1.0, 2.0]})
+			graph = Graph.from_dataframe(dataframe, x="time", y="value")
+			(num_points: 3, min: 1.0000, max: 3.0000, average: 2.0000)
+		"""
+		if y is None:
+			columns = [column for column in dataframe.columns if column != x]
+		
+			if len(columns) != 1:
+				raise ValueError("y must be given for a DataFrame with more than one value column")
+		
+			y = columns[0]
+		
+		x_values = dataframe.index if x is None else dataframe[x]
+		
+		return cls.from_arrays(x_values.to_numpy(), dataframe[y].to_numpy(), storage, sort_x, compression)
+	
+	@classmethod
+	def from_iterable(
+			cls,
+			points: Iterable[Union[GraphPoint, tuple[Union[int, float], Union[int, float]]]],
+			storage: Literal["points", "columnar"] = "columnar",
+			sort_x: bool = False,
+			compression: Optional[CompressionPolicy] = None
+	) -> "Graph":
+		"""
+		Creates a graph from (x, y) pairs or GraphPoints and computes the statistics in one vectorized pass.
+
+		Args:
+			points (Iterable[Union[GraphPoint, tuple[Union[int, float], Union[int, float]]]]): The (x, y) pairs or GraphPoints.
+			storage (Literal["points", "columnar"]): The storage used for the points. Defaults to "columnar".
+			sort_x (bool): Whether to sort the points by x (stable). Defaults to False.
+			compression (Optional[CompressionPolicy]): The policy that decides which points are stored (see Graph). Defaults to None.
+
+		Returns:
+			Graph: The graph.
+
+		Raises:
+			ValueError: If storage is invalid.
+
+		:Usage:
+			graph = Graph.from_iterable([(0, 3), (1, 1), (2, 2)])
+			(num_points: 3, min: (1, 1), max: (0, 3), average: 2.0000)
+		"""
+		points = list(points)
+		
+		if not points:
+			return cls(storage=storage, compression=compression)
+		
+		x_values, y_values = zip(*points)
+		
+		return cls.from_arrays(x_values, y_values, storage, sort_x, compression)
+	
+	def __len__(self) -> int:
+		"""
+		Returns the number of points in the graph.
+
+		Returns:
+			int: The number of points.
+		"""
+		if self.storage == "points":
+			return len(self._points)
+		
+		return self._num_points
+	
+	def __str__(self) -> str:
+		"""
+		Returns a string representation of the graph.
+
+		Returns:
+			str: The string representation.
+		"""
+		min_ = self.min
+		max_ = self.max
+		
+		min_string = f"{min_.y:.4f}" if min_ and isinstance(min_.y, float) else str(min_)
+		max_string = f"{max_.y:.4f}" if max_ and isinstance(max_.y, float) else str(max_)
+		average_string = (
+				f"{self.average:.4f}"
 				if self.average
 				and isinstance(self.average, float)
 				else str(self.average)
 		)
 		
-		return f"(num_points: {len(self.points)}, min: {min_string}, max: {max_string}, average: {average_string})"
+		return f"(num_points: {len(self)}, min: {min_string}, max: {max_string}, average: {average_string})"
+	
+	def __repr__(self) -> str:
+		"""
+		Returns a string representation of the graph.
+
+		Returns:
+			str: The string representation.
+		"""
+		return self.__str__()
+	
+	def __add__(self, other: Union["Graph", int, float]) -> "Graph":
+		"""
+		Adds the as-of aligned y-values of another graph, or a number, to the y-values (see Graph.combine).
+
+		Args:
+			other (Union[Graph, int, float]): The other graph or the number.
+
+		Returns:
+			Graph: The sums.
+		"""
+		return self._operate(other, "add")
+	
+	def __radd__(self, other: Union[int, float]) -> "Graph":
+		"""
+		Adds the y-values to a number (see Graph.combine).
+
+		Args:
+			other (Union[int, float]): The number.
+
+		Returns:
+			Graph: The sums.
+		"""
+		return self._operate(other, "add", reflected=True)
+	
+	def __sub__(self, other: Union["Graph", int, float]) -> "Graph":
+		"""
+		Subtracts the as-of aligned y-values of another graph, or a number, from the y-values (see Graph.combine).
+
+		Args:
+			other (Union[Graph, int, float]): The other graph or the number.
+
+		Returns:
+			Graph: The differences.
+		"""
+		return self._operate(other, "subtract")
+	
+	def __rsub__(self, other: Union[int, float]) -> "Graph":
+		"""
+		Subtracts the y-values from a number (see Graph.combine).
+
+		Args:
+			other (Union[int, float]): The number.
+
+		Returns:
+			Graph: The differences.
+		"""
+		return self._operate(other, "subtract", reflected=True)
+	
+	def __mul__(self, other: Union["Graph", int, float]) -> "Graph":
+		"""
+		Multiplies the y-values by the as-of aligned y-values of another graph, or by a number (see Graph.combine).
+
+		Args:
+			other (Union[Graph, int, float]): The other graph or the number.
+
+		Returns:
+			Graph: The products.
+		"""
+		return self._operate(other, "multiply")
+	
+	def __rmul__(self, other: Union[int, float]) -> "Graph":
+		"""
+		Multiplies a number by the y-values (see Graph.combine).
+
+		Args:
+			other (Union[int, float]): The number.
+
+		Returns:
+			Graph: The products.
+		"""
+		return self._operate(other, "multiply", reflected=True)
+	
+	def __truediv__(self, other: Union["Graph", int, float]) -> "Graph":
+		"""
+		Divides the y-values by the as-of aligned y-values of another graph, or by a number (see Graph.combine).
+
+		Args:
+			other (Union[Graph, int, float]): The other graph or the number.
+
+		Returns:
+			Graph: The quotients.
+		"""
+		return self._operate(other, "divide")
+	
+	def __rtruediv__(self, other: Union[int, float]) -> "Graph":
+		"""
+		Divides a number by the y-values (see Graph.combine).
+
+		Args:
+			other (Union[int, float]): The number.
+
+		Returns:
+			Graph: The quotients.
+		"""
+		return self._operate(other, "divide", reflected=True)
+	
+	@property
+	def average(self) -> Optional[float]:
+		"""
+		Returns the average y-value of all points.
+
+		Returns:
+			Optional[float]: The average y-value, or None if the graph is empty.
+		"""
+		if "average" in self._assigned:
+			return self._assigned["average"]
+		
+		return self.statistics.mean
+	
+	@average.setter
+	def average(self, average: Optional[float]):
+		"""
+		Overrides the average y-value until the statistics change (add, calculate_average or assigning points).
+
+		Args:
+			average (Optional[float]): The average y-value.
+		"""
+		self._assigned["average"] = average
+	
+	@property
+	def max(self) -> Optional[GraphPoint]:
+		"""
+		Returns the point with the maximum y-value.
+
+		Returns:
+			Optional[GraphPoint]: The point with the maximum y-value, or None if the graph is empty.
+		"""
+		if "max" in self._assigned:
+			return self._assigned["max"]
+		
+		return self.get_point(self.statistics.max_index) if self.statistics.max_index is not None else None
+	
+	@max.setter
+	def max(self, max_: Optional[GraphPoint]):
+		"""
+		Overrides the point with the maximum y-value until the statistics change (add, calculate_average or assigning points).
+
+		Args:
+			max_ (Optional[GraphPoint]): The point with the maximum y-value.
+		"""
+		self._assigned["max"] = max_
+	
+	@property
+	def min(self) -> Optional[GraphPoint]:
+		"""
+		Returns the point with the minimum y-value.
+
+		Returns:
+			Optional[GraphPoint]: The point with the minimum y-value, or None if the graph is empty.
+		"""
+		if "min" in self._assigned:
+			return self._assigned["min"]
+		
+		return self.get_point(self.statistics.min_index) if self.statistics.min_index is not None else None
+	
+	@min.setter
+	def min(self, min_: Optional[GraphPoint]):
+		"""
+		Overrides the point with the minimum y-value until the statistics change (add, calculate_average or assigning points).
+
+		Args:
+			min_ (Optional[GraphPoint]): The point with the minimum y-value.
+		"""
+		self._assigned["min"] = min_
+	
+	@property
+	def is_x_sorted(self) -> bool:
+		"""
+		Returns whether the x-values are non-decreasing.
+
+		The check runs once over the x-values in blocks of STREAMING_BLOCK_SIZE points; after that add keeps the flag up to date in O(1).
+
+		Returns:
+			bool: True if the x-values are non-decreasing.
+		"""
+		if self._is_x_sorted is None:
+			x_values = self.get_x_values()
+		
+			self._is_x_sorted = all(
+					bool(numpy.all(block[1:] >= block[:-1]))
+					for block in (
+						x_values[start:start + STREAMING_BLOCK_SIZE + 1]
+						for start in range(0, max(len(x_values) - 1, 0), STREAMING_BLOCK_SIZE)
+					)
+			)
+		
+		return self._is_x_sorted
+	
+	@property
+	def points(self) -> list[GraphPoint]:
+		"""
+		Returns the points of the graph.
+
+		For "columnar" and "memmap" storages the points are materialized on every access.
+
+		Returns:
+			list[GraphPoint]: The list of points.
+		"""
+		if self.storage == "points":
+			return self._points
+		
+		return self.get_points()
+	
+	@points.setter
+	def points(self, points: list[GraphPoint]):
+		"""
+		Replaces the points of the graph, keeping its storage.
+
+		The points are stored as given, without the compression policy. The statistics are recalculated. Sections that are
+		views of the graph are detached first (see GraphSection.detach), so they keep the points they had.
+
+		Args:
+			points (list[GraphPoint]): The points. The list itself is kept by "points" storage, only the last capacity points are kept by "ring" storage.
+
+		Raises:
+			ValueError: If the graph has "memmap" storage.
+		"""
+		if self.storage == "memmap":
+			raise ValueError("memory-mapped graphs are read-only")
+		
+		for section in list(self._views):
+			section.detach()
+		
+		self._set_points(points)
+	
+	def get_point(self, index: int) -> GraphPoint:
+		"""
+		Returns the point at the given index.
+
+		Args:
+			index (int): The index of the point. Negative indexes are counted from the end.
+
+		Returns:
+			GraphPoint: The point at the given index.
+
+		Raises:
+			IndexError: If the index is out of range.
+		"""
+		if self.storage == "points":
+			return self._points[index]
+		
+		if index < 0:
+			index += self._num_points
+		
+		if not 0 <= index < self._num_points:
+			raise IndexError("graph index out of range")
+		
+		return GraphPoint(
+				self._x_values[self._ring_start + index].item(),
+				self._y_values[self._ring_start + index].item()
+		)
+	
+	def get_points(self, start: int = 0, stop: Optional[int] = None) -> list[GraphPoint]:
+		"""
+		Returns the points in the given index range.
+
+		For "columnar" and "memmap" storages only the requested points are materialized.
+
+		Args:
+			start (int): The index of the first point. Defaults to 0.
+			stop (Optional[int]): The index after the last point. Defaults to the number of points.
+
+		Returns:
+			list[GraphPoint]: The points in the range.
+		"""
+		if self.storage == "points":
+			return self._points[start:stop]
+		
+		return [
+			GraphPoint(x, y)
+			for x, y in zip(self.get_x_values(start, stop).tolist(), self.get_y_values(start, stop).tolist())
+		]
+	
+	def get_x_values(self, start: int = 0, stop: Optional[int] = None) -> numpy.ndarray:
+		"""
+		Returns the x-values of the graph in the given index range as a numpy array.
+
+		For "columnar" and "memmap" storages the returned array is a view of the graph storage and must not be modified.
+
+		Args:
+			start (int): The index of the first point. Defaults to 0.
+			stop (Optional[int]): The index after the last point. Defaults to the number of points.
+
+		Returns:
+			numpy.ndarray: The x-values.
+		"""
+		if self.storage == "points":
+			return numpy.array([point.x for point in self._points[start:stop]])
+		
+		return self._x_values[self._ring_start:self._ring_start + self._num_points][start:stop]
+	
+	def get_y_values(self, start: int = 0, stop: Optional[int] = None) -> numpy.ndarray:
+		"""
+		Returns the y-values of the graph in the given index range as a numpy array.
+
+		For "columnar" and "memmap" storages the returned array is a view of the graph storage and must not be modified.
+
+		Args:
+			start (int): The index of the first point. Defaults to 0.
+			stop (Optional[int]): The index after the last point. Defaults to the number of points.
+
+		Returns:
+			numpy.ndarray: The y-values.
+		"""
+		if self.storage == "points":
+			return numpy.array([point.y for point in self._points[start:stop]])
+		
+		return self._y_values[self._ring_start:self._ring_start + self._num_points][start:stop]
+	
+	@property
+	def std(self) -> Optional[float]:
+		"""
+		Returns the population standard deviation of the y-values.
+
+		Returns:
+			Optional[float]: The standard deviation, or None if the graph is empty.
+		"""
+		return self.statistics.std
+	
+	@property
+	def variance(self) -> Optional[float]:
+		"""
+		Returns the population variance of the y-values.
+
+		Returns:
+			Optional[float]: The variance, or None if the graph is empty.
+		"""
+		return self.statistics.variance
+	
+	def calculate_average(self):
+		"""
+		Recalculates the average y-value and the rest of the statistics from the points.
+
+		The y-values are read in blocks of STREAMING_BLOCK_SIZE points, so a memory-mapped graph is never loaded at once.
+		"""
+		y_values = self.get_y_values()
+		
+		self._assigned.clear()
+		self.statistics = SlidingStatistics() if self.storage == "ring" else RunningStatistics()
+		
+		for start in range(0, len(y_values), STREAMING_BLOCK_SIZE):
+			self.statistics.add_values(y_values[start:start + STREAMING_BLOCK_SIZE])
+	
+	def iterate_points(self, block_size: int = STREAMING_BLOCK_SIZE) -> Generator[GraphPoint, Any, None]:
+		"""
+		Iterates over the points, materializing at most block_size of them at once.
+
+		Args:
+			block_size (int): The number of points materialized at once. Defaults to STREAMING_BLOCK_SIZE.
+
+		Returns:
+			Generator[GraphPoint, Any, None]: A generator of the points in order.
+		"""
+		if self.storage == "points":
+			yield from self._points
+			return
+		
+		for start in range(0, len(self), block_size):
+			yield from self.get_points(start, start + block_size)
+	
+	def _search_x(
+			self,
+			x: Union[int, float, numpy.ndarray],
+			side: Literal["left", "right"] = "left"
+	) -> Union[int, numpy.ndarray]:
+		"""
+		Finds the index where x would be inserted to keep the x-values sorted.
+
+		The search does not convert the x-values, a float x is rounded for integer x-values (see get_search_indexes). An
+		array of x-values is searched with one numpy.searchsorted call.
+
+		Args:
+			x (Union[int, float, numpy.ndarray]): The x-value or an array of x-values.
+			side (Literal["left", "right"]): "left" returns the index of the first point with x-value >= x, "right" the index of the first point with x-value > x. Defaults to "left".
+
+		Returns:
+			Union[int, numpy.ndarray]: The insertion index, or an int64 array of them for an array of x-values.
+
+		Raises:
+			ValueError: If the x-values are not sorted.
+		"""
+		if not self.is_x_sorted:
+			raise ValueError("x-values must be sorted, create the graph with sort_x=True")
+		
+		if self.storage == "points":
+			search = bisect.bisect_left if side == "left" else bisect.bisect_right
+		
+			if isinstance(x, numpy.ndarray):
+				return numpy.array([search(self._points, key, key=operator.attrgetter("x")) for key in x.tolist()], dtype=numpy.int64)
+		
+			return search(self._points, x, key=operator.attrgetter("x"))
+		
+		indexes = get_search_indexes(self.get_x_values(), x, side)
+		
+		return indexes if isinstance(x, numpy.ndarray) else int(indexes)
+	
+	def get_index_range(self, x_start: Union[int, float], x_stop: Union[int, float]) -> tuple[int, int]:
+		"""
+		Returns the index range of the points with x_start <= x <= x_stop in O(log(n)).
+
+		The range can be passed to get_points, range_stats or GraphSection.from_graph.
+
+		Args:
+			x_start (Union[int, float]): The smallest x-value.
+			x_stop (Union[int, float]): The largest x-value.
+
+		Returns:
+			tuple[int, int]: The index of the first point in the range and the index after the last one.
+
+		Raises:
+			ValueError: If the x-values are not sorted.
+		"""
+		start = self._search_x(x_start, "left")
+		
+		return start, max(start, self._search_x(x_stop, "right"))
+	
+	def nearest(self, x: Union[int, float]) -> Optional[GraphPoint]:
+		"""
+		Returns the point whose x-value is nearest to x in O(log(n)).
+
+		Args:
+			x (Union[int, float]): The x-value.
+
+		Returns:
+			Optional[GraphPoint]: The nearest point (the one with the smaller x-value on ties), or None if the graph is empty.
+
+		Raises:
+			ValueError: If the x-values are not sorted.
+		"""
+		index = self._search_x(x)
+		
+		if index == len(self):
+			return self.get_point(index - 1) if index else None
+		
+		point = self.get_point(index)
+		
+		if index == 0:
+			return point
+		
+		previous_point = self.get_point(index - 1)
+		
+		return previous_point if x - previous_point.x <= point.x - x else point
+	
+	def slice_x(self, x_start: Union[int, float], x_stop: Union[int, float]) -> "Graph":
+		"""
+		Returns a graph of the points with x_start <= x <= x_stop.
+
+		The range is found with a binary search. For "columnar" and "memmap" storages the new graph is backed by views of
+		this graph's arrays, so no values are copied (appending to it copies them first); for "points" storage it shares
+		the GraphPoint objects. A slice of a "memmap" graph is read-only as well. A slice of a "ring" graph has "columnar"
+		storage and copies the values, because later adds overwrite the ring slots.
+
+		Args:
+			x_start (Union[int, float]): The smallest x-value.
+			x_stop (Union[int, float]): The largest x-value.
+
+		Returns:
+			Graph: The graph of the points in the range.
+
+		Raises:
+			ValueError: If the x-values are not sorted.
+
+		:Usage:
+			graph = Graph.from_arrays([0, 1, 2, 3, 4], [5, 3, 4, 1, 2])
+			graph.slice_x(0.5, 3)
+			(num_points: 3, min: (3, 1), max: (2, 4), average: 2.6667)
+		"""
+		start, stop = self.get_index_range(x_start, x_stop)
+		
+		if self.storage == "points":
+			return Graph._from_storage("points", points=self._points[start:stop], is_x_sorted=True)
+		
+		x_values, y_values = self.get_x_values(start, stop), self.get_y_values(start, stop)
+		
+		if self.storage == "ring":
+			x_values, y_values = x_values.copy(), y_values.copy()
+		
+		return Graph._from_storage(
+				"memmap" if self.storage == "memmap" else "columnar",
+				x_values=x_values,
+				y_values=y_values,
+				is_x_sorted=True
+		)
+	
+	def value_at(self, x: Union[int, float], interpolate: bool = False) -> Optional[Union[int, float]]:
+		"""
+		Returns the y-value at x in O(log(n)).
+
+		Args:
+			x (Union[int, float]): The x-value.
+			interpolate (bool): Whether to interpolate linearly between the neighbouring points when no point has x-value x. Defaults to False.
+
+		Returns:
+			Optional[Union[int, float]]: The y-value of the first point with x-value x, the interpolated value, or None if there is no point at x and it cannot be interpolated (interpolate is False or x is out of the x-range).
+
+		Raises:
+			ValueError: If the x-values are not sorted.
+
+		:Usage:
+			graph = Graph.from_arrays([0, 2, 4], [1, 5, 3])
+			graph.value_at(2)
+			5
+
+			graph.value_at(1, interpolate=True)
+			3.0
+		"""
+		index = self._search_x(x)
+		
+		if index < len(self):
+			point = self.get_point(index)
+		
+			if point.x == x:
+				return point.y
+		
+		if not interpolate or index == 0 or index == len(self):
+			return None
+		
+		previous_point = self.get_point(index - 1)
+		
+		return previous_point.y + (point.y - previous_point.y) * (x - previous_point.x) / (point.x - previous_point.x)
+	
+	def _get_aligned_values(
+			self,
+			other: "Graph",
+			method: Literal["asof", "nearest", "interpolate"],
+			tolerance: Optional[Union[int, float]]
+	) -> tuple[numpy.ndarray, numpy.ndarray]:
+		"""
+		Aligns the y-values of another graph to the x-values of this graph (see graph_2D_align.get_aligned_values).
+
+		Args:
+			other (Graph): The other graph.
+			method (Literal["asof", "nearest", "interpolate"]): The alignment method.
+			tolerance (Optional[Union[int, float]]): The maximum distance to the taken point for "asof" and "nearest".
+
+		Returns:
+			tuple[numpy.ndarray, numpy.ndarray]: The indexes of the points of this graph with a defined aligned value, and the aligned values.
+
+		Raises:
+			ValueError: If the x-values of the other graph are not sorted, method is invalid or tolerance is negative.
+		"""
+		if not other.is_x_sorted:
+			raise ValueError("x-values of the other graph must be sorted, create it with sort_x=True")
+		
+		return get_aligned_values(other.get_x_values(), other.get_y_values(), self.get_x_values(), method, tolerance)
+	
+	def align(
+			self,
+			other: "Graph",
+			method: Literal["asof", "nearest", "interpolate"] = "asof",
+			tolerance: Optional[Union[int, float]] = None
+	) -> "Graph":
+		"""
+		Returns the y-values of another graph aligned to the x-values of this graph.
+
+		The alignment runs with numpy.searchsorted over the x/y arrays, without a Python loop over the points, so it is
+		fastest with "columnar" storage. Only the x-values of the other graph must be sorted.
+
+		Args:
+			other (Graph): The graph whose y-values are aligned.
+			method (Literal["asof", "nearest", "interpolate"]): "asof" takes the last point at or before every x-value, "nearest" the nearest point, "interpolate" interpolates linearly. Defaults to "asof".
+			tolerance (Optional[Union[int, float]]): The maximum distance to the taken point for "asof" and "nearest". Defaults to None.
+
+		Returns:
+			Graph: The graph with the x-values of this graph and the aligned y-values. Points without an aligned value (before the other graph, outside its x-range for "interpolate", or beyond tolerance) are dropped.
+
+		Raises:
+			ValueError: If the x-values of the other graph are not sorted, method is invalid or tolerance is negative.
+
+		:Usage:
+			graph = Graph.from_arrays([0, 5, 10, 15], [1, 1, 1, 1])
+			other_graph = Graph.from_arrays([2, 8, 12], [10, 20, 30])
+			graph.align(other_graph).points
+			[(5, 10), (10, 20), (15, 30)]
+
+			graph.align(other_graph, method="interpolate").points
+			[(5, 15.0), (10, 25.0)]
+		"""
+		indexes, values = self._get_aligned_values(other, method, tolerance)
+		
+		return Graph.from_arrays(
+				self.get_x_values()[indexes],
+				values,
+				"points" if self.storage == "points" else "columnar"
+		)
+	
+	def _operate(
+			self,
+			other: Any,
+			operation: Literal["add", "subtract", "multiply", "divide"],
+			reflected: bool = False
+	) -> "Graph":
+		"""
+		Implements the arithmetic operators with Graph.combine for another graph or a real number.
+
+		Args:
+			other (Any): The other operand.
+			operation (Literal["add", "subtract", "multiply", "divide"]): The arithmetic operation.
+			reflected (bool): Whether other is the left operand. Defaults to False.
+
+		Returns:
+			Graph: The combined graph, or NotImplemented if other is neither a Graph nor a real number.
+		"""
+		if not isinstance(other, (Graph, numbers.Real)):
+			return NotImplemented
+		
+		return self.combine(other, operation, reflected=reflected)
 	
-	def __repr__(self) -> str:
+	def combine(
+			self,
+			other: Union["Graph", int, float],
+			operation: Literal["add", "subtract", "multiply", "divide"],
+			method: Literal["asof", "nearest", "interpolate"] = "asof",
+			tolerance: Optional[Union[int, float]] = None,
+			reflected: bool = False
+	) -> "Graph":
 		"""
-		Returns a string representation of the graph.
+		Combines the y-values with the aligned y-values of another graph, or with a number, point by point with numpy.
+
+		The result keeps the x-values of this graph. A point is dropped if the other graph has no aligned value for it
+		(see Graph.align) or if it would divide by zero. The operators +, -, * and / call combine with "asof" alignment
+		for another graph or a real number and raise TypeError for other operands, numpy arrays included.
+
+		Args:
+			other (Union[Graph, int, float]): The other graph or the number.
+			operation (Literal["add", "subtract", "multiply", "divide"]): The arithmetic operation.
+			method (Literal["asof", "nearest", "interpolate"]): The alignment method for another graph. Defaults to "asof".
+			tolerance (Optional[Union[int, float]]): The maximum distance to the taken point for "asof" and "nearest". Defaults to None.
+			reflected (bool): Whether other is the left operand. Defaults to False.
 
 		Returns:
-			str: The string representation.
+			Graph: The combined graph.
+
+		Raises:
+			ValueError: If operation or method is invalid, tolerance is negative, or the x-values of the other graph are not sorted.
+
+		:Usage:
+			first_graph = Graph.from_arrays([0, 1, 2, 3], [2, 4, 6, 8])
+			second_graph = Graph.from_arrays([1, 3], [2, 0])
+			(first_graph / second_graph).points
+			[(1, 2.0), (2, 3.0)]
+
+			(1 + first_graph).points
+			[(0, 3), (1, 5), (2, 7), (3, 9)]
 		"""
-		return self.__str__()
+		functions = {"add": numpy.add, "subtract": numpy.subtract, "multiply": numpy.multiply, "divide": numpy.true_divide}
+		
+		if operation not in functions:
+			raise ValueError('operation must be "add", "subtract", "multiply" or "divide"')
+		
+		x_values, y_values = self.get_x_values(), self.get_y_values()
+		
+		if isinstance(other, Graph):
+			indexes, other_values = self._get_aligned_values(other, method, tolerance)
+			x_values, y_values = x_values[indexes], y_values[indexes]
+		else:
+			other_values = numpy.asarray(other)
+		
+		left_values, right_values = (other_values, y_values) if reflected else (y_values, other_values)
+		
+		if operation == "divide":
+			is_defined = numpy.broadcast_to(right_values != 0, x_values.shape)
+			x_values = x_values[is_defined]
+			left_values = left_values[is_defined] if numpy.ndim(left_values) else left_values
+			right_values = right_values[is_defined] if numpy.ndim(right_values) else right_values
+		
+		return Graph.from_arrays(
+				x_values,
+				functions[operation](left_values, right_values),
+				"points" if self.storage == "points" else "columnar"
+		)
 	
-	def calculate_average(self):
+	def get_angles(self, start_indexes: Optional[Any] = None, end_indexes: Optional[Any] = None) -> numpy.ndarray:
+		"""
+		Returns the angles between pairs of points in one numpy pass (see graph_2D_vectorized.get_point_angles).
+
+		The angles are the ones calculate_angle_degree returns for every pair, including its edge cases.
+
+		Args:
+			start_indexes (Optional[Any]): The indexes of the start points. Defaults to None (every point but the last).
+			end_indexes (Optional[Any]): The indexes of the end points. Defaults to None (every point after start_indexes).
+
+		Returns:
+			numpy.ndarray: The float64 angles in degrees.
+
+		Raises:
+			ValueError: If start_indexes and end_indexes have different shapes.
+
+		:Usage:
+			graph = Graph([GraphPoint(0, 0), GraphPoint(1, 1), GraphPoint(2, 1)])
+			graph.get_angles()
+			array([45.,  0.])
+
+			graph.get_angles([0], [2])
+			array([26.56505118])
+		"""
+		return get_point_angles(self.get_x_values(), self.get_y_values(), start_indexes, end_indexes)
+	
+	def _append_columnar(self, point: GraphPoint):
+		"""
+		Appends a point to the columnar storage, growing the arrays by doubling when they are full.
+
+		Args:
+			point (GraphPoint): The point to append.
+		"""
+		x_dtype = numpy.promote_types(self._x_values.dtype, get_value_dtype(point.x))
+		y_dtype = numpy.promote_types(self._y_values.dtype, get_value_dtype(point.y))
+		
+		if self._num_points == len(self._x_values) or x_dtype != self._x_values.dtype or y_dtype != self._y_values.dtype:
+			capacity = max(16, 2 * self._num_points) if self._num_points == len(self._x_values) else len(self._x_values)
+		
+			x_values = numpy.empty(capacity, dtype=x_dtype)
+			x_values[:self._num_points] = self._x_values[:self._num_points]
+			y_values = numpy.empty(capacity, dtype=y_dtype)
+			y_values[:self._num_points] = self._y_values[:self._num_points]
+		
+			self._x_values = x_values
+			self._y_values = y_values
+		
+		self._x_values[self._num_points] = point.x
+		self._y_values[self._num_points] = point.y
+		self._num_points += 1
+	
+	def _append_ring(self, point: GraphPoint) -> Optional[Union[int, float]]:
+		"""
+		Appends a point to the ring buffers, overwriting the oldest point if the graph is full.
+
+		Args:
+			point (GraphPoint): The point to append.
+
+		Returns:
+			Optional[Union[int, float]]: The y-value of the evicted point, or None if no point was evicted.
+		"""
+		x_dtype = numpy.promote_types(self._x_values.dtype, get_value_dtype(point.x))
+		y_dtype = numpy.promote_types(self._y_values.dtype, get_value_dtype(point.y))
+		
+		if x_dtype != self._x_values.dtype or y_dtype != self._y_values.dtype:
+			self._x_values = self._x_values.astype(x_dtype)
+			self._y_values = self._y_values.astype(y_dtype)
+		
+		position = (self._ring_start + self._num_points) % self.capacity
+		evicted_y = None
+		
+		if self._num_points == self.capacity:
+			evicted_y = self._y_values[self._ring_start].item()
+			self._ring_start = (self._ring_start + 1) % self.capacity
+		else:
+			self._num_points += 1
+		
+		self._x_values[position] = self._x_values[position + self.capacity] = point.x
+		self._y_values[position] = self._y_values[position + self.capacity] = point.y
+		
+		return evicted_y
+	
+	def _store(self, point: GraphPoint):
 		"""
-		Calculates and updates the average y-value.
+		Stores a point and updates the statistics, the range index and the aggregation pyramid.
+
+		The range index and the pyramid only grow: an eviction from a full "ring" graph moves their offset past the evicted
+		value instead, and they are dropped (to be rebuilt by the next query) once capacity values were evicted, so they
+		hold at most 2 * capacity values and a query after every add costs no rebuild.
+
+		Args:
+			point (GraphPoint): The point to store.
 		"""
-		if self.points:
-			self.average = numpy.mean([point.y for point in self.points]).item()
+		if self._is_x_sorted and len(self):
+			last_x = self._points[-1].x if self.storage == "points" else self.get_x_values()[-1]
+			self._is_x_sorted = bool(point.x >= last_x)
+		
+		evicted_y = None
+		
+		if self.storage == "points":
+			self._points.append(point)
+		elif self.storage == "columnar":
+			self._append_columnar(point)
+		else:
+			evicted_y = self._append_ring(point)
+		
+		if evicted_y is not None:
+			self.statistics.remove_first(evicted_y)
+		
+		self.statistics.add(point.y, len(self) - 1)
+		self._assigned.clear()
+		
+		if evicted_y is not None:
+			self._is_x_sorted = self._is_x_sorted or None
+			self._range_index_offset += 1
+			self._pyramid_offset += 1
+		
+			if self._range_index_offset >= self.capacity:
+				self._range_index = None
+		
+			if self._pyramid_offset >= self.capacity:
+				self._pyramid = None
+		
+		if self._pyramid is not None:
+			self._pyramid.append(point.y)
+		
+		if isinstance(self._range_index, SegmentTree):
+			self._range_index.append(point.y)
+		elif self._range_index is not None:
+			self._range_index = None
+			self._range_index_type = SegmentTree
 	
 	def add(self, point: GraphPoint):
 		"""
-		Adds a point to the graph and updates min, max, and average.
+		Adds a point to the graph and updates min, max, average and variance in O(1).
+
+		For a full "ring" graph the oldest point is evicted first. With a compression policy the point is offered to it
+		instead, and the point the policy decides to store, if any, is added: the offered one or the one held before it.
 
 		Args:
 			point (GraphPoint): The point to add.
+
+		Raises:
+			ValueError: If the graph has "memmap" storage.
 		"""
-		self.points.append(point)
+		if self.storage == "memmap":
+			raise ValueError("memory-mapped graphs are read-only")
 		
-		if self.min is None or point.y < self.min.y:
-			self.min = point
+		if self.compression is not None:
+			stored_point = self.compression.offer(point.x, point.y)
 		
-		if self.max is None or point.y > self.max.y:
-			self.max = point
+			if stored_point is None:
+				return
 		
-		self.calculate_average()
+			point = GraphPoint(*stored_point)
+		
+		self._store(point)
+	
+	def flush_compression(self):
+		"""
+		Adds the last point held back by the compression policy, so that the graph ends at the last added value.
+
+		Adding can continue afterwards. Does nothing without a compression policy or if the last point is already stored.
+
+		:Usage:
+			graph = Graph(storage="columnar", compression=SwingingDoorCompression(0.5))
+
+			for x, y in enumerate([0, 1, 2, 3, 3, 3]):
+				graph.add(GraphPoint(x, y))
+
+			graph.points
+			[(0, 0), (4, 3)]
+
+			graph.flush_compression()
+			graph.points
+			[(0, 0), (4, 3), (5, 3)]
+		"""
+		if self.compression is None:
+			return
+		
+		stored_point = self.compression.flush()
+		
+		if stored_point is not None:
+			self._store(GraphPoint(*stored_point))
+	
+	def range_stats(self, start: int = 0, stop: Optional[int] = None) -> RangeStatistics:
+		"""
+		Returns the count, sum, mean, minimum and maximum of the y-values in an index range.
+
+		The first query builds a range index over the y-values: a SparseTable, which answers in O(1). Once points are added
+		after that, the graph is treated as appendable and the next query builds a SegmentTree instead, which answers in
+		O(log(n)) and is updated in O(log(n)) by every later add. A full "ring" graph keeps using it after evictions and
+		rebuilds it only once every capacity adds.
+
+		Args:
+			start (int): The index of the first point. Defaults to 0.
+			stop (Optional[int]): The index after the last point. Defaults to the number of points.
+
+		Returns:
+			RangeStatistics: The statistics of the range. min_index and max_index are indexes of the graph.
+
+		:Usage:
+			graph = Graph.from_arrays(range(8), [3, 1, 4, 1, 5, 9, 2, 6])
+			statistics = graph.range_stats(2, 6)
+			(statistics.min_value, statistics.max_value, statistics.mean)
+			(1, 9, 4.75)
+		"""
+		if self._range_index is None:
+			self._range_index = self._range_index_type(self.get_y_values())
+			self._range_index_offset = 0
+		
+		start, stop, _ = slice(start, stop).indices(len(self))
+		statistics = self._range_index.query(self._range_index_offset + start, self._range_index_offset + stop)
+		
+		if statistics.count:
+			statistics.min_index -= self._range_index_offset
+			statistics.max_index -= self._range_index_offset
+			statistics.min_value = self.get_point(statistics.min_index).y
+			statistics.max_value = self.get_point(statistics.max_index).y
+		
+		return statistics
+	
+	def aggregate(self, x_start: Union[int, float], x_stop: Union[int, float], buckets: int) -> BucketStatistics:
+		"""
+		Splits an x-range into buckets of equal width and returns the count, sum, min, max and mean of the y-values of every bucket.
+
+		Bucket i holds the points with edges[i] <= x < edges[i + 1], the last bucket also the points at x_stop. The first
+		call builds an AggregationPyramid over the y-values in O(n), which later adds keep up to date (a full "ring" graph
+		rebuilds it once every capacity adds). Every call then takes one vectorized binary search for the bucket edges
+		(rounded for integer x-values, see get_search_indexes) and O(log(n)) numpy operations over the buckets, so zooming
+		costs time in the number of buckets, not in the number of points.
+
+		Args:
+			x_start (Union[int, float]): The start of the first bucket.
+			x_stop (Union[int, float]): The end of the last bucket.
+			buckets (int): The number of buckets.
+
+		Returns:
+			BucketStatistics: The statistics of every bucket, with the x-values of the bucket edges as edges.
+
+		Raises:
+			ValueError: If buckets is less than 1, x_stop is not greater than x_start, or the x-values are not sorted.
+
+		:Usage:
+			graph = Graph.from_arrays(range(8), [3, 1, 4, 1, 5, 9, 2, 6])
+			statistics = graph.aggregate(0, 8, 2)
+			(statistics.count, statistics.max, statistics.mean)
+			(array([4, 4]), array([4., 9.]), array([2.25, 5.5 ]))
+		"""
+		if buckets < 1:
+			raise ValueError("buckets must be >= 1")
+		
+		if not x_stop > x_start:
+			raise ValueError("x_stop must be greater than x_start")
+		
+		edges = numpy.linspace(x_start, x_stop, buckets + 1)
+		bounds = numpy.append(self._search_x(edges[:-1]), self._search_x(x_stop, "right"))
+		
+		if self._pyramid is None:
+			self._pyramid = AggregationPyramid()
+			self._pyramid_offset = 0
+		
+			for start in range(0, len(self), STREAMING_BLOCK_SIZE):
+				self._pyramid.extend(self.get_y_values(start, start + STREAMING_BLOCK_SIZE))
+		
+		return self._pyramid.query(self._pyramid_offset + bounds, edges)
+	
+	def downsample(
+			self,
+			num_points: int,
+			method: Literal["lttb", "minmax", "m4"] = "lttb",
+			output: Literal["graph", "indexes"] = "graph"
+	) -> Union["Graph", numpy.ndarray]:
+		"""
+		Reduces the graph to at most num_points points that preserve its visual shape.
+
+		- **"lttb"** (Largest-Triangle-Three-Buckets) keeps exactly num_points points that follow the shape of the line.
+		- **"minmax"** keeps the minimum and the maximum of num_points // 2 buckets, so no spike is lost.
+		- **"m4"** keeps the first, last, minimum and maximum points of num_points // 4 buckets, which reproduces a line chart with one bucket per pixel column.
+
+		The selection runs with numpy over the x/y arrays, so it is fastest with "columnar" storage.
+
+		Args:
+			num_points (int): The maximum number of points to keep.
+			method (Literal["lttb", "minmax", "m4"]): The downsampling method. Defaults to "lttb".
+			output (Literal["graph", "indexes"]): "graph" returns a new Graph with the kept points, "indexes" returns their sorted int64 indexes. Defaults to "graph".
+
+		Returns:
+			Union[Graph, numpy.ndarray]: The downsampled graph or the indexes of the kept points.
+
+		Raises:
+			ValueError: If method or output is invalid, or num_points is too small for the method.
+
+		:Usage:
+			graph = Graph.from_arrays(range(10), [0, 5, 1, 2, 9, 3, 1, 0, 4, 2])
+			graph.downsample(4, output="indexes")
+			array([0, 4, 6, 9])
+
+			graph.downsample(4, method="minmax").points
+			[(0, 0), (4, 9), (7, 0), (8, 4)]
+		"""
+		if output not in ["graph", "indexes"]:
+			raise ValueError('output must be "graph" or "indexes"')
+		
+		x_values, y_values = self.get_x_values(), self.get_y_values()
+		indexes = get_downsample_indexes(x_values, y_values, num_points, method)
+		
+		if output == "indexes":
+			return indexes
+		
+		return Graph.from_arrays(
+				x_values[indexes],
+				y_values[indexes],
+				"points" if self.storage == "points" else "columnar"
+		)
+	
+	def simplify(self, epsilon: float, output: Literal["graph", "indexes"] = "graph") -> Union["Graph", numpy.ndarray]:
+		"""
+		Simplifies the graph with the Ramer-Douglas-Peucker algorithm (see graph_2D_downsample.get_rdp_indexes).
+
+		Unlike downsample, the number of kept points is not fixed: every dropped point lies within epsilon of the
+		simplified polyline, so flat stretches shrink to their ends and sharp turns are kept. The simplification runs
+		level by level with numpy over the x/y arrays, so it is fastest with "columnar" storage.
+
+		Args:
+			epsilon (float): The maximum distance of a dropped point from the simplified polyline.
+			output (Literal["graph", "indexes"]): "graph" returns a new Graph with the kept points, "indexes" returns their sorted int64 indexes. Defaults to "graph".
+
+		Returns:
+			Union[Graph, numpy.ndarray]: The simplified graph or the indexes of the kept points.
+
+		Raises:
+			ValueError: If output is invalid or epsilon is less than 0.
+
+		:Usage:
+			graph = Graph.from_arrays(range(6), [0, 0.1, 0, 5, 0, 0])
+			graph.simplify(1.0, output="indexes")
+			array([0, 2, 3, 5])
+		"""
+		if output not in ["graph", "indexes"]:
+			raise ValueError('output must be "graph" or "indexes"')
+		
+		x_values, y_values = self.get_x_values(), self.get_y_values()
+		indexes = get_rdp_indexes(x_values, y_values, epsilon)
+		
+		if output == "indexes":
+			return indexes
+		
+		return Graph.from_arrays(
+				x_values[indexes],
+				y_values[indexes],
+				"points" if self.storage == "points" else "columnar"
+		)
+	
+	def find_extrema(
+			self,
+			kind: Literal["maxima", "minima"] = "maxima",
+			height: Optional[float] = None,
+			distance: Optional[int] = None,
+			prominence: Optional[float] = None
+	) -> numpy.ndarray:
+		"""
+		Finds the local maxima or minima of the y-values (see graph_2D_extrema.find_extrema_indexes).
+
+		The extrema are found with numpy over the y-values, without a Python loop over the points, so it is fastest with
+		"columnar" storage. A flat run of equal values counts as one extremum at its middle point.
+
+		Args:
+			kind (Literal["maxima", "minima"]): The kind of extrema. Defaults to "maxima".
+			height (Optional[float]): The minimum y-value of a maximum, or the maximum y-value of a minimum. Defaults to None.
+			distance (Optional[int]): The minimum distance between extrema in points, the more extreme one is kept. Defaults to None.
+			prominence (Optional[float]): The minimum height of a maximum above the higher of its bases (depth of a minimum below the lower one). Defaults to None.
+
+		Returns:
+			numpy.ndarray: The sorted int64 indexes of the extrema.
+
+		Raises:
+			ValueError: If kind is not "maxima" or "minima", or distance is less than 1.
+
+		:Usage:
+			graph = Graph.from_arrays(range(7), [0, 3, 1, 5, 2, 4, 0])
+			graph.find_extrema()
+			array([1, 3, 5])
+
+			graph.find_extrema(prominence=2.5)
+			array([3])
+
+			graph.find_extrema(kind="minima", height=1)
+			array([2])
+		"""
+		return find_extrema_indexes(self.get_y_values(), kind, height, distance, prominence)
+	
+	def rolling(
+			self,
+			window: Union[int, float],
+			by: Literal["count", "x"] = "count",
+			min_points: int = 1
+	) -> RollingStatistics:
+		"""
+		Computes rolling min, max, mean and standard deviation of the y-values over trailing windows.
+
+		The result has one entry per point: entry i covers the window that ends at point i. Minimums and maximums are
+		computed with monotonic deques, means and standard deviations with prefix sums, so the whole pass is O(n) for any window.
+
+		Args:
+			window (Union[int, float]): The number of points in a window ("count"), or its x-span ("x"). An "x" window ending at point i holds the points with x in (x_i - window, x_i].
+			by (Literal["count", "x"]): How window is measured. "x" requires non-decreasing x-values. Defaults to "count".
+			min_points (int): The minimum number of points in a window; entries of smaller windows are NaN. Defaults to 1.
+
+		Returns:
+			RollingStatistics: The count, min, max, mean and std arrays, aligned with the points.
+
+		Raises:
+			ValueError: If window is not positive, by is invalid, or the x-values are not sorted for "x" windows.
+
+		:Usage:
+			graph = Graph.from_arrays([0, 1, 2, 5, 6], [3, 1, 4, 1, 5])
+			graph.rolling(2).max
+			array([3., 3., 4., 4., 5.])
+
+			graph.rolling(2.5, by="x").count
+			array([1, 2, 3, 1, 2])
+		"""
+		return get_rolling_statistics(
+				self.get_y_values(),
+				get_window_starts(self.get_x_values(), window, by),
+				min_points
+		)
 	
 	def get_sections(
 			self,
 			threshold_sensitivity: ThresholdSensitivity = ThresholdSensitivity(),
-			angle_sensitivity: float = 0.0
-	) -> Generator[GraphSection, Any, None]:
+			angle_sensitivity: float = 0.0,
+			engine: Literal["iterative", "vectorized"] = "iterative",
+			output: Literal["sections", "array", "dataframe"] = "sections",
+			statistics: Optional[SegmentationStatistics] = None
+	) -> Union[Generator[GraphSection, Any, None], numpy.ndarray, DataFrame]:
 		"""
 		Divides the graph into sections based on threshold and angle sensitivity.
 
+		The "iterative" engine walks the points one at a time. The "vectorized" engine finds the same section bounds
+		with numpy over the x/y arrays (see graph_2D_vectorized.iterate_section_bounds) and builds a GraphSection only
+		for every finished section, which is much faster for long series, especially with "columnar" storage.
+
+		The sections are views of the graph, except for "ring" storage, where every section is detached (see
+		GraphSection.detach) when it is yielded, because later adds overwrite the ring slots.
+
+		With output "array" no GraphSection is returned: the sections are summarized into one numpy structured array
+		(see graph_2D_vectorized.get_section_summaries) with the fields start, stop, direction (a DIRECTION_* code),
+		min_index, min_value, max_index, max_value, mean and angle. Output "dataframe" wraps that array in a DataFrame.
+
+		Passing statistics records the points, sections, time per direction branch and carry-over sizes of the run into
+		it (see SegmentationStatistics). Only the "iterative" engine has direction branches, so statistics require it.
+
 		Args:
 			threshold_sensitivity (ThresholdSensitivity, optional): The threshold sensitivity. Defaults to ThresholdSensitivity().
 			angle_sensitivity (float, optional): The angle sensitivity. Defaults to 0.0.
+			engine (Literal["iterative", "vectorized"], optional): The segmentation engine. Defaults to "iterative".
+			output (Literal["sections", "array", "dataframe"], optional): The result format. Defaults to "sections".
+			statistics (Optional[SegmentationStatistics], optional): The statistics to record into. Defaults to None.
+
+		Returns:
+		   Union[Generator[GraphSection, Any, None], numpy.ndarray, DataFrame]: A generator of GraphSections, or the section summaries.
+
+		Raises:
+			ValueError: If engine is not "iterative" or "vectorized", output is not "sections", "array" or "dataframe", or statistics are given for the "vectorized" engine.
+
+		:Usage:
+			graph = Graph([GraphPoint(0, 1), GraphPoint(1, 3), GraphPoint(2, 0)])
+			graph.get_sections(output="dataframe")
+			   start  stop  direction  min_index  min_value  max_index  max_value  mean      angle
+			0      0     2          1          0        1.0          1        3.0   2.0  63.434949
+			1      1     3          2          2        0.0          1        3.0   1.5 -71.565051
+		"""
+		if engine not in ["iterative", "vectorized"]:
+			raise ValueError('engine must be "iterative" or "vectorized"')
+		
+		if output not in ["sections", "array", "dataframe"]:
+			raise ValueError('output must be "sections", "array" or "dataframe"')
+		
+		if engine == "vectorized" and angle_sensitivity < 0.0:
+			raise ValueError("angle_sensitivity must be >= 0.0")
+		
+		if engine == "vectorized" and statistics is not None:
+			raise ValueError('statistics are only supported by the "iterative" engine')
+		
+		if output == "sections":
+			if engine == "vectorized":
+				sections = self._get_sections_vectorized(threshold_sensitivity, angle_sensitivity)
+			else:
+				sections = self._get_sections_iterative(threshold_sensitivity, angle_sensitivity, statistics)
+		
+			return sections if self.storage != "ring" else iterate_detached_sections(sections)
+		
+		if engine == "vectorized":
+			bounds = get_section_bounds(
+					self.get_x_values(),
+					self.get_y_values(),
+					threshold_sensitivity.threshold_sensitivity,
+					threshold_sensitivity.type_,
+					angle_sensitivity
+			)
+		else:
+			bounds = numpy.array(
+					[
+						(section.start, section.stop)
+						for section in self._get_sections_iterative(threshold_sensitivity, angle_sensitivity, statistics)
+					],
+					dtype=numpy.int64
+			)
+		
+		summaries = get_section_summaries(self.get_x_values(), self.get_y_values(), bounds, angle_sensitivity)
+		
+		return summaries if output == "array" else DataFrame(summaries)
+	
+	def _get_sections_vectorized(
+			self,
+			threshold_sensitivity: ThresholdSensitivity,
+			angle_sensitivity: float
+	) -> Generator[GraphSection, Any, None]:
+		"""
+		Divides the graph into sections with the vectorized engine.
+
+		Args:
+			threshold_sensitivity (ThresholdSensitivity): The threshold sensitivity.
+			angle_sensitivity (float): The angle sensitivity.
+
+		Returns:
+		   Generator[GraphSection, Any, None]: A generator of GraphSections.
+		"""
+		for start, stop in iterate_section_bounds(
+				self.get_x_values(),
+				self.get_y_values(),
+				threshold_sensitivity.threshold_sensitivity,
+				threshold_sensitivity.type_,
+				angle_sensitivity
+		):
+			yield GraphSection.from_graph(self, start, stop, angle_sensitivity)
+	
+	def _get_sections_iterative(
+			self,
+			threshold_sensitivity: ThresholdSensitivity,
+			angle_sensitivity: float,
+			statistics: Optional[SegmentationStatistics] = None
+	) -> Generator[GraphSection, Any, None]:
+		"""
+		Divides the graph into sections by walking the points one at a time.
+
+		The sections are views of the graph (see GraphSection.from_graph), so no point is copied into them.
+
+		Args:
+			threshold_sensitivity (ThresholdSensitivity): The threshold sensitivity.
+			angle_sensitivity (float): The angle sensitivity.
+			statistics (Optional[SegmentationStatistics]): The statistics to record into. Defaults to None.
 
 		Returns:
 		   Generator[GraphSection, Any, None]: A generator of GraphSections.
 		"""
-		graph_section = None
+		section_detector = SectionDetector(threshold_sensitivity, angle_sensitivity, statistics)
+		push_next_point = (
+				section_detector._push_next_point
+				if statistics is None
+				else section_detector._push_next_point_recorded
+		)
 		
-		for i in range(len(self.points)):
-			if graph_section is None:
-				graph_section = GraphSection([self.points[i]], angle_sensitivity)
+		for index, point in enumerate(self.iterate_points()):
+			if section_detector.section is None:
+				section_detector._start_section(GraphSection.from_graph(self, index, index + 1, angle_sensitivity))
 			else:
-				direction = graph_section.get_direction()
-		
-				if direction is None:
-					graph_section.add(self.points[i])
-				elif direction == "increasing":
-					if self.points[i].y > threshold_sensitivity.get_decrease_sensitive_point(graph_section.max):
-						graph_section.add(self.points[i])
-					else:
-						start_of_new_section = graph_section.get_graph_points_after_max()
-						graph_section.remove_point_after_max()
-		
-						yield graph_section
-		
-						graph_section = GraphSection(start_of_new_section + [self.points[i]], angle_sensitivity)
-				elif direction == "decreasing":
-					if self.points[i].y < threshold_sensitivity.get_increase_sensitive_point(graph_section.min):
-						graph_section.add(self.points[i])
-					else:
-						start_of_new_section = graph_section.get_graph_points_after_min()
-						graph_section.remove_point_after_min()
-		
-						yield graph_section
-		
-						graph_section = GraphSection(start_of_new_section + [self.points[i]], angle_sensitivity)
-				elif direction == "straight":
-					if (
-							self.points[i].y < threshold_sensitivity.get_increase_sensitive_point(graph_section.average)
-							or self.points[i].y > threshold_sensitivity.get_decrease_sensitive_point(graph_section.average)
-					):
-						graph_section.add(self.points[i])
-					else:
-						yield graph_section
-						graph_section = GraphSection([self.points[i]], angle_sensitivity)
-		
-		if graph_section is not None:
-			yield graph_section
+				finished_section = push_next_point(point)
+		
+				if finished_section is not None:
+					yield finished_section
+		
+		yield from section_detector.flush()
\ No newline at end of file
@@ -0,0 +1,97 @@
+import numpy
+from typing import (
+	Any,
+	Literal,
+	Optional,
+	Union
+)
+
+
+def get_aligned_values(
+		x_values: Any,
+		y_values: Any,
+		target_x_values: Any,
+		method: Literal["asof", "nearest", "interpolate"] = "asof",
+		tolerance: Optional[Union[int, float]] = None
+) -> tuple[numpy.ndarray, numpy.ndarray]:
+	"""
+	Aligns a series sorted by x to other x-values with one numpy.searchsorted call and no Python loop over the points.
+
+	- **"asof"** takes the last point with x <= target (the last of equal x-values), as in an as-of join.
+	- **"nearest"** takes the point with the nearest x-value (the one with the smaller x-value on ties, the first of equal x-values).
+	- **"interpolate"** interpolates linearly between the points around the target and takes the first point with x equal to the target, as Graph.value_at(interpolate=True).
+
+	A target is undefined if it is before the first point ("asof"), outside the x-range of the points ("interpolate"),
+	or farther than tolerance from the x-value of the taken point ("asof" and "nearest").
+
+	Args:
+		x_values (Any): The non-decreasing x-values of the series.
+		y_values (Any): The y-values of the series.
+		target_x_values (Any): The x-values to align to, in any order.
+		method (Literal["asof", "nearest", "interpolate"]): The alignment method. Defaults to "asof".
+		tolerance (Optional[Union[int, float]]): The maximum distance to the taken point for "asof" and "nearest", not used by "interpolate". Defaults to None.
+
+	Returns:
+		tuple[numpy.ndarray, numpy.ndarray]: The int64 indexes of the defined targets and the aligned y-values at them.
+
+	Raises:
+		ValueError: If method is invalid or tolerance is negative.
+
+	:Usage:
+		get_aligned_values([0, 10, 20], [1, 2, 3], [-5, 5, 10, 25])
+		(array([1, 2, 3]), array([1, 2, 3]))
+
+		get_aligned_values([0, 10, 20], [1, 2, 3], [-5, 5, 10, 25], method="interpolate")
+		(array([1, 2]), array([1.5, 2. ]))
+	"""
+	if method not in ["asof", "nearest", "interpolate"]:
+		raise ValueError('method must be "asof", "nearest" or "interpolate"')
+	
+	if tolerance is not None and tolerance < 0:
+		raise ValueError("tolerance must be >= 0")
+	
+	x_values, y_values = numpy.asarray(x_values), numpy.asarray(y_values)
+	target_x_values = numpy.asarray(target_x_values)
+	
+	if len(x_values) == 0:
+		return numpy.empty(0, dtype=numpy.int64), y_values[:0]
+	
+	if method == "asof":
+		indexes = numpy.searchsorted(x_values, target_x_values, side="right") - 1
+		target_indexes = numpy.flatnonzero(indexes >= 0)
+		indexes = indexes[target_indexes]
+	else:
+		right_indexes = numpy.searchsorted(x_values, target_x_values, side="left")
+		left_indexes = right_indexes - 1
+		left_x = x_values[numpy.maximum(left_indexes, 0)]
+		right_x = x_values[numpy.minimum(right_indexes, len(x_values) - 1)]
+	
+		if method == "nearest":
+			is_left = (right_indexes == len(x_values)) | (
+					(left_indexes >= 0) & (target_x_values - left_x <= right_x - target_x_values)
+			)
+			target_indexes = numpy.arange(len(target_x_values), dtype=numpy.int64)
+			indexes = numpy.where(is_left, left_indexes, right_indexes)
+		else:
+			is_exact = (right_indexes < len(x_values)) & (right_x == target_x_values)
+			is_inside = (left_indexes >= 0) & (right_indexes < len(x_values))
+			target_indexes = numpy.flatnonzero(is_exact | is_inside)
+	
+			is_exact, left_indexes, right_indexes = is_exact[target_indexes], left_indexes[target_indexes], right_indexes[target_indexes]
+			left_x, right_x = left_x[target_indexes], right_x[target_indexes]
+			left_y, right_y = y_values[numpy.maximum(left_indexes, 0)], y_values[right_indexes]
+	
+			with numpy.errstate(divide="ignore", invalid="ignore"):
+				values = numpy.where(
+						is_exact,
+						right_y,
+						left_y + (right_y - left_y) * (target_x_values[target_indexes] - left_x) / (right_x - left_x)
+				)
+	
+			return target_indexes, values
+	
+	if tolerance is not None:
+		is_near = numpy.abs(target_x_values[target_indexes] - x_values[indexes]) <= tolerance
+		target_indexes, indexes = target_indexes[is_near], indexes[is_near]
+	
+	return target_indexes.astype(numpy.int64), y_values[indexes]
\ No newline at end of file
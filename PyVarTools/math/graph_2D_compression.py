@@ -0,0 +1,285 @@
+import numpy
+from abc import (
+	ABC,
+	abstractmethod
+)
+from typing import (
+	Any,
+	Optional,
+	Union
+)
+
+
+DROP = 0
+STORE_CURRENT = 1
+STORE_PREVIOUS = 2
+
+
+class CompressionPolicy(ABC):
+	"""
+	Decides online which points of a series are stored, as done by process historians.
+
+	Points are offered one at a time. Every offer stores at most one point: the offered one, or the previously offered
+	one when the decision about a point can only be made after seeing the next. The last offered point may therefore be
+	held until flush is called. Subclasses implement _step and _flush.
+
+	Attributes:
+		tolerance (float): The maximum deviation of a dropped point.
+	"""
+	
+	def __init__(self, tolerance: float):
+		"""
+		Initializes a new CompressionPolicy object.
+
+		Args:
+			tolerance (float): The maximum deviation of a dropped point.
+
+		Raises:
+			ValueError: If tolerance is less than 0.
+		"""
+		if tolerance < 0:
+			raise ValueError("tolerance must be >= 0")
+		
+		self.tolerance = tolerance
+		self._last_point: Optional[tuple[Union[int, float], Union[int, float]]] = None
+		
+		self.reset()
+	
+	@abstractmethod
+	def _step(self, x: Union[int, float], y: Union[int, float]) -> int:
+		"""
+		Updates the state with a new point and decides which point is stored.
+
+		Args:
+			x (Union[int, float]): The x-value of the point.
+			y (Union[int, float]): The y-value of the point.
+
+		Returns:
+			int: DROP, STORE_CURRENT or STORE_PREVIOUS.
+		"""
+	
+	@abstractmethod
+	def _flush(self) -> bool:
+		"""
+		Updates the state as if the last offered point was stored.
+
+		Returns:
+			bool: Whether the last offered point still has to be stored.
+		"""
+	
+	def reset(self):
+		"""
+		Forgets all offered points.
+		"""
+		self._last_point = None
+	
+	def offer(
+			self,
+			x: Union[int, float],
+			y: Union[int, float]
+	) -> Optional[tuple[Union[int, float], Union[int, float]]]:
+		"""
+		Offers a new point.
+
+		Args:
+			x (Union[int, float]): The x-value of the point.
+			y (Union[int, float]): The y-value of the point.
+
+		Returns:
+			Optional[tuple[Union[int, float], Union[int, float]]]: The (x, y) pair to store, or None if no point is stored.
+		"""
+		action = self._step(x, y)
+		previous_point, self._last_point = self._last_point, (x, y)
+		
+		if action == STORE_CURRENT:
+			return x, y
+		
+		if action == STORE_PREVIOUS:
+			return previous_point
+		
+		return None
+	
+	def flush(self) -> Optional[tuple[Union[int, float], Union[int, float]]]:
+		"""
+		Returns the last offered point if it has not been stored yet, so that a series ends at its last value.
+
+		Offering can continue afterwards, the flushed point then counts as stored.
+
+		Returns:
+			Optional[tuple[Union[int, float], Union[int, float]]]: The (x, y) pair to store, or None if no point is stored.
+		"""
+		if self._last_point is None or not self._flush():
+			return None
+		
+		return self._last_point
+	
+	def compress(self, x_values: Any, y_values: Any) -> numpy.ndarray:
+		"""
+		Resets the policy, offers all points in order and returns the indexes of the stored ones.
+
+		The last point stays held as after offer, so flush returns it if it still has to be stored.
+
+		Args:
+			x_values (Any): The x-values.
+			y_values (Any): The y-values.
+
+		Returns:
+			numpy.ndarray: The sorted int64 indexes of the stored points.
+		"""
+		self.reset()
+		
+		x_values = numpy.asarray(x_values).tolist()
+		y_values = numpy.asarray(y_values).tolist()
+		indexes = []
+		
+		for index, (x, y) in enumerate(zip(x_values, y_values)):
+			action = self._step(x, y)
+			self._last_point = (x, y)
+		
+			if action == STORE_CURRENT:
+				indexes.append(index)
+			elif action == STORE_PREVIOUS:
+				indexes.append(index - 1)
+		
+		return numpy.array(indexes, dtype=numpy.int64)
+
+
+class DeadbandCompression(CompressionPolicy):
+	"""
+	Stores a point when its y-value differs from the last stored y-value by more than tolerance.
+
+	The first point is always stored, and flush stores the last point if it was dropped.
+
+	Attributes:
+		tolerance (float): The half-width of the deadband around the last stored y-value.
+
+	:Usage:
+		compression = DeadbandCompression(0.5)
+		compression.compress([0, 1, 2, 3, 4], [0.0, 0.2, 0.9, 1.0, 0.3])
+		array([0, 2, 4])
+	"""
+	
+	def reset(self):
+		"""
+		Forgets all offered points.
+		"""
+		super().reset()
+		
+		self._stored_y: Optional[Union[int, float]] = None
+		self._is_held = False
+	
+	def _step(self, x: Union[int, float], y: Union[int, float]) -> int:
+		"""
+		Stores the point if it leaves the deadband, otherwise holds it.
+
+		Args:
+			x (Union[int, float]): The x-value of the point.
+			y (Union[int, float]): The y-value of the point.
+
+		Returns:
+			int: STORE_CURRENT or DROP.
+		"""
+		if self._stored_y is None or abs(y - self._stored_y) > self.tolerance:
+			self._stored_y = y
+			self._is_held = False
+		
+			return STORE_CURRENT
+		
+		self._is_held = True
+		
+		return DROP
+	
+	def _flush(self) -> bool:
+		"""
+		Makes the last offered point the center of the deadband.
+
+		Returns:
+			bool: Whether the last offered point was dropped.
+		"""
+		is_held, self._is_held = self._is_held, False
+		self._stored_y = self._last_point[1]
+		
+		return is_held
+
+
+class SwingingDoorCompression(CompressionPolicy):
+	"""
+	Stores the points chosen by the swinging-door trending (SDT) algorithm.
+
+	Two doors pivot at tolerance above and below the last stored point (the anchor). Every new point closes the upper
+	door to at most the slope towards the point minus tolerance and the lower door to at least the slope towards the
+	point plus tolerance. While the doors stay open there is a line from the anchor within tolerance (vertically) of all
+	points since the anchor, and the points are dropped. When a point closes the doors, the point before it is stored and
+	becomes the new anchor. The first point is always stored, and flush stores the last point if it was not stored.
+
+	The x-values must be strictly increasing.
+
+	Attributes:
+		tolerance (float): The vertical distance of the door pivots from the anchor.
+
+	:Usage:
+		compression = SwingingDoorCompression(0.5)
+		compression.compress([0, 1, 2, 3, 4, 5], [0, 1, 2, 3, 3, 3])
+		array([0, 4])
+	"""
+	
+	def reset(self):
+		"""
+		Forgets all offered points.
+		"""
+		super().reset()
+		
+		self._anchor: Optional[tuple[Union[int, float], Union[int, float]]] = None
+		self._upper_slope = -numpy.inf
+		self._lower_slope = numpy.inf
+	
+	def _step(self, x: Union[int, float], y: Union[int, float]) -> int:
+		"""
+		Closes the doors towards the point, and stores the previous point as the new anchor if they close completely.
+
+		Args:
+			x (Union[int, float]): The x-value of the point.
+			y (Union[int, float]): The y-value of the point.
+
+		Returns:
+			int: STORE_CURRENT for the first point, STORE_PREVIOUS or DROP otherwise.
+
+		Raises:
+			ValueError: If x is not greater than the x-value of the previous point.
+		"""
+		if self._anchor is None:
+			self._anchor = (x, y)
+		
+			return STORE_CURRENT
+		
+		if x <= self._last_point[0]:
+			raise ValueError("swinging door compression requires strictly increasing x-values")
+		
+		anchor_x, anchor_y = self._anchor
+		upper_slope = max(self._upper_slope, (y - anchor_y - self.tolerance) / (x - anchor_x))
+		lower_slope = min(self._lower_slope, (y - anchor_y + self.tolerance) / (x - anchor_x))
+		
+		if upper_slope <= lower_slope:
+			self._upper_slope, self._lower_slope = upper_slope, lower_slope
+		
+			return DROP
+		
+		anchor_x, anchor_y = self._anchor = self._last_point
+		self._upper_slope = (y - anchor_y - self.tolerance) / (x - anchor_x)
+		self._lower_slope = (y - anchor_y + self.tolerance) / (x - anchor_x)
+		
+		return STORE_PREVIOUS
+	
+	def _flush(self) -> bool:
+		"""
+		Makes the last offered point the anchor and opens the doors.
+
+		Returns:
+			bool: Whether the last offered point is not the anchor yet.
+		"""
+		is_held = self._anchor != self._last_point
+		
+		self._anchor = self._last_point
+		self._upper_slope, self._lower_slope = -numpy.inf, numpy.inf
+		
+		return is_held
\ No newline at end of file
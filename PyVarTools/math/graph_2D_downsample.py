@@ -0,0 +1,270 @@
+import numpy
+from typing import Literal
+
+
+def get_bucket_extreme_indexes(
+		values: numpy.ndarray,
+		num_buckets: int
+) -> tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+	"""
+	Splits values into consecutive buckets of equal size and returns the indexes of the extremes of every bucket.
+
+	The values are padded to a whole number of buckets and reshaped, so every extreme is found with one numpy reduction.
+	Only the last bucket may be shorter than the others, and there may be fewer than num_buckets buckets for short inputs.
+
+	Args:
+		values (numpy.ndarray): The values.
+		num_buckets (int): The maximum number of buckets.
+
+	Returns:
+		tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]: The indexes of the first minimum, the first maximum, the first value and the last value of every bucket.
+	"""
+	values = numpy.asarray(values, dtype=numpy.float64)
+	bucket_size = -(-len(values) // num_buckets)
+	num_buckets = -(-len(values) // bucket_size)
+	
+	starts = numpy.arange(num_buckets, dtype=numpy.int64) * bucket_size
+	stops = numpy.minimum(starts + bucket_size, len(values))
+	
+	padded_values = numpy.full(num_buckets * bucket_size, numpy.inf)
+	padded_values[:len(values)] = values
+	min_indexes = starts + numpy.argmin(padded_values.reshape(num_buckets, bucket_size), axis=1)
+	
+	padded_values[len(values):] = -numpy.inf
+	max_indexes = starts + numpy.argmax(padded_values.reshape(num_buckets, bucket_size), axis=1)
+	
+	return min_indexes, max_indexes, starts, stops - 1
+
+
+def get_minmax_indexes(y_values: numpy.ndarray, num_points: int) -> numpy.ndarray:
+	"""
+	Selects the indexes of at most num_points points by min-max decimation.
+
+	The points are split into num_points // 2 buckets and the minimum and the maximum of every bucket are kept.
+
+	Args:
+		y_values (numpy.ndarray): The y-values.
+		num_points (int): The maximum number of selected points.
+
+	Returns:
+		numpy.ndarray: The sorted int64 indexes of the selected points.
+
+	Raises:
+		ValueError: If num_points is less than 2.
+	"""
+	if num_points < 2:
+		raise ValueError('num_points must be >= 2 for "minmax"')
+	
+	if num_points >= len(y_values):
+		return numpy.arange(len(y_values), dtype=numpy.int64)
+	
+	min_indexes, max_indexes, _, _ = get_bucket_extreme_indexes(y_values, num_points // 2)
+	
+	return numpy.unique(numpy.concatenate([min_indexes, max_indexes]))
+
+
+def get_m4_indexes(y_values: numpy.ndarray, num_points: int) -> numpy.ndarray:
+	"""
+	Selects the indexes of at most num_points points by M4 aggregation.
+
+	The points are split into num_points // 4 buckets and the first, last, minimum and maximum points of every bucket are
+	kept, which reproduces a line chart with one bucket per pixel column exactly.
+
+	Args:
+		y_values (numpy.ndarray): The y-values.
+		num_points (int): The maximum number of selected points.
+
+	Returns:
+		numpy.ndarray: The sorted int64 indexes of the selected points.
+
+	Raises:
+		ValueError: If num_points is less than 4.
+	"""
+	if num_points < 4:
+		raise ValueError('num_points must be >= 4 for "m4"')
+	
+	if num_points >= len(y_values):
+		return numpy.arange(len(y_values), dtype=numpy.int64)
+	
+	return numpy.unique(numpy.concatenate(get_bucket_extreme_indexes(y_values, num_points // 4)))
+
+
+def get_lttb_indexes(x_values: numpy.ndarray, y_values: numpy.ndarray, num_points: int) -> numpy.ndarray:
+	"""
+	Selects the indexes of num_points points with the Largest-Triangle-Three-Buckets algorithm.
+
+	The first and the last points are always kept and the rest are split into num_points - 2 buckets by index. From every
+	bucket the point is kept that forms the largest triangle with the point kept from the previous bucket and the average
+	point of the next bucket. Bucket averages come from prefix sums; the buckets are visited in order because each
+	choice depends on the previous one, but every bucket is processed with numpy.
+
+	Args:
+		x_values (numpy.ndarray): The x-values.
+		y_values (numpy.ndarray): The y-values.
+		num_points (int): The number of selected points.
+
+	Returns:
+		numpy.ndarray: The sorted int64 indexes of the selected points.
+
+	Raises:
+		ValueError: If num_points is less than 3.
+	"""
+	if num_points < 3:
+		raise ValueError('num_points must be >= 3 for "lttb"')
+	
+	num_values = len(y_values)
+	
+	if num_points >= num_values:
+		return numpy.arange(num_values, dtype=numpy.int64)
+	
+	x_values = numpy.asarray(x_values, dtype=numpy.float64)
+	y_values = numpy.asarray(y_values, dtype=numpy.float64)
+	
+	edges = numpy.linspace(1, num_values - 1, num_points - 1).astype(numpy.int64)
+	x_sums = numpy.concatenate([[0.0], numpy.cumsum(x_values)])
+	y_sums = numpy.concatenate([[0.0], numpy.cumsum(y_values)])
+	bucket_sizes = edges[1:] - edges[:-1]
+	
+	next_x_values = numpy.append(((x_sums[edges[1:]] - x_sums[edges[:-1]]) / bucket_sizes)[1:], x_values[-1]).tolist()
+	next_y_values = numpy.append(((y_sums[edges[1:]] - y_sums[edges[:-1]]) / bucket_sizes)[1:], y_values[-1]).tolist()
+	
+	indexes = numpy.empty(num_points, dtype=numpy.int64)
+	indexes[0], indexes[-1] = 0, num_values - 1
+	
+	selected_index = 0
+	edges = edges.tolist()
+	
+	for bucket in range(num_points - 2):
+		start, stop = edges[bucket], edges[bucket + 1]
+		selected_x, selected_y = x_values[selected_index], y_values[selected_index]
+	
+		areas = numpy.abs(
+				(selected_x - next_x_values[bucket]) * (y_values[start:stop] - selected_y)
+				- (selected_x - x_values[start:stop]) * (next_y_values[bucket] - selected_y)
+		)
+		selected_index = start + int(numpy.argmax(areas))
+		indexes[bucket + 1] = selected_index
+	
+	return indexes
+
+
+def get_rdp_indexes(x_values: numpy.ndarray, y_values: numpy.ndarray, epsilon: float) -> numpy.ndarray:
+	"""
+	Selects the indexes of the points kept by the Ramer-Douglas-Peucker simplification.
+
+	A segment between two kept points keeps its interior point farthest from the line through them (the first one on
+	ties) if that distance is greater than epsilon, and is split there; otherwise all its interior points are dropped.
+	Instead of recursing, all open segments of one split level are processed together: their distances are computed in
+	one numpy pass and reduced per segment with numpy.ufunc.reduceat, so there is no recursion limit and no Python loop
+	over the segments. Within a segment the distances are compared as cross products, which differ from the distances
+	only by the length of the segment, so the division is done once per segment.
+
+	Args:
+		x_values (numpy.ndarray): The x-values.
+		y_values (numpy.ndarray): The y-values.
+		epsilon (float): The maximum distance of a dropped point from the simplified polyline.
+
+	Returns:
+		numpy.ndarray: The sorted int64 indexes of the kept points. The first and the last points are always kept.
+
+	Raises:
+		ValueError: If epsilon is less than 0.
+
+	:Usage:
+		get_rdp_indexes(numpy.arange(6), numpy.array([0, 0.1, 0, 5, 0, 0]), 1.0)
+		array([0, 2, 3, 5])
+	"""
+	if epsilon < 0:
+		raise ValueError("epsilon must be >= 0")
+	
+	num_values = len(y_values)
+	
+	if num_values <= 2:
+		return numpy.arange(num_values, dtype=numpy.int64)
+	
+	x_values = numpy.asarray(x_values, dtype=numpy.float64)
+	y_values = numpy.asarray(y_values, dtype=numpy.float64)
+	
+	is_kept = numpy.zeros(num_values, dtype=bool)
+	is_kept[[0, -1]] = True
+	
+	starts = numpy.array([0], dtype=numpy.int64)
+	stops = numpy.array([num_values - 1], dtype=numpy.int64)
+	
+	while len(starts):
+		order = numpy.argsort(starts)
+		starts, stops = starts[order], stops[order]
+	
+		lengths = stops - starts - 1
+		offsets = numpy.concatenate([[0], numpy.cumsum(lengths)[:-1]])
+		segment_ids = numpy.repeat(numpy.arange(len(starts)), lengths)
+		indexes = numpy.arange(offsets[-1] + lengths[-1]) - offsets[segment_ids] + starts[segment_ids] + 1
+	
+		start_x, start_y = x_values[starts], y_values[starts]
+		delta_x, delta_y = x_values[stops] - start_x, y_values[stops] - start_y
+		norms = numpy.hypot(delta_x, delta_y)
+	
+		point_x, point_y = x_values[indexes], y_values[indexes]
+		cross_products = numpy.abs(
+				delta_y[segment_ids] * (point_x - start_x[segment_ids])
+				- delta_x[segment_ids] * (point_y - start_y[segment_ids])
+		)
+	
+		is_point_segment = norms == 0
+	
+		if numpy.any(is_point_segment):
+			points = numpy.flatnonzero(is_point_segment[segment_ids])
+			cross_products[points] = numpy.hypot(
+					point_x[points] - start_x[segment_ids[points]],
+					point_y[points] - start_y[segment_ids[points]]
+			)
+			norms[is_point_segment] = 1.0
+	
+		max_cross_products = numpy.maximum.reduceat(cross_products, offsets)
+		hits = numpy.flatnonzero(cross_products == max_cross_products[segment_ids])
+		split_indexes = indexes[hits[numpy.searchsorted(segment_ids[hits], numpy.arange(len(starts)))]]
+	
+		is_split = max_cross_products / norms > epsilon
+		split_indexes = split_indexes[is_split]
+		is_kept[split_indexes] = True
+	
+		starts = numpy.concatenate([starts[is_split], split_indexes])
+		stops = numpy.concatenate([split_indexes, stops[is_split]])
+	
+		has_interior = stops - starts > 1
+		starts, stops = starts[has_interior], stops[has_interior]
+	
+	return numpy.flatnonzero(is_kept).astype(numpy.int64)
+
+
+def get_downsample_indexes(
+		x_values: numpy.ndarray,
+		y_values: numpy.ndarray,
+		num_points: int,
+		method: Literal["lttb", "minmax", "m4"] = "lttb"
+) -> numpy.ndarray:
+	"""
+	Selects the indexes of at most num_points points that preserve the visual shape of a series.
+
+	Args:
+		x_values (numpy.ndarray): The x-values.
+		y_values (numpy.ndarray): The y-values.
+		num_points (int): The maximum number of selected points.
+		method (Literal["lttb", "minmax", "m4"]): The downsampling method. Defaults to "lttb".
+
+	Returns:
+		numpy.ndarray: The sorted int64 indexes of the selected points.
+
+	Raises:
+		ValueError: If method is invalid or num_points is too small for it.
+	"""
+	if method == "lttb":
+		return get_lttb_indexes(x_values, y_values, num_points)
+	
+	if method == "minmax":
+		return get_minmax_indexes(y_values, num_points)
+	
+	if method == "m4":
+		return get_m4_indexes(y_values, num_points)
+	
+	raise ValueError('method must be "lttb", "minmax" or "m4"')
\ No newline at end of file
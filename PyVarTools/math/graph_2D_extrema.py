@@ -0,0 +1,421 @@
+import numpy
+from typing import (
+	Literal,
+	Optional
+)
+
+
+BLOCK_SIZE = 32
+
+
+def get_local_maxima_indexes(values: numpy.ndarray) -> numpy.ndarray:
+	"""
+	Returns the indexes of the local maxima of values.
+
+	A local maximum is a point or a flat run of points that is higher than the points on both sides of it. For a flat
+	run the index of its middle point is returned (rounded down), and the first and the last values are never maxima.
+	The maxima are found from the signs of the nonzero differences of consecutive values.
+
+	Args:
+		values (numpy.ndarray): The values.
+
+	Returns:
+		numpy.ndarray: The sorted int64 indexes of the local maxima.
+
+	:Usage:
+		get_local_maxima_indexes(numpy.array([0, 2, 1, 3, 3, 3, 0, 5]))
+		array([1, 4])
+	"""
+	differences = numpy.diff(numpy.asarray(values, dtype=numpy.float64))
+	nonzero_indexes = numpy.flatnonzero(differences != 0)
+	rising = differences[nonzero_indexes] > 0
+	
+	is_top = rising[:-1] & ~rising[1:]
+	left_edges = nonzero_indexes[:-1][is_top] + 1
+	right_edges = nonzero_indexes[1:][is_top]
+	
+	return ((left_edges + right_edges) // 2).astype(numpy.int64)
+
+
+def _get_block_table(values: numpy.ndarray, reduce: numpy.ufunc, fill_value: float) -> list[numpy.ndarray]:
+	"""
+	Builds a sparse table over the extrema of the BLOCK_SIZE blocks of values.
+
+	Args:
+		values (numpy.ndarray): The float64 values.
+		reduce (numpy.ufunc): numpy.minimum or numpy.maximum.
+		fill_value (float): The value padding the last block, inf for minima and -inf for maxima.
+
+	Returns:
+		list[numpy.ndarray]: The levels of the table, level k holds the extremum of every run of 2^k blocks.
+	"""
+	num_blocks = -(-len(values) // BLOCK_SIZE)
+	padded_values = numpy.full(num_blocks * BLOCK_SIZE, fill_value)
+	padded_values[:len(values)] = values
+	
+	levels = [reduce.reduce(padded_values.reshape(num_blocks, BLOCK_SIZE), axis=1)]
+	
+	while 2 ** len(levels) <= num_blocks:
+		width = 2 ** (len(levels) - 1)
+		levels.append(reduce(levels[-1][:-width], levels[-1][width:]))
+	
+	return levels
+
+
+def _query_block_table(
+		levels: list[numpy.ndarray],
+		reduce: numpy.ufunc,
+		first_blocks: numpy.ndarray,
+		stop_blocks: numpy.ndarray
+) -> numpy.ndarray:
+	"""
+	Returns the extremum of the blocks [first_block, stop_block) for every non-empty block range.
+
+	Args:
+		levels (list[numpy.ndarray]): The table built by _get_block_table.
+		reduce (numpy.ufunc): numpy.minimum or numpy.maximum.
+		first_blocks (numpy.ndarray): The first block of every range.
+		stop_blocks (numpy.ndarray): The block after the last block of every range.
+
+	Returns:
+		numpy.ndarray: The extremum of every range.
+	"""
+	level_indexes = numpy.log2(stop_blocks - first_blocks).astype(numpy.int64)
+	extrema = numpy.empty(len(first_blocks))
+	
+	for level_index, level in enumerate(levels):
+		ranges = numpy.flatnonzero(level_indexes == level_index)
+		extrema[ranges] = reduce(level[first_blocks[ranges]], level[stop_blocks[ranges] - 2 ** level_index])
+	
+	return extrema
+
+
+def get_range_extrema(
+		values: numpy.ndarray,
+		starts: numpy.ndarray,
+		stops: numpy.ndarray,
+		kind: Literal["min", "max"] = "min"
+) -> numpy.ndarray:
+	"""
+	Returns the minimum or maximum of values[start:stop] for every non-empty range, with numpy over all ranges at once.
+
+	The values are split into BLOCK_SIZE blocks. Ranges within one block are scanned in BLOCK_SIZE numpy passes, and
+	longer ranges combine the running extrema of their first and last blocks with a sparse table over the block extrema,
+	so the memory stays O(n) for any range length.
+
+	Args:
+		values (numpy.ndarray): The values.
+		starts (numpy.ndarray): The first index of every range.
+		stops (numpy.ndarray): The index after the last value of every range.
+		kind (Literal["min", "max"]): The extremum. Defaults to "min".
+
+	Returns:
+		numpy.ndarray: The float64 extremum of every range.
+
+	:Usage:
+		get_range_extrema(numpy.array([3, 1, 4, 1, 5]), numpy.array([0, 2]), numpy.array([2, 5]), "max")
+		array([3., 5.])
+	"""
+	reduce, fill_value = (numpy.minimum, numpy.inf) if kind == "min" else (numpy.maximum, -numpy.inf)
+	
+	values = numpy.asarray(values, dtype=numpy.float64)
+	starts = numpy.asarray(starts, dtype=numpy.int64)
+	stops = numpy.asarray(stops, dtype=numpy.int64)
+	extrema = values[starts].copy()
+	
+	first_blocks, last_blocks = starts // BLOCK_SIZE, (stops - 1) // BLOCK_SIZE
+	short_ranges = numpy.flatnonzero(first_blocks == last_blocks)
+	
+	for offset in range(1, BLOCK_SIZE):
+		short_ranges = short_ranges[starts[short_ranges] + offset < stops[short_ranges]]
+		extrema[short_ranges] = reduce(extrema[short_ranges], values[starts[short_ranges] + offset])
+	
+	long_ranges = numpy.flatnonzero(first_blocks != last_blocks)
+	
+	if len(long_ranges) == 0:
+		return extrema
+	
+	padded_values = numpy.full(-(-len(values) // BLOCK_SIZE) * BLOCK_SIZE, fill_value)
+	padded_values[:len(values)] = values
+	blocks = padded_values.reshape(-1, BLOCK_SIZE)
+	
+	suffix_extrema = reduce.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].ravel()
+	prefix_extrema = reduce.accumulate(blocks, axis=1).ravel()
+	extrema[long_ranges] = reduce(suffix_extrema[starts[long_ranges]], prefix_extrema[stops[long_ranges] - 1])
+	
+	middle_ranges = long_ranges[last_blocks[long_ranges] - first_blocks[long_ranges] > 1]
+	
+	if len(middle_ranges):
+		extrema[middle_ranges] = reduce(
+				extrema[middle_ranges],
+				_query_block_table(
+						_get_block_table(values, reduce, fill_value),
+						reduce,
+						first_blocks[middle_ranges] + 1,
+						last_blocks[middle_ranges]
+				)
+		)
+	
+	return extrema
+
+
+def get_previous_greater_indexes(values: numpy.ndarray) -> numpy.ndarray:
+	"""
+	Returns, for every value, the index of the nearest strictly greater value on its left.
+
+	Every value is first compared with the preceding values of its BLOCK_SIZE block. For the rest, the nearest preceding
+	block with a greater maximum is found by binary lifting over a sparse table of block maxima, and that block is
+	scanned from its end. All steps run over all values at once, in O(BLOCK_SIZE + log(n)) numpy passes.
+
+	Args:
+		values (numpy.ndarray): The values.
+
+	Returns:
+		numpy.ndarray: The int64 index of the nearest greater value on the left of every value, or -1 if there is none.
+
+	:Usage:
+		get_previous_greater_indexes(numpy.array([5, 1, 3, 3, 6, 2]))
+		array([-1,  0,  0,  0, -1,  4])
+	"""
+	values = numpy.asarray(values, dtype=numpy.float64)
+	
+	if len(values) == 0:
+		return numpy.empty(0, dtype=numpy.int64)
+	
+	num_blocks = -(-len(values) // BLOCK_SIZE)
+	blocks = numpy.full((num_blocks, BLOCK_SIZE), -numpy.inf)
+	blocks.ravel()[:len(values)] = values
+	indexes = numpy.arange(num_blocks * BLOCK_SIZE).reshape(num_blocks, BLOCK_SIZE)
+	block_previous_greater = numpy.full((num_blocks, BLOCK_SIZE), -1, dtype=numpy.int64)
+	
+	for offset in range(1, BLOCK_SIZE):
+		is_found = (block_previous_greater[:, offset:] == -1) & (blocks[:, :-offset] > blocks[:, offset:])
+		block_previous_greater[:, offset:][is_found] = indexes[:, offset:][is_found] - offset
+	
+	previous_greater = block_previous_greater.ravel()[:len(values)]
+	indexes = indexes.ravel()[:len(values)]
+	
+	levels = _get_block_table(values, numpy.maximum, -numpy.inf)
+	unresolved = indexes[(previous_greater == -1) & (indexes >= BLOCK_SIZE)]
+	unresolved_values = values[unresolved]
+	stop_blocks = unresolved // BLOCK_SIZE
+	
+	for level_index in range(len(levels) - 1, -1, -1):
+		first_blocks = stop_blocks - 2 ** level_index
+		can_skip = first_blocks >= 0
+		can_skip[can_skip] = levels[level_index][first_blocks[can_skip]] <= unresolved_values[can_skip]
+		stop_blocks[can_skip] = first_blocks[can_skip]
+	
+	is_found = stop_blocks > 0
+	unresolved, unresolved_values = unresolved[is_found], unresolved_values[is_found]
+	block_ends = stop_blocks[is_found] * BLOCK_SIZE
+	
+	for offset in range(1, BLOCK_SIZE + 1):
+		is_greater = values[block_ends - offset] > unresolved_values
+		previous_greater[unresolved[is_greater]] = block_ends[is_greater] - offset
+		unresolved, unresolved_values, block_ends = unresolved[~is_greater], unresolved_values[~is_greater], block_ends[~is_greater]
+	
+	return previous_greater
+
+
+def _get_left_bases(candidate_values: numpy.ndarray, valley_values: numpy.ndarray) -> numpy.ndarray:
+	"""
+	Returns, for every candidate, the minimum value between it and the nearest higher candidate on its left.
+
+	Args:
+		candidate_values (numpy.ndarray): The values of the candidates in position order.
+		valley_values (numpy.ndarray): The minimum of the values between every two neighbouring candidates, both included.
+
+	Returns:
+		numpy.ndarray: The float64 left base of every candidate, the minimum down to the first value if there is no higher candidate.
+	"""
+	bases = candidate_values.copy()
+	previous_greater = get_previous_greater_indexes(candidate_values)
+	
+	candidates = numpy.arange(1, len(candidate_values))
+	bases[1:] = get_range_extrema(valley_values, numpy.maximum(previous_greater[1:], 0), candidates)
+	
+	return bases
+
+
+def get_prominences(values: numpy.ndarray, peak_indexes: numpy.ndarray) -> numpy.ndarray:
+	"""
+	Returns the prominences of peaks.
+
+	The prominence of a peak is its height above the higher of its two bases. A base is the minimum of the values
+	between the peak and the nearest strictly higher value on that side (or the end of the values). The nearest higher
+	value is always reached through a local maximum or an end of the values, so the bases are computed over the local
+	maxima only (see _get_left_bases).
+
+	Args:
+		values (numpy.ndarray): The values.
+		peak_indexes (numpy.ndarray): The indexes of the peaks, local maxima of values.
+
+	Returns:
+		numpy.ndarray: The float64 prominences.
+
+	Raises:
+		ValueError: If a peak is not a local maximum (see get_local_maxima_indexes).
+
+	:Usage:
+		get_prominences(numpy.array([0, 3, 1, 5, 2, 4, 0]), numpy.array([1, 3, 5]))
+		array([2., 5., 2.])
+	"""
+	values = numpy.asarray(values, dtype=numpy.float64)
+	peak_indexes = numpy.asarray(peak_indexes, dtype=numpy.int64)
+	
+	if len(peak_indexes) == 0:
+		return numpy.empty(0, dtype=numpy.float64)
+	
+	candidates = numpy.concatenate([[0], get_local_maxima_indexes(values), [len(values) - 1]])
+	peak_candidates = numpy.searchsorted(candidates, peak_indexes)
+	
+	if numpy.any(candidates[numpy.minimum(peak_candidates, len(candidates) - 1)] != peak_indexes):
+		raise ValueError("peak_indexes must be local maxima of values")
+	
+	candidate_values = values[candidates]
+	valley_values = numpy.minimum(numpy.minimum.reduceat(values, candidates)[:-1], candidate_values[1:])
+	
+	left_bases = _get_left_bases(candidate_values, valley_values)
+	right_bases = _get_left_bases(candidate_values[::-1], valley_values[::-1])[::-1]
+	
+	return candidate_values[peak_candidates] - numpy.maximum(left_bases[peak_candidates], right_bases[peak_candidates])
+
+
+def filter_by_distance(peak_indexes: numpy.ndarray, heights: numpy.ndarray, distance: int) -> numpy.ndarray:
+	"""
+	Removes peaks closer than distance to a higher kept peak.
+
+	The result is the one of the greedy algorithm that visits the peaks from the highest (equal heights from the
+	rightmost) and keeps a peak unless a kept peak is closer than distance. Instead of visiting peaks one by one, every
+	round keeps all undecided peaks that are the highest undecided peak within distance of themselves and drops the
+	undecided peaks near them, which makes the same decisions. Rounds that decide few peaks (long chains of ever higher
+	peaks) hand the rest to the greedy loop.
+
+	Args:
+		peak_indexes (numpy.ndarray): The sorted indexes of the peaks.
+		heights (numpy.ndarray): The heights of the peaks.
+		distance (int): The minimum distance between kept peaks, in points.
+
+	Returns:
+		numpy.ndarray: The sorted int64 indexes of the kept peaks.
+
+	Raises:
+		ValueError: If distance is less than 1.
+	"""
+	if distance < 1:
+		raise ValueError("distance must be >= 1")
+	
+	peak_indexes = numpy.asarray(peak_indexes, dtype=numpy.int64)
+	
+	if distance == 1 or len(peak_indexes) < 2:
+		return peak_indexes
+	
+	ranks = numpy.empty(len(peak_indexes), dtype=numpy.int64)
+	ranks[numpy.argsort(heights, kind="stable")] = numpy.arange(len(peak_indexes))
+	
+	kept = numpy.zeros(len(peak_indexes), dtype=bool)
+	undecided = numpy.arange(len(peak_indexes))
+	
+	while len(undecided):
+		positions = peak_indexes[undecided]
+		window_maxima = get_range_extrema(
+				ranks[undecided],
+				numpy.searchsorted(positions, positions - distance + 1),
+				numpy.searchsorted(positions, positions + distance - 1, side="right"),
+				"max"
+		)
+		newly_kept = undecided[window_maxima == ranks[undecided]]
+		kept[newly_kept] = True
+	
+		kept_positions = peak_indexes[newly_kept]
+		next_kept = numpy.minimum(numpy.searchsorted(kept_positions, positions), len(kept_positions) - 1)
+		previous_kept = numpy.maximum(next_kept - 1, 0)
+		is_blocked = (
+				(numpy.abs(kept_positions[next_kept] - positions) < distance)
+				| (numpy.abs(kept_positions[previous_kept] - positions) < distance)
+		)
+	
+		num_undecided = len(undecided)
+		undecided = undecided[~is_blocked]
+	
+		if num_undecided - len(undecided) < num_undecided // 8:
+			break
+	
+	if len(undecided):
+		blocked = numpy.zeros(peak_indexes[-1] + distance, dtype=bool)
+	
+		for position in peak_indexes[kept].tolist():
+			blocked[max(position - distance + 1, 0):position + distance] = True
+	
+		for peak in undecided[numpy.argsort(-ranks[undecided])].tolist():
+			position = peak_indexes[peak].item()
+	
+			if not blocked[position]:
+				kept[peak] = True
+				blocked[max(position - distance + 1, 0):position + distance] = True
+	
+	return peak_indexes[kept]
+
+
+def find_extrema_indexes(
+		values: numpy.ndarray,
+		kind: Literal["maxima", "minima"] = "maxima",
+		height: Optional[float] = None,
+		distance: Optional[int] = None,
+		prominence: Optional[float] = None
+) -> numpy.ndarray:
+	"""
+	Finds the local maxima or minima of values that pass the height, distance and prominence filters.
+
+	The filters are applied in that order. Minima are the maxima of the negated values, so for them height is an upper
+	bound of the value and prominence is the depth below the lower of the two bases.
+
+	Args:
+		values (numpy.ndarray): The values.
+		kind (Literal["maxima", "minima"]): The kind of extrema. Defaults to "maxima".
+		height (Optional[float]): The minimum value of a maximum, or the maximum value of a minimum. Defaults to None.
+		distance (Optional[int]): The minimum distance between extrema in points, the more extreme one is kept. Defaults to None.
+		prominence (Optional[float]): The minimum prominence of an extremum (see get_prominences). Defaults to None.
+
+	Returns:
+		numpy.ndarray: The sorted int64 indexes of the extrema.
+
+	Raises:
+		ValueError: If kind is not "maxima" or "minima", or distance is less than 1.
+
+	:Usage:
+		values = numpy.array([0, 3, 1, 5, 2, 4, 0])
+		find_extrema_indexes(values)
+		array([1, 3, 5])
+
+		find_extrema_indexes(values, prominence=2.5)
+		array([3])
+
+		find_extrema_indexes(values, kind="minima")
+		array([2, 4])
+	"""
+	if kind not in ["maxima", "minima"]:
+		raise ValueError('kind must be "maxima" or "minima"')
+	
+	if distance is not None and distance < 1:
+		raise ValueError("distance must be >= 1")
+	
+	values = numpy.asarray(values, dtype=numpy.float64)
+	
+	if kind == "minima":
+		values = -values
+		height = None if height is None else -height
+	
+	indexes = get_local_maxima_indexes(values)
+	
+	if height is not None:
+		indexes = indexes[values[indexes] >= height]
+	
+	if distance is not None:
+		indexes = filter_by_distance(indexes, values[indexes], distance)
+	
+	if prominence is not None:
+		indexes = indexes[get_prominences(values, indexes) >= prominence]
+	
+	return indexes
\ No newline at end of file
@@ -0,0 +1,148 @@
+import heapq
+import itertools
+import math
+import numpy
+import operator
+from PyVarTools.math.graph_2D import (
+	STREAMING_BLOCK_SIZE,
+	Graph,
+	GraphPoint,
+	get_columnar_array,
+	get_graph_point
+)
+from typing import (
+	Any,
+	Generator,
+	Iterable,
+	Iterator,
+	Literal,
+	Union
+)
+
+
+MergeSource = Union[Graph, Iterable[Union[GraphPoint, tuple[Union[int, float], Union[int, float]]]]]
+
+
+def iterate_source_pairs(source: MergeSource) -> Generator[tuple[Union[int, float], Union[int, float]], Any, None]:
+	"""
+	Iterates over the (x, y) pairs of a graph or of an iterable of points, checking that they are sorted by x.
+
+	Graphs are checked once and read in blocks of STREAMING_BLOCK_SIZE points without creating GraphPoints. Iterables
+	are checked pair by pair as they are consumed, so an unsorted iterable raises only when the merge reaches it.
+
+	Args:
+		source (MergeSource): A Graph, or an iterable of GraphPoints or (x, y) pairs.
+
+	Returns:
+		Generator[tuple[Union[int, float], Union[int, float]], Any, None]: A generator of the (x, y) pairs in order.
+
+	Raises:
+		ValueError: If the x-values of the source are not sorted.
+	"""
+	if isinstance(source, Graph):
+		if not source.is_x_sorted:
+			raise ValueError("merged graphs must be sorted by x")
+	
+		for start in range(0, len(source), STREAMING_BLOCK_SIZE):
+			stop = start + STREAMING_BLOCK_SIZE
+			yield from zip(source.get_x_values(start, stop).tolist(), source.get_y_values(start, stop).tolist())
+	
+		return
+	
+	previous_x = None
+	
+	for point in source:
+		x, y = get_graph_point(point)
+	
+		if previous_x is not None and x < previous_x:
+			raise ValueError("merged iterables must be sorted by x")
+	
+		previous_x = x
+		yield x, y
+
+
+def iterate_unique_pairs(
+		pairs: Iterator[tuple[Union[int, float], Union[int, float]]],
+		duplicates: Literal["first", "last", "mean"]
+) -> Generator[tuple[Union[int, float], Union[int, float]], Any, None]:
+	"""
+	Collapses every run of (x, y) pairs with the same x-value into one pair.
+
+	Args:
+		pairs (Iterator[tuple[Union[int, float], Union[int, float]]]): The (x, y) pairs sorted by x.
+		duplicates (Literal["first", "last", "mean"]): Which pair of a run is kept: the first, the last, or a pair with the mean y-value of the run.
+
+	Returns:
+		Generator[tuple[Union[int, float], Union[int, float]], Any, None]: A generator of the pairs with unique x-values.
+	"""
+	for x, group in itertools.groupby(pairs, key=operator.itemgetter(0)):
+		group = list(group)
+	
+		if len(group) == 1 or duplicates == "first":
+			yield group[0]
+		elif duplicates == "last":
+			yield group[-1]
+		else:
+			yield x, math.fsum(y for _, y in group) / len(group)
+
+
+def merge_graphs(
+		*sources: MergeSource,
+		duplicates: Literal["keep", "first", "last", "mean"] = "keep",
+		output: Literal["graph", "generator"] = "graph",
+		storage: Literal["points", "columnar"] = "columnar"
+) -> Union[Graph, Generator[GraphPoint, Any, None]]:
+	"""
+	Merges graphs or iterables of points that are sorted by x into one series sorted by x.
+
+	The sources are merged lazily as (x, y) pairs with heapq.merge, which holds one pending pair per source, so no source
+	is materialized as a whole (graphs are read in blocks of STREAMING_BLOCK_SIZE points). Points with equal x-values keep
+	the order of their sources, so "first" prefers the earlier source and "last" the later one. The "graph" output is
+	built from blocks of STREAMING_BLOCK_SIZE merged points.
+
+	Args:
+		*sources (MergeSource): Graphs, or iterables of GraphPoints or (x, y) pairs, each sorted by x.
+		duplicates (Literal["keep", "first", "last", "mean"]): How points with equal x-values are resolved: "keep" keeps all of them, "first" and "last" keep one of them, "mean" keeps one point with their mean y-value. Defaults to "keep".
+		output (Literal["graph", "generator"]): "graph" returns a new Graph, "generator" returns a generator of the merged points. Defaults to "graph".
+		storage (Literal["points", "columnar"]): The storage of the returned graph. Defaults to "columnar".
+
+	Returns:
+		Union[Graph, Generator[GraphPoint, Any, None]]: The merged graph or a generator of the merged points.
+
+	Raises:
+		ValueError: If duplicates or output is invalid, or a source is not sorted by x (raised once the merged points are consumed).
+
+	:Usage:
+		first_graph = Graph.from_arrays([0, 2, 4], [1, 1, 1])
+		second_graph = Graph.from_arrays([1, 2, 3], [5, 3, 5])
+		merge_graphs(first_graph, second_graph, duplicates="mean").points
+		[(0, 1.0), (1, 5.0), (2, 2.0), (3, 5.0), (4, 1.0)]
+
+		list(merge_graphs([(0, 1), (2, 2)], [(1, 3)], output="generator"))
+		[(0, 1), (1, 3), (2, 2)]
+	"""
+	if duplicates not in ["keep", "first", "last", "mean"]:
+		raise ValueError('duplicates must be "keep", "first", "last" or "mean"')
+	
+	if output not in ["graph", "generator"]:
+		raise ValueError('output must be "graph" or "generator"')
+	
+	pairs = heapq.merge(*[iterate_source_pairs(source) for source in sources], key=operator.itemgetter(0))
+	
+	if duplicates != "keep":
+		pairs = iterate_unique_pairs(pairs, duplicates)
+	
+	if output == "generator":
+		return (GraphPoint(x, y) for x, y in pairs)
+	
+	x_blocks, y_blocks = [], []
+	
+	for block in iter(lambda: list(itertools.islice(pairs, STREAMING_BLOCK_SIZE)), []):
+		x_values, y_values = zip(*block)
+		x_blocks.append(get_columnar_array(x_values))
+		y_blocks.append(get_columnar_array(y_values))
+	
+	if not x_blocks:
+		return Graph(storage=storage)
+	
+	return Graph.from_arrays(numpy.concatenate(x_blocks), numpy.concatenate(y_blocks), storage)
\ No newline at end of file
@@ -0,0 +1,339 @@
+import os
+import numpy
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from PyVarTools.math.graph_2D import (
+	Graph,
+	GraphPoint,
+	GraphSection,
+	ThresholdSensitivity
+)
+from PyVarTools.math.graph_2D_vectorized import (
+	get_section_bounds,
+	iterate_section_breaks
+)
+from typing import (
+	Any,
+	Literal,
+	Optional,
+	Sequence,
+	Union
+)
+
+
+def get_graph_arrays(graph: Union[Graph, tuple[Any, Any]]) -> tuple[numpy.ndarray, numpy.ndarray]:
+	"""
+	Returns the compact x/y arrays of a graph or an (x_values, y_values) pair.
+
+	Args:
+		graph (Union[Graph, tuple[Any, Any]]): A Graph or a pair of x-values and y-values.
+
+	Returns:
+		tuple[numpy.ndarray, numpy.ndarray]: The x-values and the y-values.
+
+	Raises:
+		ValueError: If the x-values and the y-values have different lengths.
+	"""
+	if isinstance(graph, Graph):
+		return graph.get_x_values(), graph.get_y_values()
+	
+	x_values, y_values = numpy.asarray(graph[0]), numpy.asarray(graph[1])
+	
+	if len(x_values) != len(y_values):
+		raise ValueError("x_values and y_values must have the same length")
+	
+	return x_values, y_values
+
+
+def get_sections_from_bounds(
+		graph: Union[Graph, tuple[Any, Any]],
+		bounds: numpy.ndarray,
+		angle_sensitivity: float = 0.0
+) -> list[GraphSection]:
+	"""
+	Creates GraphSections for the given section bounds.
+
+	The sections of a Graph are views of it, except for "ring" storage, where they are detached (see GraphSection.detach).
+
+	Args:
+		graph (Union[Graph, tuple[Any, Any]]): A Graph or a pair of x-values and y-values.
+		bounds (numpy.ndarray): The (start, stop) index pairs of the sections.
+		angle_sensitivity (float): The angle sensitivity of the sections. Defaults to 0.0.
+
+	Returns:
+		list[GraphSection]: The sections.
+	"""
+	if isinstance(graph, Graph):
+		sections = [GraphSection.from_graph(graph, start, stop, angle_sensitivity) for start, stop in bounds.tolist()]
+	
+		if graph.storage == "ring":
+			for section in sections:
+				section.detach()
+	
+		return sections
+	
+	x_values, y_values = get_graph_arrays(graph)
+	
+	return [
+		GraphSection(
+				[GraphPoint(x, y) for x, y in zip(x_values[start:stop].tolist(), y_values[start:stop].tolist())],
+				angle_sensitivity
+		)
+		for start, stop in bounds.tolist()
+	]
+
+
+def get_section_bounds_of_arrays(
+		arrays: tuple[numpy.ndarray, numpy.ndarray],
+		threshold_sensitivity: float,
+		threshold_type: Literal["absolute", "relative"],
+		angle_sensitivity: float
+) -> numpy.ndarray:
+	"""
+	Returns the section bounds of an (x_values, y_values) pair. Runs in the worker processes.
+
+	Args:
+		arrays (tuple[numpy.ndarray, numpy.ndarray]): The x-values and the y-values.
+		threshold_sensitivity (float): The threshold sensitivity value.
+		threshold_type (Literal["absolute", "relative"]): The threshold sensitivity type.
+		angle_sensitivity (float): The angle sensitivity.
+
+	Returns:
+		numpy.ndarray: The (start, stop) index pairs of the sections.
+	"""
+	return get_section_bounds(arrays[0], arrays[1], threshold_sensitivity, threshold_type, angle_sensitivity)
+
+
+def get_section_breaks_of_chunk(
+		arrays: tuple[numpy.ndarray, numpy.ndarray],
+		offset: int,
+		threshold_sensitivity: float,
+		threshold_type: Literal["absolute", "relative"],
+		angle_sensitivity: float
+) -> numpy.ndarray:
+	"""
+	Segments a chunk of a series starting from a fresh section. Runs in the worker processes.
+
+	Args:
+		arrays (tuple[numpy.ndarray, numpy.ndarray]): The x-values and the y-values of the chunk, including its overlap with the previous chunk.
+		offset (int): The index of the first point of the chunk in the whole series.
+		threshold_sensitivity (float): The threshold sensitivity value.
+		threshold_type (Literal["absolute", "relative"]): The threshold sensitivity type.
+		angle_sensitivity (float): The angle sensitivity.
+
+	Returns:
+		numpy.ndarray: An int64 array of shape (num_breaks, 4) with the (start, stop, next_section_start, break_index) tuples of iterate_section_breaks, as indexes of the whole series.
+	"""
+	section_breaks = list(
+			iterate_section_breaks(
+					arrays[0],
+					arrays[1],
+					threshold_sensitivity,
+					threshold_type,
+					angle_sensitivity
+			)
+	)
+	
+	return numpy.array(section_breaks, dtype=numpy.int64).reshape(-1, 4) + offset
+
+
+def get_sections_batch(
+		graphs: Sequence[Union[Graph, tuple[Any, Any]]],
+		threshold_sensitivity: ThresholdSensitivity = ThresholdSensitivity(),
+		angle_sensitivity: float = 0.0,
+		max_workers: Optional[int] = None,
+		chunksize: Optional[int] = None,
+		output: Literal["sections", "bounds"] = "sections"
+) -> list[Union[list[GraphSection], numpy.ndarray]]:
+	"""
+	Divides many graphs into sections in parallel, with the same rules as Graph.get_sections.
+
+	The graphs are spread over a ProcessPoolExecutor. Workers receive only the compact x/y numpy arrays
+	of every graph and send back the (start, stop) bounds of the sections, so no GraphPoint is pickled in
+	either direction. The sections are built in the calling process. Workers run the vectorized engine, which compares
+	points to the same averages as the default "iterative" engine, so the bounds are those of Graph.get_sections.
+
+	Args:
+		graphs (Sequence[Union[Graph, tuple[Any, Any]]]): Graphs or (x_values, y_values) pairs.
+		threshold_sensitivity (ThresholdSensitivity): The threshold sensitivity. Defaults to ThresholdSensitivity().
+		angle_sensitivity (float): The angle sensitivity. Defaults to 0.0.
+		max_workers (Optional[int]): The number of worker processes. 1 runs in the calling process. Defaults to the number of CPUs.
+		chunksize (Optional[int]): The number of graphs sent to a worker at once. Defaults to an even split into four chunks per worker.
+		output (Literal["sections", "bounds"]): "sections" returns lists of GraphSections, "bounds" returns int64 arrays of shape (num_sections, 2). Defaults to "sections".
+
+	Returns:
+		list[Union[list[GraphSection], numpy.ndarray]]: The results for every graph, in input order.
+
+	Raises:
+		ValueError: If output is not "sections" or "bounds", or angle_sensitivity is less than 0.0.
+
+	:Usage:
+		get_sections_batch([graph_1, (x_values, y_values)], ThresholdSensitivity(0.5), max_workers=4)
+		[[...sections of graph_1...], [...sections of the pair...]]
+	"""
+	if output not in ["sections", "bounds"]:
+		raise ValueError('output must be "sections" or "bounds"')
+	
+	if angle_sensitivity < 0.0:
+		raise ValueError("angle_sensitivity must be >= 0.0")
+	
+	graphs = list(graphs)
+	arrays = [get_graph_arrays(graph) for graph in graphs]
+	
+	task = partial(
+			get_section_bounds_of_arrays,
+			threshold_sensitivity=threshold_sensitivity.threshold_sensitivity,
+			threshold_type=threshold_sensitivity.type_,
+			angle_sensitivity=angle_sensitivity
+	)
+	
+	if max_workers is None:
+		max_workers = os.cpu_count() or 1
+	
+	if max_workers == 1 or len(arrays) <= 1:
+		bounds = [task(graph_arrays) for graph_arrays in arrays]
+	else:
+		if chunksize is None:
+			chunksize = max(1, len(arrays) // (max_workers * 4))
+	
+		with ProcessPoolExecutor(max_workers=max_workers) as executor:
+			bounds = list(executor.map(task, arrays, chunksize=chunksize))
+	
+	if output == "bounds":
+		return bounds
+	
+	return [
+		get_sections_from_bounds(graph, graph_bounds, angle_sensitivity)
+		for graph, graph_bounds in zip(graphs, bounds)
+	]
+
+
+def get_sections_parallel(
+		graph: Union[Graph, tuple[Any, Any]],
+		threshold_sensitivity: ThresholdSensitivity = ThresholdSensitivity(),
+		angle_sensitivity: float = 0.0,
+		num_chunks: Optional[int] = None,
+		overlap: int = 4096,
+		max_workers: Optional[int] = None,
+		output: Literal["sections", "bounds"] = "sections"
+) -> Union[list[GraphSection], numpy.ndarray]:
+	"""
+	Divides a single long series into sections using several processes. The result is identical to Graph.get_sections.
+
+	The series is split into chunks, and every chunk, extended by `overlap` points before its start, is segmented
+	speculatively in a worker process, starting with a fresh section. The segmentation state is fully described by
+	the start of the open section and the index of the next point, so the chunks are stitched in order: the exact
+	state carried over from the previous chunk is advanced with the sequential engine until it coincides with a
+	state of the speculative run, and from there the speculative sections are adopted as they are. Sections split
+	at an extremum share that point (the get_graph_points_after_max/after_min carry-over), so the start of the new
+	section is the extremum index and it is part of the compared state. If the states never coincide, the chunk is
+	simply segmented sequentially, so the result is always exact; a larger overlap only makes it faster.
+
+	Args:
+		graph (Union[Graph, tuple[Any, Any]]): A Graph or an (x_values, y_values) pair.
+		threshold_sensitivity (ThresholdSensitivity): The threshold sensitivity. Defaults to ThresholdSensitivity().
+		angle_sensitivity (float): The angle sensitivity. Defaults to 0.0.
+		num_chunks (Optional[int]): The number of chunks. Defaults to max_workers.
+		overlap (int): The number of points before a chunk used to warm its speculative segmentation up. Defaults to 4096.
+		max_workers (Optional[int]): The number of worker processes. 1 runs in the calling process. Defaults to the number of CPUs.
+		output (Literal["sections", "bounds"]): "sections" returns a list of GraphSections, "bounds" returns an int64 array of shape (num_sections, 2). Defaults to "sections".
+
+	Returns:
+		Union[list[GraphSection], numpy.ndarray]: The sections or their bounds.
+
+	Raises:
+		ValueError: If output is not "sections" or "bounds", num_chunks is less than 1, overlap is negative or angle_sensitivity is less than 0.0.
+
+	:Usage:
+		get_sections_parallel((x_values, y_values), ThresholdSensitivity(0.5), max_workers=8, output="bounds")
+		array([[0, 14], [13, 27], ...])
+	"""
+	if output not in ["sections", "bounds"]:
+		raise ValueError('output must be "sections" or "bounds"')
+	
+	if angle_sensitivity < 0.0:
+		raise ValueError("angle_sensitivity must be >= 0.0")
+	
+	if overlap < 0:
+		raise ValueError("overlap must be >= 0")
+	
+	if max_workers is None:
+		max_workers = os.cpu_count() or 1
+	
+	if num_chunks is None:
+		num_chunks = max_workers
+	
+	if num_chunks < 1:
+		raise ValueError("num_chunks must be >= 1")
+	
+	x_values, y_values = get_graph_arrays(graph)
+	num_points = len(y_values)
+	
+	chunk_starts = numpy.unique(numpy.linspace(0, num_points, num_chunks + 1).astype(numpy.int64)).tolist()
+	warmup_starts = [max(0, chunk_start - overlap) for chunk_start in chunk_starts[:-1]]
+	
+	arrays = [
+		(x_values[warmup_start:chunk_stop], y_values[warmup_start:chunk_stop])
+		for warmup_start, chunk_stop in zip(warmup_starts, chunk_starts[1:])
+	]
+	
+	task = partial(
+			get_section_breaks_of_chunk,
+			threshold_sensitivity=threshold_sensitivity.threshold_sensitivity,
+			threshold_type=threshold_sensitivity.type_,
+			angle_sensitivity=angle_sensitivity
+	)
+	
+	if max_workers == 1 or len(arrays) <= 1:
+		chunks_breaks = [task(chunk_arrays, warmup_start) for chunk_arrays, warmup_start in zip(arrays, warmup_starts)]
+	else:
+		with ProcessPoolExecutor(max_workers=max_workers) as executor:
+			chunks_breaks = list(executor.map(task, arrays, warmup_starts))
+	
+	bounds = []
+	section_start = 0
+	
+	for chunk_start, chunk_stop, warmup_start, chunk_breaks in zip(chunk_starts[:-1], chunk_starts[1:], warmup_starts, chunks_breaks):
+		is_before_chunk = chunk_breaks[:, 3] < chunk_start
+		speculative_section_start = int(chunk_breaks[is_before_chunk][-1, 2]) if is_before_chunk.any() else warmup_start
+		speculative_breaks = chunk_breaks[~is_before_chunk]
+	
+		if speculative_section_start != section_start:
+			speculative_states = {
+				(next_section_start, break_index): position
+				for position, (next_section_start, break_index) in enumerate(speculative_breaks[:, 2:].tolist())
+			}
+			synced_position = None
+	
+			for start, stop, section_start, break_index in iterate_section_breaks(
+					x_values,
+					y_values,
+					threshold_sensitivity.threshold_sensitivity,
+					threshold_sensitivity.type_,
+					angle_sensitivity,
+					section_start=section_start,
+					next_index=chunk_start,
+					stop=chunk_stop
+			):
+				bounds.append((start, stop))
+				synced_position = speculative_states.get((section_start, break_index))
+	
+				if synced_position is not None:
+					break
+	
+			speculative_breaks = speculative_breaks[synced_position + 1:] if synced_position is not None else speculative_breaks[:0]
+	
+		bounds.extend(speculative_breaks[:, :2].tolist())
+	
+		if len(speculative_breaks):
+			section_start = int(speculative_breaks[-1, 2])
+	
+	if num_points:
+		bounds.append((section_start, num_points))
+	
+	bounds = numpy.array(bounds, dtype=numpy.int64).reshape(-1, 2)
+	
+	if output == "bounds":
+		return bounds
+	
+	return get_sections_from_bounds(graph, bounds, angle_sensitivity)
\ No newline at end of file
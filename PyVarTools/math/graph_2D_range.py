@@ -0,0 +1,842 @@
+import math
+import numpy
+from collections import deque
+from typing import (
+	Any,
+	Callable,
+	Literal,
+	Optional,
+	Union
+)
+
+
+PYRAMID_BUFFER_SIZE = 1024
+
+
+class RangeStatistics:
+	"""
+	Statistics of the values in an index range, answered by a SparseTable or a SegmentTree.
+
+	Attributes:
+		count (int): The number of values.
+		sum (float): The sum of the values.
+		min_value (Optional[Union[int, float]]): The minimum value, or None if the range is empty.
+		min_index (Optional[int]): The index of the first minimum value, or None if the range is empty.
+		max_value (Optional[Union[int, float]]): The maximum value, or None if the range is empty.
+		max_index (Optional[int]): The index of the first maximum value, or None if the range is empty.
+
+	:Usage:
+		statistics = SparseTable([3, 1, 4, 1, 5]).query(1, 4)
+		statistics.mean
+		2.0
+	"""
+	
+	def __init__(
+			self,
+			count: int = 0,
+			sum_: float = 0.0,
+			min_value: Optional[Union[int, float]] = None,
+			min_index: Optional[int] = None,
+			max_value: Optional[Union[int, float]] = None,
+			max_index: Optional[int] = None
+	):
+		"""
+		Initializes new RangeStatistics.
+
+		Args:
+			count (int): The number of values. Defaults to 0.
+			sum_ (float): The sum of the values. Defaults to 0.0.
+			min_value (Optional[Union[int, float]]): The minimum value. Defaults to None.
+			min_index (Optional[int]): The index of the first minimum value. Defaults to None.
+			max_value (Optional[Union[int, float]]): The maximum value. Defaults to None.
+			max_index (Optional[int]): The index of the first maximum value. Defaults to None.
+		"""
+		self.count = count
+		self.sum = sum_
+		self.min_value = min_value
+		self.min_index = min_index
+		self.max_value = max_value
+		self.max_index = max_index
+	
+	@property
+	def mean(self) -> Optional[float]:
+		"""
+		Returns the mean of the values.
+
+		Returns:
+			Optional[float]: The sum divided by the count, or None if the range is empty.
+		"""
+		return self.sum / self.count if self.count else None
+
+
+class SparseTable:
+	"""
+	Answers range minimum, maximum and sum queries over frozen values in O(1).
+
+	The values are split into blocks of block_size values. A sparse table over the blocks stores the index of the first
+	minimum and maximum of every run of 2^k blocks, and the partial blocks at both ends of a query are scanned with numpy,
+	so the table needs O(n / block_size * log(n)) memory instead of O(n * log(n)). Sums come from float64 prefix sums.
+
+	Attributes:
+		values (numpy.ndarray): The values as a float64 array.
+		block_size (int): The number of values per block.
+
+	:Usage:
+		sparse_table = SparseTable([3, 1, 4, 1, 5, 9, 2, 6])
+		statistics = sparse_table.query(2, 6)
+		(statistics.min_index, statistics.max_index, statistics.sum)
+		(3, 5, 19.0)
+	"""
+	
+	def __init__(self, values: Any, block_size: int = 32):
+		"""
+		Initializes a new SparseTable.
+
+		Args:
+			values (Any): The values (list, numpy array, etc.).
+			block_size (int): The number of values per block. Defaults to 32.
+
+		Raises:
+			ValueError: If block_size is less than 1.
+		"""
+		if block_size < 1:
+			raise ValueError("block_size must be >= 1")
+		
+		self.values = numpy.asarray(values, dtype=numpy.float64)
+		self.block_size = block_size
+		
+		self._prefix_sums = numpy.concatenate([[0.0], numpy.cumsum(self.values)])
+		self._min_levels: list[numpy.ndarray] = []
+		self._max_levels: list[numpy.ndarray] = []
+		
+		num_blocks = -(-len(self.values) // block_size)
+		
+		if num_blocks == 0:
+			return
+		
+		offsets = numpy.arange(num_blocks, dtype=numpy.int64) * block_size
+		padded_values = numpy.full(num_blocks * block_size, numpy.inf)
+		padded_values[:len(self.values)] = self.values
+		self._min_levels.append(offsets + numpy.argmin(padded_values.reshape(num_blocks, block_size), axis=1))
+		
+		padded_values[len(self.values):] = -numpy.inf
+		self._max_levels.append(offsets + numpy.argmax(padded_values.reshape(num_blocks, block_size), axis=1))
+		
+		width = 1
+		
+		while 2 * width <= num_blocks:
+			left, right = self._min_levels[-1][:-width], self._min_levels[-1][width:]
+			self._min_levels.append(numpy.where(self.values[right] < self.values[left], right, left))
+		
+			left, right = self._max_levels[-1][:-width], self._max_levels[-1][width:]
+			self._max_levels.append(numpy.where(self.values[right] > self.values[left], right, left))
+		
+			width *= 2
+	
+	def __len__(self) -> int:
+		"""
+		Returns the number of values.
+
+		Returns:
+			int: The number of values.
+		"""
+		return len(self.values)
+	
+	def _query_index(
+			self,
+			start: int,
+			stop: int,
+			levels: list[numpy.ndarray],
+			select: Callable[[numpy.ndarray], Any]
+	) -> int:
+		"""
+		Returns the index of the first extremum in a non-empty index range.
+
+		Args:
+			start (int): The index of the first value.
+			stop (int): The index after the last value.
+			levels (list[numpy.ndarray]): The sparse table levels of the extremum.
+			select (Callable[[numpy.ndarray], Any]): numpy.argmin or numpy.argmax.
+
+		Returns:
+			int: The index of the first extremum.
+		"""
+		first_block, last_block = start // self.block_size, (stop - 1) // self.block_size
+		
+		if last_block - first_block <= 1:
+			return start + int(select(self.values[start:stop]))
+		
+		level = (last_block - first_block - 1).bit_length() - 1
+		candidates = [
+			start + int(select(self.values[start:(first_block + 1) * self.block_size])),
+			int(levels[level][first_block + 1]),
+			int(levels[level][last_block - (1 << level)]),
+			last_block * self.block_size + int(select(self.values[last_block * self.block_size:stop])),
+		]
+		
+		return candidates[int(select(self.values[candidates]))]
+	
+	def query(self, start: int, stop: int) -> RangeStatistics:
+		"""
+		Returns the statistics of the values in an index range.
+
+		Args:
+			start (int): The index of the first value.
+			stop (int): The index after the last value.
+
+		Returns:
+			RangeStatistics: The statistics of values[start:stop].
+		"""
+		start, stop, _ = slice(start, stop).indices(len(self.values))
+		
+		if start >= stop:
+			return RangeStatistics()
+		
+		min_index = self._query_index(start, stop, self._min_levels, numpy.argmin)
+		max_index = self._query_index(start, stop, self._max_levels, numpy.argmax)
+		
+		return RangeStatistics(
+				count=stop - start,
+				sum_=float(self._prefix_sums[stop] - self._prefix_sums[start]),
+				min_value=self.values[min_index].item(),
+				min_index=min_index,
+				max_value=self.values[max_index].item(),
+				max_index=max_index
+		)
+
+
+class SegmentTree:
+	"""
+	Answers range minimum, maximum and sum queries in O(log(n)) and supports appends and point updates in O(log(n)).
+
+	The tree is an implicit binary tree over a power-of-two number of leaves. Every node stores the sum of its leaves and
+	the indexes of their first minimum and maximum (-1 for empty leaves). When the leaves are full, the capacity is doubled
+	and the tree is rebuilt level by level with numpy, so appends are O(log(n)) amortized. Point updates walk up the tree
+	carrying the sum and the extrema of the updated child and read only its sibling with ndarray.item, which avoids
+	creating numpy scalars.
+
+	:Usage:
+		segment_tree = SegmentTree([3, 1, 4])
+		segment_tree.append(0)
+		segment_tree.update(1, 7)
+		statistics = segment_tree.query(0, 4)
+		(statistics.min_index, statistics.max_index, statistics.sum)
+		(3, 1, 14.0)
+	"""
+	
+	def __init__(self, values: Any = (), capacity: int = 16):
+		"""
+		Initializes a new SegmentTree.
+
+		Args:
+			values (Any): The initial values (list, numpy array, etc.). Defaults to ().
+			capacity (int): The minimum number of leaves. Defaults to 16.
+		"""
+		values = numpy.asarray(values, dtype=numpy.float64)
+		
+		self._num_values = len(values)
+		self._build(values, max(capacity, len(values), 1))
+	
+	def __len__(self) -> int:
+		"""
+		Returns the number of values.
+
+		Returns:
+			int: The number of values.
+		"""
+		return self._num_values
+	
+	def _build(self, values: numpy.ndarray, capacity: int):
+		"""
+		Builds the tree over the given values with at least capacity leaves.
+
+		Args:
+			values (numpy.ndarray): The values.
+			capacity (int): The minimum number of leaves.
+		"""
+		size = 1 << (capacity - 1).bit_length()
+		
+		leaf_values = numpy.zeros(size)
+		leaf_values[:len(values)] = values
+		sums = numpy.zeros(2 * size)
+		sums[size:size + len(values)] = values
+		min_indexes = numpy.full(2 * size, -1, dtype=numpy.int64)
+		min_indexes[size:size + len(values)] = numpy.arange(len(values))
+		max_indexes = min_indexes.copy()
+		
+		level_start = size
+		
+		while level_start > 1:
+			parents = numpy.arange(level_start // 2, level_start)
+			left, right = 2 * parents, 2 * parents + 1
+		
+			sums[parents] = sums[left] + sums[right]
+			min_indexes[parents] = get_better_indexes(leaf_values, min_indexes[left], min_indexes[right], numpy.less)
+			max_indexes[parents] = get_better_indexes(leaf_values, max_indexes[left], max_indexes[right], numpy.greater)
+		
+			level_start //= 2
+		
+		self._size = size
+		self._values = leaf_values
+		self._sums = sums
+		self._min_indexes = min_indexes
+		self._max_indexes = max_indexes
+	
+	def append(self, value: Union[int, float]):
+		"""
+		Appends a value.
+
+		Args:
+			value (Union[int, float]): The value.
+		"""
+		if self._num_values == self._size:
+			self._build(self._values[:self._num_values], 2 * self._size)
+		
+		self._num_values += 1
+		self.update(self._num_values - 1, value)
+	
+	def update(self, index: int, value: Union[int, float]):
+		"""
+		Replaces the value at the given index.
+
+		Args:
+			index (int): The index of the value.
+			value (Union[int, float]): The new value.
+
+		Raises:
+			IndexError: If the index is out of range.
+		"""
+		if not 0 <= index < self._num_values:
+			raise IndexError("segment tree index out of range")
+		
+		value = float(value)
+		values, sums, min_indexes, max_indexes = self._values, self._sums, self._min_indexes, self._max_indexes
+		
+		values[index] = value
+		
+		node = index + self._size
+		total, min_index, min_value, max_index, max_value = value, index, value, index, value
+		
+		while True:
+			sums[node], min_indexes[node], max_indexes[node] = total, min_index, max_index
+		
+			if node == 1:
+				break
+		
+			sibling = node ^ 1
+			is_right = node & 1
+			total += sums.item(sibling)
+			sibling_index = min_indexes.item(sibling)
+		
+			if sibling_index >= 0:
+				sibling_value = values.item(sibling_index)
+		
+				if (not min_value < sibling_value) if is_right else sibling_value < min_value:
+					min_index, min_value = sibling_index, sibling_value
+		
+			sibling_index = max_indexes.item(sibling)
+		
+			if sibling_index >= 0:
+				sibling_value = values.item(sibling_index)
+		
+				if (not max_value > sibling_value) if is_right else sibling_value > max_value:
+					max_index, max_value = sibling_index, sibling_value
+		
+			node //= 2
+	
+	def query(self, start: int, stop: int) -> RangeStatistics:
+		"""
+		Returns the statistics of the values in an index range.
+
+		Args:
+			start (int): The index of the first value.
+			stop (int): The index after the last value.
+
+		Returns:
+			RangeStatistics: The statistics of values[start:stop].
+		"""
+		start, stop, _ = slice(start, stop).indices(self._num_values)
+		
+		if start >= stop:
+			return RangeStatistics()
+		
+		left_nodes, right_nodes = [], []
+		left, right = start + self._size, stop + self._size
+		
+		while left < right:
+			if left & 1:
+				left_nodes.append(left)
+				left += 1
+		
+			if right & 1:
+				right -= 1
+				right_nodes.append(right)
+		
+			left //= 2
+			right //= 2
+		
+		nodes = left_nodes + right_nodes[::-1]
+		min_indexes, max_indexes = self._min_indexes[nodes], self._max_indexes[nodes]
+		min_index = min_indexes.item(numpy.argmin(self._values[min_indexes]))
+		max_index = max_indexes.item(numpy.argmax(self._values[max_indexes]))
+		
+		return RangeStatistics(
+				count=stop - start,
+				sum_=math.fsum(self._sums[nodes].tolist()),
+				min_value=self._values.item(min_index),
+				min_index=min_index,
+				max_value=self._values.item(max_index),
+				max_index=max_index
+		)
+
+
+def get_better_indexes(
+		values: numpy.ndarray,
+		left: numpy.ndarray,
+		right: numpy.ndarray,
+		is_better: Callable[[numpy.ndarray, numpy.ndarray], numpy.ndarray]
+) -> numpy.ndarray:
+	"""
+	Merges extremum indexes of left and right children of a tree, preferring the left one on ties.
+
+	Args:
+		values (numpy.ndarray): The values the indexes point to.
+		left (numpy.ndarray): The indexes of the left children (-1 for empty children).
+		right (numpy.ndarray): The indexes of the right children (-1 for empty children).
+		is_better (Callable[[numpy.ndarray, numpy.ndarray], numpy.ndarray]): numpy.less for minimums, numpy.greater for maximums.
+
+	Returns:
+		numpy.ndarray: The indexes of the parents.
+	"""
+	return numpy.where((left < 0) | ((right >= 0) & is_better(values[right], values[left])), right, left)
+
+
+class RollingStatistics:
+	"""
+	Rolling statistics of a sequence of values, one entry per value.
+
+	Entry i covers the window of values that ends at value i. Entries whose window has fewer than the required number of
+	values are NaN.
+
+	Attributes:
+		count (numpy.ndarray): The number of values in every window.
+		min (numpy.ndarray): The minimum of every window.
+		max (numpy.ndarray): The maximum of every window.
+		mean (numpy.ndarray): The mean of every window.
+		std (numpy.ndarray): The population standard deviation of every window.
+
+	:Usage:
+		statistics = get_rolling_statistics(numpy.array([3, 1, 4, 1, 5]), get_window_starts(numpy.arange(5), 2))
+		statistics.max
+		array([3., 3., 4., 4., 5.])
+	"""
+	
+	def __init__(
+			self,
+			count: numpy.ndarray,
+			min_: numpy.ndarray,
+			max_: numpy.ndarray,
+			mean: numpy.ndarray,
+			std: numpy.ndarray
+	):
+		"""
+		Initializes new RollingStatistics.
+
+		Args:
+			count (numpy.ndarray): The number of values in every window.
+			min_ (numpy.ndarray): The minimum of every window.
+			max_ (numpy.ndarray): The maximum of every window.
+			mean (numpy.ndarray): The mean of every window.
+			std (numpy.ndarray): The population standard deviation of every window.
+		"""
+		self.count = count
+		self.min = min_
+		self.max = max_
+		self.mean = mean
+		self.std = std
+	
+	def __len__(self) -> int:
+		"""
+		Returns the number of windows.
+
+		Returns:
+			int: The number of windows.
+		"""
+		return len(self.count)
+
+
+def get_window_starts(
+		x_values: numpy.ndarray,
+		window: Union[int, float],
+		by: Literal["count", "x"] = "count"
+) -> numpy.ndarray:
+	"""
+	Returns the index of the first value of the trailing window that ends at every value.
+
+	A "count" window ending at value i holds the last window values up to i. An "x" window holds the values whose
+	x-value is in (x_i - window, x_i], which suits irregularly sampled series; it requires non-decreasing x-values.
+
+	Args:
+		x_values (numpy.ndarray): The x-values.
+		window (Union[int, float]): The number of values, or the x-span of the window.
+		by (Literal["count", "x"]): How window is measured. Defaults to "count".
+
+	Returns:
+		numpy.ndarray: The int64 window start of every value.
+
+	Raises:
+		ValueError: If window is not positive, by is invalid, window is not an integer for "count" windows, or the x-values are not sorted for "x" windows.
+	"""
+	if by not in ["count", "x"]:
+		raise ValueError('by must be "count" or "x"')
+	
+	if window <= 0:
+		raise ValueError("window must be > 0")
+	
+	if by == "count":
+		if int(window) != window:
+			raise ValueError('window must be an integer for "count" windows')
+	
+		return numpy.maximum(numpy.arange(len(x_values), dtype=numpy.int64) - int(window) + 1, 0)
+	
+	if numpy.any(numpy.diff(x_values) < 0):
+		raise ValueError('x-values must be sorted for "x" windows')
+	
+	return numpy.searchsorted(x_values, x_values - window, side="right").astype(numpy.int64)
+
+
+def get_rolling_extremes(values: numpy.ndarray, window_starts: numpy.ndarray) -> tuple[numpy.ndarray, numpy.ndarray]:
+	"""
+	Computes the minimum and maximum of every trailing window with monotonic deques in O(n).
+
+	The deques hold the indexes of the values that can still become the minimum (increasing values) or the maximum
+	(decreasing values) of a later window, so every index is pushed and popped at most once per deque.
+
+	Args:
+		values (numpy.ndarray): The values.
+		window_starts (numpy.ndarray): The non-decreasing start index of the window that ends at every value.
+
+	Returns:
+		tuple[numpy.ndarray, numpy.ndarray]: The float64 minimums and maximums.
+	"""
+	values_list = values.tolist()
+	min_values, max_values = [], []
+	min_deque, max_deque = deque(), deque()
+	
+	for index, (value, start) in enumerate(zip(values_list, window_starts.tolist())):
+		while min_deque and values_list[min_deque[-1]] >= value:
+			min_deque.pop()
+	
+		while max_deque and values_list[max_deque[-1]] <= value:
+			max_deque.pop()
+	
+		min_deque.append(index)
+		max_deque.append(index)
+	
+		while min_deque[0] < start:
+			min_deque.popleft()
+	
+		while max_deque[0] < start:
+			max_deque.popleft()
+	
+		min_values.append(values_list[min_deque[0]])
+		max_values.append(values_list[max_deque[0]])
+	
+	return numpy.array(min_values, dtype=numpy.float64), numpy.array(max_values, dtype=numpy.float64)
+
+
+def get_rolling_statistics(values: numpy.ndarray, window_starts: numpy.ndarray, min_count: int = 1) -> RollingStatistics:
+	"""
+	Computes rolling count, minimum, maximum, mean and standard deviation for the given trailing windows.
+
+	Minimums and maximums come from get_rolling_extremes, means and standard deviations from prefix sums of the values
+	and their squares. The values are centered on their overall mean before summing, which keeps the cancellation in
+	E[y^2] - E[y]^2 small, and variances below the rounding error of the prefix sums are set to 0.
+
+	Args:
+		values (numpy.ndarray): The values.
+		window_starts (numpy.ndarray): The non-decreasing start index of the window that ends at every value.
+		min_count (int): The minimum number of values in a window; smaller windows get NaN. Defaults to 1.
+
+	Returns:
+		RollingStatistics: The rolling statistics.
+	"""
+	values = numpy.asarray(values, dtype=numpy.float64)
+	window_stops = numpy.arange(1, len(values) + 1, dtype=numpy.int64)
+	count = window_stops - window_starts
+	
+	center = values.mean() if len(values) else 0.0
+	centered_values = values - center
+	prefix_sums = numpy.concatenate([[0.0], numpy.cumsum(centered_values)])
+	prefix_square_sums = numpy.concatenate([[0.0], numpy.cumsum(numpy.square(centered_values))])
+	
+	centered_mean = (prefix_sums[window_stops] - prefix_sums[window_starts]) / count
+	mean_square = (prefix_square_sums[window_stops] - prefix_square_sums[window_starts]) / count
+	variance = mean_square - numpy.square(centered_mean)
+	variance[variance <= 4 * numpy.finfo(numpy.float64).eps * prefix_square_sums[window_stops] / count] = 0.0
+	std = numpy.sqrt(variance)
+	
+	min_values, max_values = get_rolling_extremes(values, window_starts)
+	
+	statistics = RollingStatistics(count, min_values, max_values, centered_mean + center, std)
+	is_short = count < min_count
+	
+	for array in [statistics.min, statistics.max, statistics.mean, statistics.std]:
+		array[is_short] = numpy.nan
+	
+	return statistics
+
+
+class BucketStatistics:
+	"""
+	Statistics of consecutive buckets of values, one entry per bucket.
+
+	Empty buckets have count 0, sum 0 and NaN minimum, maximum and mean.
+
+	Attributes:
+		edges (numpy.ndarray): The bounds of the buckets, bucket i spans edges[i] to edges[i + 1].
+		count (numpy.ndarray): The number of values in every bucket.
+		sum (numpy.ndarray): The sum of every bucket.
+		min (numpy.ndarray): The minimum of every bucket.
+		max (numpy.ndarray): The maximum of every bucket.
+		mean (numpy.ndarray): The mean of every bucket.
+
+	:Usage:
+		statistics = AggregationPyramid([3, 1, 4, 1, 5]).query([0, 2, 5])
+		statistics.max
+		array([3., 5.])
+	"""
+	
+	def __init__(
+			self,
+			edges: numpy.ndarray,
+			count: numpy.ndarray,
+			sum_: numpy.ndarray,
+			min_: numpy.ndarray,
+			max_: numpy.ndarray
+	):
+		"""
+		Initializes new BucketStatistics.
+
+		Args:
+			edges (numpy.ndarray): The bounds of the buckets.
+			count (numpy.ndarray): The number of values in every bucket.
+			sum_ (numpy.ndarray): The sum of every bucket.
+			min_ (numpy.ndarray): The minimum of every bucket.
+			max_ (numpy.ndarray): The maximum of every bucket.
+		"""
+		self.edges = edges
+		self.count = count
+		self.sum = sum_
+		self.min = min_
+		self.max = max_
+		
+		with numpy.errstate(divide="ignore", invalid="ignore"):
+			self.mean = numpy.where(count > 0, sum_ / count, numpy.nan)
+	
+	def __len__(self) -> int:
+		"""
+		Returns the number of buckets.
+
+		Returns:
+			int: The number of buckets.
+		"""
+		return len(self.count)
+
+
+def get_reserved_array(array: numpy.ndarray, size: int) -> numpy.ndarray:
+	"""
+	Returns the array, or a copy with doubled capacity if it is shorter than size.
+
+	Args:
+		array (numpy.ndarray): The array.
+		size (int): The required length.
+
+	Returns:
+		numpy.ndarray: An array of length >= size that starts with the values of array.
+	"""
+	if len(array) >= size:
+		return array
+	
+	reserved_array = numpy.empty(max(size, 2 * len(array)), dtype=array.dtype)
+	reserved_array[:len(array)] = array
+	
+	return reserved_array
+
+
+class AggregationPyramid:
+	"""
+	Answers minimum, maximum, sum and count queries over many index ranges at once, for zoomable charts.
+
+	Level k of the pyramid stores the sum, minimum and maximum of every bucket of 2^k consecutive values (the last
+	bucket may be shorter), so all levels together take about 4n floats and are built in O(n) by reducing pairs of
+	buckets of the level below with numpy. A query splits every range into at most two buckets per level, like a
+	segment tree, and is answered level by level for all ranges together, in O(log(n)) numpy calls over the ranges, so
+	the time depends on the number of ranges and not on their length. Counts follow from the range bounds.
+
+	Appended values are buffered and added to all levels in blocks of PYRAMID_BUFFER_SIZE values, or before the next
+	query, so every level is only extended by its tail.
+
+	:Usage:
+		pyramid = AggregationPyramid([3, 1, 4, 1, 5, 9, 2])
+		pyramid.append(6)
+		statistics = pyramid.query([0, 4, 8])
+		(statistics.min, statistics.max, statistics.mean)
+		(array([1., 2.]), array([4., 9.]), array([2.25, 5.5 ]))
+	"""
+	
+	def __init__(self, values: Any = ()):
+		"""
+		Initializes a new AggregationPyramid.
+
+		Args:
+			values (Any): The initial values (list, numpy array, etc.). Defaults to ().
+		"""
+		self._num_values = 0
+		self._buffer: list[Union[int, float]] = []
+		self._sums: list[numpy.ndarray] = [numpy.empty(0)]
+		self._mins: list[numpy.ndarray] = [self._sums[0]]
+		self._maxs: list[numpy.ndarray] = [self._sums[0]]
+		
+		self.extend(values)
+	
+	def __len__(self) -> int:
+		"""
+		Returns the number of values.
+
+		Returns:
+			int: The number of values.
+		"""
+		return self._num_values + len(self._buffer)
+	
+	def _flush(self):
+		"""Adds the buffered values to all levels."""
+		if self._buffer:
+			values, self._buffer = self._buffer, []
+			self._extend(numpy.array(values, dtype=numpy.float64))
+	
+	def _extend(self, values: numpy.ndarray):
+		"""
+		Adds values to all levels, recomputing only the buckets that contain them.
+
+		Args:
+			values (numpy.ndarray): The float64 values.
+		"""
+		start, stop = self._num_values, self._num_values + len(values)
+		
+		values_level = get_reserved_array(self._sums[0], stop)
+		values_level[start:stop] = values
+		self._sums[0] = self._mins[0] = self._maxs[0] = values_level
+		self._num_values = stop
+		
+		level = 1
+		
+		while stop > 1:
+			child_start, child_stop = start - start % 2, stop
+			start, stop = start // 2, (stop + 1) // 2
+			num_pairs = (child_stop - child_start) // 2
+		
+			if level == len(self._sums):
+				self._sums.append(numpy.empty(0))
+				self._mins.append(numpy.empty(0))
+				self._maxs.append(numpy.empty(0))
+		
+			for levels, function in [(self._sums, numpy.add), (self._mins, numpy.minimum), (self._maxs, numpy.maximum)]:
+				children = levels[level - 1][child_start:child_stop]
+				levels[level] = get_reserved_array(levels[level], stop)
+				function(children[0:2 * num_pairs:2], children[1:2 * num_pairs:2], out=levels[level][start:start + num_pairs])
+		
+				if child_stop - child_start > 2 * num_pairs:
+					levels[level][stop - 1] = children[-1]
+		
+			level += 1
+	
+	def append(self, value: Union[int, float]):
+		"""
+		Appends a value.
+
+		Args:
+			value (Union[int, float]): The value.
+		"""
+		self._buffer.append(value)
+		
+		if len(self._buffer) >= PYRAMID_BUFFER_SIZE:
+			self._flush()
+	
+	def extend(self, values: Any):
+		"""
+		Appends a block of values.
+
+		Args:
+			values (Any): The values (list, numpy array, etc.).
+		"""
+		self._flush()
+		
+		values = numpy.asarray(values, dtype=numpy.float64)
+		
+		if len(values):
+			self._extend(values)
+	
+	def _add_nodes(
+			self,
+			level: int,
+			is_taken: numpy.ndarray,
+			nodes: numpy.ndarray,
+			sums: numpy.ndarray,
+			mins: numpy.ndarray,
+			maxs: numpy.ndarray
+	):
+		"""
+		Adds the buckets of one level to the statistics of the ranges that take them.
+
+		Args:
+			level (int): The level of the buckets.
+			is_taken (numpy.ndarray): The mask of the ranges that take a bucket.
+			nodes (numpy.ndarray): The index of the taken bucket of every such range.
+			sums (numpy.ndarray): The sums of the ranges, updated in place.
+			mins (numpy.ndarray): The minimums of the ranges, updated in place.
+			maxs (numpy.ndarray): The maximums of the ranges, updated in place.
+		"""
+		sums[is_taken] += self._sums[level][nodes]
+		mins[is_taken] = numpy.minimum(mins[is_taken], self._mins[level][nodes])
+		maxs[is_taken] = numpy.maximum(maxs[is_taken], self._maxs[level][nodes])
+	
+	def query(self, bounds: Any, edges: Optional[Any] = None) -> BucketStatistics:
+		"""
+		Returns the statistics of consecutive buckets of values.
+
+		Args:
+			bounds (Any): The non-decreasing index bounds of the buckets, bucket i holds values[bounds[i]:bounds[i + 1]].
+			edges (Optional[Any]): The bucket edges to store in the result, such as their x-values. Defaults to None, which stores bounds.
+
+		Returns:
+			BucketStatistics: The statistics of every bucket.
+		"""
+		self._flush()
+		
+		bounds = numpy.clip(numpy.asarray(bounds, dtype=numpy.int64), 0, self._num_values)
+		left, right = bounds[:-1], numpy.maximum(bounds[:-1], bounds[1:])
+		count = right - left
+		
+		sums = numpy.zeros(len(count))
+		mins = numpy.full(len(count), numpy.inf)
+		maxs = numpy.full(len(count), -numpy.inf)
+		
+		for level in range(len(self._sums)):
+			if not numpy.any(left < right):
+				break
+		
+			is_taken = (left < right) & (left % 2 == 1)
+			self._add_nodes(level, is_taken, left[is_taken], sums, mins, maxs)
+			left = left + is_taken
+		
+			is_taken = (left < right) & (right % 2 == 1)
+			right = right - is_taken
+			self._add_nodes(level, is_taken, right[is_taken], sums, mins, maxs)
+		
+			left, right = left // 2, right // 2
+		
+		mins[count == 0] = numpy.nan
+		maxs[count == 0] = numpy.nan
+		
+		return BucketStatistics(bounds if edges is None else numpy.asarray(edges), count, sums, mins, maxs)
\ No newline at end of file
@@ -0,0 +1,797 @@
+import math
+import numpy
+from functools import lru_cache
+from typing import (
+	Any,
+	Callable,
+	Generator,
+	Literal,
+	Optional
+)
+
+
+DIRECTION_NONE = 0
+DIRECTION_INCREASING = 1
+DIRECTION_DECREASING = 2
+DIRECTION_STRAIGHT = 3
+
+SECTION_SUMMARY_DTYPE = numpy.dtype(
+		[
+			("start", numpy.int64),
+			("stop", numpy.int64),
+			("direction", numpy.int8),
+			("min_index", numpy.int64),
+			("min_value", numpy.float64),
+			("max_index", numpy.int64),
+			("max_value", numpy.float64),
+			("mean", numpy.float64),
+			("angle", numpy.float64),
+		]
+)
+
+
+def get_decrease_sensitive_values(
+		values: numpy.ndarray,
+		threshold_sensitivity: float,
+		threshold_type: Literal["absolute", "relative"]
+) -> numpy.ndarray:
+	"""
+	Vectorized equivalent of ThresholdSensitivity.get_decrease_sensitive_point.
+
+	Args:
+		values (numpy.ndarray): The values to adjust.
+		threshold_sensitivity (float): The sensitivity value.
+		threshold_type (Literal["absolute", "relative"]): The type of sensitivity.
+
+	Returns:
+		numpy.ndarray: The decreased sensitive values.
+	"""
+	if threshold_type == "absolute":
+		return values - threshold_sensitivity
+	
+	return values * (1 - threshold_sensitivity)
+
+
+def get_increase_sensitive_values(
+		values: numpy.ndarray,
+		threshold_sensitivity: float,
+		threshold_type: Literal["absolute", "relative"]
+) -> numpy.ndarray:
+	"""
+	Vectorized equivalent of ThresholdSensitivity.get_increase_sensitive_point.
+
+	Args:
+		values (numpy.ndarray): The values to adjust.
+		threshold_sensitivity (float): The sensitivity value.
+		threshold_type (Literal["absolute", "relative"]): The type of sensitivity.
+
+	Returns:
+		numpy.ndarray: The increased sensitive values.
+	"""
+	if threshold_type == "absolute":
+		return values + threshold_sensitivity
+	
+	return values * (1 + threshold_sensitivity)
+
+
+def get_angles(delta_x: Any, delta_y: Any) -> numpy.ndarray:
+	"""
+	Vectorized equivalent of calculate_angle_degree, given the differences between the end and the start points.
+
+	The edge cases are the same: the angle is 0.0 if the y-values are equal and 90.0 if only the x-values are equal.
+
+	Args:
+		delta_x (Any): The x-differences (end - start) as an array or a sequence.
+		delta_y (Any): The y-differences (end - start) as an array or a sequence.
+
+	Returns:
+		numpy.ndarray: The float64 angles in degrees.
+
+	:Usage:
+		get_angles(numpy.array([1, 0, 2, 1]), numpy.array([1, -3, 0, -1]))
+		array([ 45.,  90.,   0., -45.])
+	"""
+	delta_x = numpy.asarray(delta_x)
+	delta_y = numpy.asarray(delta_y)
+	
+	with numpy.errstate(divide="ignore", invalid="ignore"):
+		angles = numpy.degrees(numpy.arctan(delta_y / delta_x))
+	
+	return numpy.where(delta_y == 0, 0.0, numpy.where(delta_x == 0, 90.0, angles))
+
+
+def get_slopes(delta_x: Any, delta_y: Any) -> numpy.ndarray:
+	"""
+	Returns the slopes matching get_angles: 0.0 if the y-values are equal and inf (an angle of 90.0) if only the x-values are equal.
+
+	Args:
+		delta_x (Any): The x-differences (end - start) as an array or a sequence.
+		delta_y (Any): The y-differences (end - start) as an array or a sequence.
+
+	Returns:
+		numpy.ndarray: The float64 slopes.
+	"""
+	delta_x = numpy.asarray(delta_x)
+	delta_y = numpy.asarray(delta_y)
+	
+	with numpy.errstate(divide="ignore", invalid="ignore"):
+		slopes = delta_y / delta_x
+	
+	return numpy.where(delta_y == 0, 0.0, numpy.where(delta_x == 0, numpy.inf, slopes))
+
+
+@lru_cache(maxsize=64)
+def get_slope_threshold(angle_sensitivity: float) -> float:
+	"""
+	Returns the largest slope whose angle (as computed by get_angles) is not above angle_sensitivity.
+
+	Since the angle never decreases with the slope, "angle > angle_sensitivity" is exactly "slope > threshold" and
+	"angle < -angle_sensitivity" is exactly "slope < -threshold". The threshold starts at tan(angle_sensitivity) and is
+	moved by single ulps until it agrees with get_angles, so rounding in tan, arctan and degrees cannot change a result.
+
+	Args:
+		angle_sensitivity (float): The angle sensitivity in degrees.
+
+	Returns:
+		float: The slope threshold, inf for angle sensitivities of 90.0 and more.
+
+	Raises:
+		ValueError: If angle_sensitivity is less than 0.0.
+	"""
+	if angle_sensitivity < 0.0:
+		raise ValueError("angle_sensitivity must be >= 0.0")
+	
+	if angle_sensitivity >= 90.0:
+		return math.inf
+	
+	def get_angle(slope: float) -> float:
+		return numpy.degrees(numpy.arctan(numpy.float64(slope))).item()
+	
+	threshold = math.tan(math.radians(angle_sensitivity))
+	
+	while get_angle(threshold) > angle_sensitivity:
+		threshold = math.nextafter(threshold, -math.inf)
+	
+	while get_angle(math.nextafter(threshold, math.inf)) <= angle_sensitivity:
+		threshold = math.nextafter(threshold, math.inf)
+	
+	return threshold
+
+
+def get_directions(
+		delta_x: numpy.ndarray,
+		delta_y: numpy.ndarray,
+		angle_sensitivity: float,
+		space: Literal["angle", "tangent"] = "angle"
+) -> numpy.ndarray:
+	"""
+	Classifies the directions of segments with the same rules as GraphSection.get_direction.
+
+	In "angle" space the angles of the segments are compared with angle_sensitivity. In "tangent" space the slopes are
+	compared with get_slope_threshold(angle_sensitivity) instead, which skips numpy.arctan and numpy.degrees and gives
+	the same directions.
+
+	Args:
+		delta_x (numpy.ndarray): The x-differences between the last and the first points of the segments.
+		delta_y (numpy.ndarray): The y-differences between the last and the first points of the segments.
+		angle_sensitivity (float): The angle sensitivity in degrees.
+		space (Literal["angle", "tangent"]): The space the comparison is made in. Defaults to "angle".
+
+	Returns:
+		numpy.ndarray: The direction codes (DIRECTION_INCREASING, DIRECTION_DECREASING or DIRECTION_STRAIGHT).
+
+	Raises:
+		ValueError: If space is not "angle" or "tangent".
+	"""
+	if space == "angle":
+		values, threshold = get_angles(delta_x, delta_y), angle_sensitivity
+	elif space == "tangent":
+		values, threshold = get_slopes(delta_x, delta_y), get_slope_threshold(float(angle_sensitivity))
+	else:
+		raise ValueError('space must be "angle" or "tangent"')
+	
+	return numpy.where(
+			values > threshold,
+			DIRECTION_INCREASING,
+			numpy.where(values < -threshold, DIRECTION_DECREASING, DIRECTION_STRAIGHT)
+	)
+
+
+def get_point_angles(
+		x_values: numpy.ndarray,
+		y_values: numpy.ndarray,
+		start_indexes: Optional[Any] = None,
+		end_indexes: Optional[Any] = None
+) -> numpy.ndarray:
+	"""
+	Returns the angles between pairs of points, as calculate_angle_degree would for each pair.
+
+	Args:
+		x_values (numpy.ndarray): The x-values of the points.
+		y_values (numpy.ndarray): The y-values of the points.
+		start_indexes (Optional[Any]): The indexes of the start points. Defaults to None (every point but the last).
+		end_indexes (Optional[Any]): The indexes of the end points. Defaults to None (every point after start_indexes).
+
+	Returns:
+		numpy.ndarray: The float64 angles in degrees.
+
+	Raises:
+		ValueError: If start_indexes and end_indexes have different shapes.
+
+	:Usage:
+		get_point_angles(numpy.arange(4), numpy.array([0, 1, 1, 0]))
+		array([ 45.,   0., -45.])
+	"""
+	x_values = numpy.asarray(x_values)
+	y_values = numpy.asarray(y_values)
+	
+	if start_indexes is None:
+		start_indexes = numpy.arange(max(len(x_values) - 1, 0))
+	
+	start_indexes = numpy.asarray(start_indexes, dtype=numpy.int64)
+	end_indexes = start_indexes + 1 if end_indexes is None else numpy.asarray(end_indexes, dtype=numpy.int64)
+	
+	if start_indexes.shape != end_indexes.shape:
+		raise ValueError("start_indexes and end_indexes must have the same shape")
+	
+	return get_angles(
+			x_values[end_indexes] - x_values[start_indexes],
+			y_values[end_indexes] - y_values[start_indexes]
+	)
+
+
+def get_direction(delta_x: float, delta_y: float, angle_sensitivity: float) -> int:
+	"""
+	Scalar equivalent of get_directions.
+
+	Args:
+		delta_x (float): The x-difference between the last and the first points of the segment.
+		delta_y (float): The y-difference between the last and the first points of the segment.
+		angle_sensitivity (float): The angle sensitivity in degrees.
+
+	Returns:
+		int: The direction code (DIRECTION_INCREASING, DIRECTION_DECREASING or DIRECTION_STRAIGHT).
+	"""
+	if delta_y == 0:
+		angle = 0.0
+	elif delta_x == 0:
+		angle = 90.0
+	else:
+		angle = math.degrees(math.atan(delta_y / delta_x))
+	
+	if angle > angle_sensitivity:
+		return DIRECTION_INCREASING
+	elif angle < -angle_sensitivity:
+		return DIRECTION_DECREASING
+	else:
+		return DIRECTION_STRAIGHT
+
+
+def get_mean_tolerance(count: Any, max_abs_value: Any) -> Any:
+	"""
+	Returns how far apart two float64 means of the same values can be, whatever order the values were summed in.
+
+	A float64 sum of count values is off the exact sum by at most count roundings of the largest absolute value,
+	so the difference of two means is less than twice that.
+
+	Args:
+		count (Any): The number of values, an int or an array.
+		max_abs_value (Any): The largest absolute value, a number or an array.
+
+	Returns:
+		Any: The tolerance, a float or an array.
+	"""
+	return (count + 1) * max_abs_value * 2.0 ** -51
+
+
+def get_segmentation_mean(values: Any) -> float:
+	"""
+	Returns the average of a straight section that the next point is compared to.
+
+	The average is numpy.mean of the values as float64, as get_sections has always computed it, so the sections do not
+	depend on the engine or on how a running mean was accumulated.
+
+	Args:
+		values (Any): The y-values of the section.
+
+	Returns:
+		float: The average.
+	"""
+	return numpy.mean(numpy.asarray(values, dtype=numpy.float64)).item()
+
+
+def get_average_sides(
+		y: Any,
+		average: Any,
+		threshold_sensitivity: float,
+		threshold_type: Literal["absolute", "relative"]
+) -> tuple[Any, Any]:
+	"""
+	Compares points to the thresholds around the average of a straight section.
+
+	A point continues the section if it is below the increased or above the decreased average.
+
+	Args:
+		y (Any): The y-values of the points, a number or an array.
+		average (Any): The averages of the section, a number or an array.
+		threshold_sensitivity (float): The threshold sensitivity value.
+		threshold_type (Literal["absolute", "relative"]): The threshold sensitivity type.
+
+	Returns:
+		tuple[Any, Any]: Whether y is below the increased average and whether it is above the decreased one, bools or arrays.
+	"""
+	if threshold_type == "absolute":
+		return y < average + threshold_sensitivity, y > average - threshold_sensitivity
+	
+	return y < average * (1 + threshold_sensitivity), y > average * (1 - threshold_sensitivity)
+
+
+def continues_straight_section(
+		y: float,
+		running_mean: float,
+		tolerance: float,
+		get_values: Callable[[], Any],
+		threshold_sensitivity: float,
+		threshold_type: Literal["absolute", "relative"]
+) -> bool:
+	"""
+	Checks whether a point continues a straight section, i.e. is not within the threshold of the section average.
+
+	The average is get_segmentation_mean of the section. It is computed only if y is within tolerance of a threshold,
+	otherwise every average within tolerance of running_mean gives the same result and running_mean decides.
+
+	Args:
+		y (float): The y-value of the point.
+		running_mean (float): A mean of the section values, e.g. from running sums.
+		tolerance (float): The bound of the distance between running_mean and the average, see get_mean_tolerance.
+		get_values (Callable[[], Any]): Returns the y-values of the section.
+		threshold_sensitivity (float): The threshold sensitivity value.
+		threshold_type (Literal["absolute", "relative"]): The threshold sensitivity type.
+
+	Returns:
+		bool: Whether the point continues the section.
+	"""
+	if math.isfinite(tolerance):
+		sides = get_average_sides(y, running_mean - tolerance, threshold_sensitivity, threshold_type)
+	
+		if sides == get_average_sides(y, running_mean + tolerance, threshold_sensitivity, threshold_type):
+			return sides[0] or sides[1]
+	
+	sides = get_average_sides(y, get_segmentation_mean(get_values()), threshold_sensitivity, threshold_type)
+	
+	return sides[0] or sides[1]
+
+
+def _find_section_break_scalar(
+		x_values: numpy.ndarray,
+		y_values: numpy.ndarray,
+		section_start: int,
+		next_index: int,
+		stop: int,
+		threshold_sensitivity: float,
+		threshold_type: Literal["absolute", "relative"],
+		angle_sensitivity: float
+) -> Optional[tuple[int, int]]:
+	"""
+	Looks for the first point in [next_index, stop) that does not continue the section, one point at a time.
+
+	Used for the first candidates of every section, where a numpy call would cost more than the scan itself.
+
+	Args:
+		x_values (numpy.ndarray): The x-values of the points.
+		y_values (numpy.ndarray): The y-values of the points.
+		section_start (int): The index of the first point of the section.
+		next_index (int): The index of the first candidate point. The section covers [section_start, next_index).
+		stop (int): The index after the last candidate point.
+		threshold_sensitivity (float): The threshold sensitivity value.
+		threshold_type (Literal["absolute", "relative"]): The threshold sensitivity type.
+		angle_sensitivity (float): The angle sensitivity in degrees.
+
+	Returns:
+		Optional[tuple[int, int]]: The index of the break point and the direction of the section at it, or None if every candidate continues the section.
+	"""
+	section_y_values = y_values[section_start:next_index].tolist()
+	candidate_x_values = x_values[next_index - 1:stop].tolist()
+	candidate_y_values = y_values[next_index - 1:stop].tolist()
+	
+	first_x = x_values[section_start].item()
+	first_y = section_y_values[0]
+	
+	max_y = max(section_y_values)
+	min_y = min(section_y_values)
+	sum_y = float(sum(section_y_values))
+	length = len(section_y_values)
+	
+	for offset in range(1, len(candidate_y_values)):
+		last_x = candidate_x_values[offset - 1]
+		last_y = candidate_y_values[offset - 1]
+		y = candidate_y_values[offset]
+	
+		direction = get_direction(last_x - first_x, last_y - first_y, angle_sensitivity)
+	
+		if direction == DIRECTION_INCREASING:
+			if threshold_type == "absolute":
+				continues = y > max_y - threshold_sensitivity
+			else:
+				continues = y > max_y * (1 - threshold_sensitivity)
+		elif direction == DIRECTION_DECREASING:
+			if threshold_type == "absolute":
+				continues = y < min_y + threshold_sensitivity
+			else:
+				continues = y < min_y * (1 + threshold_sensitivity)
+		else:
+			continues = continues_straight_section(
+					y,
+					sum_y / length,
+					get_mean_tolerance(length, max(abs(max_y), abs(min_y))),
+					lambda: y_values[section_start:next_index + offset - 1],
+					threshold_sensitivity,
+					threshold_type
+			)
+	
+		if not continues:
+			return next_index + offset - 1, direction
+	
+		if y > max_y:
+			max_y = y
+	
+		if y < min_y:
+			min_y = y
+	
+		sum_y += y
+		length += 1
+	
+	return None
+
+
+def _find_section_break_vectorized(
+		x_values: numpy.ndarray,
+		y_values: numpy.ndarray,
+		section_start: int,
+		next_index: int,
+		stop: int,
+		threshold_sensitivity: float,
+		threshold_type: Literal["absolute", "relative"],
+		angle_sensitivity: float
+) -> Optional[tuple[int, int]]:
+	"""
+	Looks for the first point in [next_index, stop) that does not continue the section with numpy.
+
+	Running extrema, prefix sums and the direction of the section for every candidate length are computed
+	over the whole block at once, and the break is found with index arithmetic. Points of straight sections that are
+	closer to a threshold than the rounding error of the prefix sums are decided one by one with continues_straight_section.
+
+	Args:
+		x_values (numpy.ndarray): The x-values of the points.
+		y_values (numpy.ndarray): The y-values of the points.
+		section_start (int): The index of the first point of the section.
+		next_index (int): The index of the first candidate point. The section covers [section_start, next_index).
+		stop (int): The index after the last candidate point.
+		threshold_sensitivity (float): The threshold sensitivity value.
+		threshold_type (Literal["absolute", "relative"]): The threshold sensitivity type.
+		angle_sensitivity (float): The angle sensitivity in degrees.
+
+	Returns:
+		Optional[tuple[int, int]]: The index of the break point and the direction of the section at it, or None if every candidate continues the section.
+	"""
+	section_y_values = y_values[section_start:stop]
+	
+	last_indexes = numpy.arange(next_index - 1, stop - 1)
+	lengths = last_indexes - section_start + 1
+	
+	directions = get_directions(
+			x_values[last_indexes] - x_values[section_start],
+			y_values[last_indexes] - y_values[section_start],
+			angle_sensitivity,
+			"tangent"
+	)
+	
+	candidate_y_values = y_values[next_index:stop]
+	
+	running_max = numpy.maximum.accumulate(section_y_values)[lengths - 1]
+	running_min = numpy.minimum.accumulate(section_y_values)[lengths - 1]
+	running_average = numpy.cumsum(section_y_values, dtype=numpy.float64)[lengths - 1] / lengths
+	tolerances = get_mean_tolerance(lengths, numpy.maximum(numpy.abs(running_max), numpy.abs(running_min)))
+	
+	low_sides = get_average_sides(candidate_y_values, running_average - tolerances, threshold_sensitivity, threshold_type)
+	high_sides = get_average_sides(candidate_y_values, running_average + tolerances, threshold_sensitivity, threshold_type)
+	
+	is_straight = (directions != DIRECTION_INCREASING) & (directions != DIRECTION_DECREASING)
+	is_undecided = is_straight & (
+			(low_sides[0] != high_sides[0])
+			| (low_sides[1] != high_sides[1])
+			| ~numpy.isfinite(tolerances)
+	)
+	
+	continues = numpy.where(
+			directions == DIRECTION_INCREASING,
+			candidate_y_values > get_decrease_sensitive_values(running_max, threshold_sensitivity, threshold_type),
+			numpy.where(
+					directions == DIRECTION_DECREASING,
+					candidate_y_values < get_increase_sensitive_values(running_min, threshold_sensitivity, threshold_type),
+					low_sides[0] | low_sides[1]
+			)
+	)
+	
+	for offset in numpy.flatnonzero(~continues | is_undecided).tolist():
+		break_index = next_index + offset
+	
+		if not is_undecided[offset] or not continues_straight_section(
+				y_values[break_index].item(),
+				running_average[offset].item(),
+				numpy.inf,
+				lambda: y_values[section_start:break_index],
+				threshold_sensitivity,
+				threshold_type
+		):
+			return break_index, int(directions[offset])
+	
+	return None
+
+
+def iterate_section_breaks(
+		x_values: numpy.ndarray,
+		y_values: numpy.ndarray,
+		threshold_sensitivity: float = 0.0,
+		threshold_type: Literal["absolute", "relative"] = "absolute",
+		angle_sensitivity: float = 0.0,
+		block_size: int = 64,
+		section_start: int = 0,
+		next_index: Optional[int] = None,
+		stop: Optional[int] = None
+) -> Generator[tuple[int, int, int, int], Any, None]:
+	"""
+	Yields every section break that Graph.get_sections makes while processing the points in [next_index, stop).
+
+	A section always covers a contiguous range of points, so the segmentation state is fully described by the
+	start index of the open section and the index of the next point to process. This makes it possible to
+	resume the segmentation from any state, e.g. to continue a chunk of a longer series.
+
+	The first block_size candidates of every section are scanned with a light scalar loop (short sections are
+	dominated by their boundaries anyway). If the section is still open, the candidates are examined in numpy
+	blocks that double every time they are exhausted without finding a boundary: running extrema, prefix sums
+	and the direction of the section for every candidate length are computed at once, so Python code runs only
+	once per block and at section boundaries.
+
+	Points of straight sections are compared to the numpy.mean of the section (see get_segmentation_mean), which is only
+	computed for points closer to a threshold than the rounding error of the running sums, so both engines make the same
+	decisions for any y-values.
+
+	Args:
+		x_values (numpy.ndarray): The x-values of the points.
+		y_values (numpy.ndarray): The y-values of the points.
+		threshold_sensitivity (float): The threshold sensitivity value. Defaults to 0.0.
+		threshold_type (Literal["absolute", "relative"]): The threshold sensitivity type. Defaults to "absolute".
+		angle_sensitivity (float): The angle sensitivity in degrees. Defaults to 0.0.
+		block_size (int): The number of candidates scanned one by one and the initial size of numpy blocks. Defaults to 64.
+		section_start (int): The start index of the open section. Defaults to 0.
+		next_index (Optional[int]): The index of the next point to process. Defaults to section_start + 1.
+		stop (Optional[int]): The index after the last point to process. Defaults to the number of points.
+
+	Returns:
+		Generator[tuple[int, int, int, int], Any, None]: A generator of (start, stop, next_section_start, break_index) tuples: the bounds of the finished section, the start of the new open section and the index of the point that caused the break. After a break the next point to process is break_index + 1.
+
+	Raises:
+		ValueError: If block_size is less than 1.
+	"""
+	if block_size < 1:
+		raise ValueError("block_size must be >= 1")
+	
+	if stop is None:
+		stop = len(y_values)
+	
+	if next_index is None:
+		next_index = section_start + 1
+	
+	while next_index < stop:
+		if next_index - section_start < 2:
+			next_index += 1
+			continue
+	
+		block_end = min(stop, next_index + block_size)
+		section_break = _find_section_break_scalar(
+				x_values,
+				y_values,
+				section_start,
+				next_index,
+				block_end,
+				threshold_sensitivity,
+				threshold_type,
+				angle_sensitivity
+		)
+		current_block_size = block_size
+	
+		while section_break is None and block_end < stop:
+			next_index = block_end
+			current_block_size *= 2
+			block_end = min(stop, next_index + current_block_size)
+	
+			section_break = _find_section_break_vectorized(
+					x_values,
+					y_values,
+					section_start,
+					next_index,
+					block_end,
+					threshold_sensitivity,
+					threshold_type,
+					angle_sensitivity
+			)
+	
+		if section_break is None:
+			return
+	
+		break_index, direction = section_break
+	
+		if direction == DIRECTION_INCREASING:
+			extremum_index = section_start + int(numpy.argmax(y_values[section_start:break_index]))
+	
+			yield section_start, extremum_index + 1, extremum_index, break_index
+	
+			section_start = extremum_index
+		elif direction == DIRECTION_DECREASING:
+			extremum_index = section_start + int(numpy.argmin(y_values[section_start:break_index]))
+	
+			yield section_start, extremum_index + 1, extremum_index, break_index
+	
+			section_start = extremum_index
+		else:
+			yield section_start, break_index, break_index, break_index
+	
+			section_start = break_index
+	
+		next_index = break_index + 1
+
+
+def iterate_section_bounds(
+		x_values: numpy.ndarray,
+		y_values: numpy.ndarray,
+		threshold_sensitivity: float = 0.0,
+		threshold_type: Literal["absolute", "relative"] = "absolute",
+		angle_sensitivity: float = 0.0,
+		block_size: int = 64
+) -> Generator[tuple[int, int], Any, None]:
+	"""
+	Yields the bounds of the sections that Graph.get_sections produces for the given x/y arrays.
+
+	See iterate_section_breaks for the details of the algorithm.
+
+	Args:
+		x_values (numpy.ndarray): The x-values of the points.
+		y_values (numpy.ndarray): The y-values of the points.
+		threshold_sensitivity (float): The threshold sensitivity value. Defaults to 0.0.
+		threshold_type (Literal["absolute", "relative"]): The threshold sensitivity type. Defaults to "absolute".
+		angle_sensitivity (float): The angle sensitivity in degrees. Defaults to 0.0.
+		block_size (int): The number of candidates scanned one by one and the initial size of numpy blocks. Defaults to 64.
+
+	Returns:
+		Generator[tuple[int, int], Any, None]: A generator of (start, stop) index pairs. Consecutive sections that were split at an extremum share that point.
+
+	Raises:
+		ValueError: If block_size is less than 1.
+	"""
+	if block_size < 1:
+		raise ValueError("block_size must be >= 1")
+	
+	if len(y_values) == 0:
+		return
+	
+	section_start = 0
+	
+	for start, stop, section_start, _ in iterate_section_breaks(
+			x_values,
+			y_values,
+			threshold_sensitivity,
+			threshold_type,
+			angle_sensitivity,
+			block_size
+	):
+		yield start, stop
+	
+	yield section_start, len(y_values)
+
+
+def get_section_bounds(
+		x_values: numpy.ndarray,
+		y_values: numpy.ndarray,
+		threshold_sensitivity: float = 0.0,
+		threshold_type: Literal["absolute", "relative"] = "absolute",
+		angle_sensitivity: float = 0.0,
+		block_size: int = 64
+) -> numpy.ndarray:
+	"""
+	Returns the bounds of the sections that Graph.get_sections produces for the given x/y arrays.
+
+	Args:
+		x_values (numpy.ndarray): The x-values of the points.
+		y_values (numpy.ndarray): The y-values of the points.
+		threshold_sensitivity (float): The threshold sensitivity value. Defaults to 0.0.
+		threshold_type (Literal["absolute", "relative"]): The threshold sensitivity type. Defaults to "absolute".
+		angle_sensitivity (float): The angle sensitivity in degrees. Defaults to 0.0.
+		block_size (int): The initial number of candidate points examined at once. Defaults to 64.
+
+	Returns:
+		numpy.ndarray: An int64 array of shape (num_sections, 2) with the start and stop index of every section.
+
+	:Usage:
+		get_section_bounds(numpy.arange(6), numpy.array([1, 2, 3, 2, 1, 2]))
+		array([[0, 3],
+			   [2, 5],
+			   [4, 6]])
+	"""
+	bounds = list(
+			iterate_section_bounds(
+					x_values,
+					y_values,
+					threshold_sensitivity,
+					threshold_type,
+					angle_sensitivity,
+					block_size
+			)
+	)
+	
+	return numpy.array(bounds, dtype=numpy.int64).reshape(-1, 2)
+
+
+def get_section_summaries(
+		x_values: numpy.ndarray,
+		y_values: numpy.ndarray,
+		bounds: numpy.ndarray,
+		angle_sensitivity: float = 0.0
+) -> numpy.ndarray:
+	"""
+	Summarizes sections given by their bounds into one structured array.
+
+	Every row has the SECTION_SUMMARY_DTYPE fields: the start and stop indexes, the direction code, the indexes of the
+	first minimum and maximum (in the whole arrays, like GraphSection.min_index) and their values, the mean and the angle
+	in degrees. Sections with less than two points get DIRECTION_NONE and a NaN angle, as GraphSection returns None for
+	them. The section ranges are gathered into one array and reduced with numpy.ufunc.reduceat, so there is no Python
+	loop over the sections.
+
+	Args:
+		x_values (numpy.ndarray): The x-values of the points.
+		y_values (numpy.ndarray): The y-values of the points.
+		bounds (numpy.ndarray): An int array of shape (num_sections, 2) with non-empty (start, stop) index ranges, as returned by get_section_bounds.
+		angle_sensitivity (float): The angle sensitivity in degrees. Defaults to 0.0.
+
+	Returns:
+		numpy.ndarray: A structured array of SECTION_SUMMARY_DTYPE with one row per section.
+
+	:Usage:
+		summaries = get_section_summaries(numpy.arange(4), numpy.array([1, 3, 3, 0]), numpy.array([[0, 2], [1, 4]]))
+		summaries[["direction", "max_index", "mean"]].tolist()
+		[(1, 1, 2.0), (2, 1, 2.0)]
+	"""
+	bounds = numpy.asarray(bounds, dtype=numpy.int64).reshape(-1, 2)
+	summaries = numpy.empty(len(bounds), dtype=SECTION_SUMMARY_DTYPE)
+	
+	if len(bounds) == 0:
+		return summaries
+	
+	starts, stops = bounds[:, 0], bounds[:, 1]
+	lengths = stops - starts
+	offsets = numpy.concatenate([[0], numpy.cumsum(lengths)[:-1]])
+	
+	section_ids = numpy.repeat(numpy.arange(len(bounds)), lengths)
+	indexes = numpy.arange(offsets[-1] + lengths[-1]) - offsets[section_ids] + starts[section_ids]
+	values = numpy.asarray(y_values, dtype=numpy.float64)[indexes]
+	
+	summaries["start"], summaries["stop"] = starts, stops
+	summaries["mean"] = numpy.add.reduceat(values, offsets) / lengths
+	
+	for field, reduce in [("min", numpy.minimum), ("max", numpy.maximum)]:
+		extremes = reduce.reduceat(values, offsets)
+		hits = numpy.flatnonzero(values == extremes[section_ids])
+		summaries[f"{field}_index"] = indexes[hits[numpy.searchsorted(section_ids[hits], numpy.arange(len(bounds)))]]
+		summaries[f"{field}_value"] = extremes
+	
+	delta_x = numpy.asarray(x_values)[stops - 1] - numpy.asarray(x_values)[starts]
+	delta_y = numpy.asarray(y_values)[stops - 1] - numpy.asarray(y_values)[starts]
+	
+	summaries["angle"] = numpy.where(lengths >= 2, get_angles(delta_x, delta_y), numpy.nan)
+	summaries["direction"] = numpy.where(
+			lengths >= 2,
+			get_directions(delta_x, delta_y, angle_sensitivity, "tangent"),
+			DIRECTION_NONE
+	)
+	
+	return summaries
\ No newline at end of file
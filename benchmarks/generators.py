@@ -0,0 +1,122 @@
+import numpy
+from typing import Callable
+
+
+def get_random_walk(num_points: int, seed: int = 0) -> tuple[numpy.ndarray, numpy.ndarray]:
+	"""
+	Generates a random walk with normally distributed steps.
+
+	Args:
+		num_points (int): The number of points.
+		seed (int): The random seed. Defaults to 0.
+
+	Returns:
+		tuple[numpy.ndarray, numpy.ndarray]: The int64 x-values (0, 1, 2, ...) and the float64 y-values.
+	"""
+	random_state = numpy.random.RandomState(seed)
+	
+	return numpy.arange(num_points, dtype=numpy.int64), numpy.cumsum(random_state.standard_normal(num_points))
+
+
+def get_sine_with_noise(
+		num_points: int,
+		seed: int = 0,
+		period: int = 1000,
+		noise: float = 0.1
+) -> tuple[numpy.ndarray, numpy.ndarray]:
+	"""
+	Generates a sine wave with added gaussian noise.
+
+	Args:
+		num_points (int): The number of points.
+		seed (int): The random seed. Defaults to 0.
+		period (int): The number of points per period. Defaults to 1000.
+		noise (float): The standard deviation of the noise. Defaults to 0.1.
+
+	Returns:
+		tuple[numpy.ndarray, numpy.ndarray]: The int64 x-values (0, 1, 2, ...) and the float64 y-values.
+	"""
+	random_state = numpy.random.RandomState(seed)
+	x_values = numpy.arange(num_points, dtype=numpy.int64)
+	
+	return x_values, numpy.sin(2 * numpy.pi * x_values / period) + noise * random_state.standard_normal(num_points)
+
+
+def get_steps(
+		num_points: int,
+		seed: int = 0,
+		mean_step_length: int = 100
+) -> tuple[numpy.ndarray, numpy.ndarray]:
+	"""
+	Generates a step function: runs of equal values with random lengths and levels.
+
+	Args:
+		num_points (int): The number of points.
+		seed (int): The random seed. Defaults to 0.
+		mean_step_length (int): The mean number of points per step. Defaults to 100.
+
+	Returns:
+		tuple[numpy.ndarray, numpy.ndarray]: The int64 x-values (0, 1, 2, ...) and the int64 y-values.
+	"""
+	random_state = numpy.random.RandomState(seed)
+	step_lengths = random_state.geometric(1 / mean_step_length, num_points // mean_step_length + 1)
+	
+	while step_lengths.sum() < num_points:
+		step_lengths = numpy.concatenate([step_lengths, random_state.geometric(1 / mean_step_length, len(step_lengths))])
+	
+	levels = random_state.randint(0, 100, len(step_lengths))
+	
+	return numpy.arange(num_points, dtype=numpy.int64), numpy.repeat(levels, step_lengths)[:num_points]
+
+
+def get_sawtooth(num_points: int, seed: int = 0, period: int = 500) -> tuple[numpy.ndarray, numpy.ndarray]:
+	"""
+	Generates a sawtooth wave: linear ramps that drop back to zero, starting at a random phase.
+
+	Args:
+		num_points (int): The number of points.
+		seed (int): The random seed. Defaults to 0.
+		period (int): The number of points per ramp. Defaults to 500.
+
+	Returns:
+		tuple[numpy.ndarray, numpy.ndarray]: The int64 x-values (0, 1, 2, ...) and the float64 y-values.
+	"""
+	random_state = numpy.random.RandomState(seed)
+	x_values = numpy.arange(num_points, dtype=numpy.int64)
+	
+	return x_values, ((x_values + random_state.randint(0, period)) % period) / period
+
+
+def get_flat_with_spikes(
+		num_points: int,
+		seed: int = 0,
+		spike_probability: float = 0.001,
+		spike_height: float = 10.0
+) -> tuple[numpy.ndarray, numpy.ndarray]:
+	"""
+	Generates a flat line with rare single-point spikes of random sign.
+
+	Args:
+		num_points (int): The number of points.
+		seed (int): The random seed. Defaults to 0.
+		spike_probability (float): The probability of a point being a spike. Defaults to 0.001.
+		spike_height (float): The maximum absolute height of a spike. Defaults to 10.0.
+
+	Returns:
+		tuple[numpy.ndarray, numpy.ndarray]: The int64 x-values (0, 1, 2, ...) and the float64 y-values.
+	"""
+	random_state = numpy.random.RandomState(seed)
+	y_values = numpy.zeros(num_points)
+	spikes = random_state.random_sample(num_points) < spike_probability
+	y_values[spikes] = random_state.uniform(-spike_height, spike_height, int(spikes.sum()))
+	
+	return numpy.arange(num_points, dtype=numpy.int64), y_values
+
+
+GENERATORS: dict[str, Callable[[int, int], tuple[numpy.ndarray, numpy.ndarray]]] = {
+	"random_walk": get_random_walk,
+	"sine_with_noise": get_sine_with_noise,
+	"steps": get_steps,
+	"sawtooth": get_sawtooth,
+	"flat_with_spikes": get_flat_with_spikes,
+}
\ No newline at end of file
@@ -0,0 +1,300 @@
+import argparse
+import json
+import numpy
+import pathlib
+import platform
+import sys
+import time
+from benchmarks.generators import GENERATORS
+from PyVarTools.math.graph_2D import (
+	Graph,
+	GraphPoint
+)
+from typing import (
+	Any,
+	Callable,
+	Optional
+)
+
+
+SIZES = [1_000, 10_000, 100_000, 1_000_000, 10_000_000]
+
+
+def get_points(x_values: numpy.ndarray, y_values: numpy.ndarray) -> list[GraphPoint]:
+	"""
+	Converts x/y arrays to a list of GraphPoints.
+
+	Args:
+		x_values (numpy.ndarray): The x-values.
+		y_values (numpy.ndarray): The y-values.
+
+	Returns:
+		list[GraphPoint]: The points.
+	"""
+	return [GraphPoint(x, y) for x, y in zip(x_values.tolist(), y_values.tolist())]
+
+
+def add_points(points: list[GraphPoint], storage: str) -> Graph:
+	"""
+	Builds a graph by adding the points one at a time.
+
+	Args:
+		points (list[GraphPoint]): The points.
+		storage (str): The storage of the graph.
+
+	Returns:
+		Graph: The graph.
+	"""
+	graph = Graph(storage=storage)
+	
+	for point in points:
+		graph.add(point)
+	
+	return graph
+
+
+def prepare_add(storage: str) -> Callable[[numpy.ndarray, numpy.ndarray, int], Callable[[], Any]]:
+	"""
+	Returns a benchmark preparation that converts the arrays to points and times adding them to a graph.
+
+	Args:
+		storage (str): The storage of the graph.
+
+	Returns:
+		Callable[[numpy.ndarray, numpy.ndarray, int], Callable[[], Any]]: The preparation function.
+	"""
+	def prepare(x_values: numpy.ndarray, y_values: numpy.ndarray, seed: int) -> Callable[[], Any]:
+		points = get_points(x_values, y_values)
+		
+		return lambda: add_points(points, storage)
+	
+	return prepare
+
+
+def prepare_range_stats(graph: Graph, seed: int, num_queries: int = 1000) -> Callable[[], Any]:
+	"""
+	Builds the range index of a graph and returns a function that runs random range queries.
+
+	Args:
+		graph (Graph): The graph.
+		seed (int): The random seed of the query bounds.
+		num_queries (int): The number of queries. Defaults to 1000.
+
+	Returns:
+		Callable[[], Any]: The function to time.
+	"""
+	bounds = numpy.sort(numpy.random.RandomState(seed).randint(0, len(graph) + 1, (num_queries, 2)), axis=1).tolist()
+	graph.range_stats(0, 1)
+	
+	return lambda: [graph.range_stats(start, stop) for start, stop in bounds]
+
+
+# Every benchmark maps to (per_point, prepare): prepare(x_values, y_values, seed) does the untimed setup and returns
+# the function to time, per_point marks benchmarks with Python work per point or per section.
+BENCHMARKS: dict[str, tuple[bool, Callable[[numpy.ndarray, numpy.ndarray, int], Callable[[], Any]]]] = {
+	"from_arrays_columnar": (False, lambda x, y, seed: lambda: Graph.from_arrays(x, y)),
+	"from_arrays_points": (True, lambda x, y, seed: lambda: Graph.from_arrays(x, y, storage="points")),
+	"add_points": (True, prepare_add("points")),
+	"add_columnar": (True, prepare_add("columnar")),
+	"calculate_average": (False, lambda x, y, seed: Graph.from_arrays(x, y).calculate_average),
+	"range_stats_1000_queries": (False, lambda x, y, seed: prepare_range_stats(Graph.from_arrays(x, y), seed)),
+	"rolling_100": (False, lambda x, y, seed: lambda: Graph.from_arrays(x, y).rolling(100)),
+	"get_sections_iterative": (True, lambda x, y, seed: lambda: list(Graph.from_arrays(x, y).get_sections())),
+	"get_sections_vectorized": (
+		True,
+		lambda x, y, seed: lambda: list(Graph.from_arrays(x, y).get_sections(engine="vectorized"))
+	),
+	"get_sections_array": (
+		True,
+		lambda x, y, seed: lambda: Graph.from_arrays(x, y).get_sections(engine="vectorized", output="array")
+	),
+}
+
+
+def time_function(function: Callable[[], Any], repeat: int) -> list[float]:
+	"""
+	Times a function several times.
+
+	Args:
+		function (Callable[[], Any]): The function to time.
+		repeat (int): The number of runs.
+
+	Returns:
+		list[float]: The duration of every run in seconds.
+	"""
+	durations = []
+	
+	for _ in range(repeat):
+		start_time = time.perf_counter()
+		function()
+		durations.append(time.perf_counter() - start_time)
+	
+	return durations
+
+
+def run_benchmarks(
+		sizes: list[int],
+		generators: list[str],
+		benchmarks: list[str],
+		repeat: int = 3,
+		seed: int = 0,
+		max_loop_size: int = 1_000_000
+) -> dict[str, Any]:
+	"""
+	Runs the benchmarks on every generated series.
+
+	Benchmarks that do Python work per point or per section are skipped for series longer than max_loop_size, so the
+	largest sizes only measure the numpy paths unless max_loop_size is raised.
+
+	Args:
+		sizes (list[int]): The numbers of points.
+		generators (list[str]): The names of the series generators (keys of generators.GENERATORS).
+		benchmarks (list[str]): The names of the benchmarks (keys of BENCHMARKS).
+		repeat (int): The number of runs of every benchmark. Defaults to 3.
+		seed (int): The random seed of the generators. Defaults to 0.
+		max_loop_size (int): The maximum size for per-point benchmarks. Defaults to 1_000_000.
+
+	Returns:
+		dict[str, Any]: The environment under "metadata" and one record per benchmark run under "results".
+
+	Raises:
+		ValueError: If a generator or benchmark name is unknown or repeat is less than 1.
+	"""
+	unknown_names = [name for name in generators if name not in GENERATORS] + [name for name in benchmarks if name not in BENCHMARKS]
+	
+	if unknown_names:
+		raise ValueError(f"unknown generators or benchmarks: {', '.join(unknown_names)}")
+	
+	if repeat < 1:
+		raise ValueError("repeat must be >= 1")
+	
+	results = []
+	
+	for generator in generators:
+		for size in sizes:
+			x_values, y_values = GENERATORS[generator](size, seed)
+	
+			for benchmark in benchmarks:
+				per_point, prepare = BENCHMARKS[benchmark]
+				record = {"generator": generator, "size": size, "benchmark": benchmark}
+	
+				if per_point and size > max_loop_size:
+					results.append({**record, "skipped": True})
+					continue
+	
+				durations = time_function(prepare(x_values, y_values, seed), repeat)
+				results.append(
+						{
+							**record,
+							"skipped": False,
+							"best_seconds": min(durations),
+							"mean_seconds": sum(durations) / len(durations),
+							"repeat": repeat,
+						}
+				)
+	
+	return {
+		"metadata": {
+			"python": sys.version.split()[0],
+			"numpy": numpy.__version__,
+			"platform": platform.platform(),
+			"seed": seed,
+			"created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+		},
+		"results": results,
+	}
+
+
+def get_regressions(results: dict[str, Any], baseline: dict[str, Any], tolerance: float = 0.2) -> list[dict[str, Any]]:
+	"""
+	Finds the benchmarks that got slower than in a baseline run.
+
+	Args:
+		results (dict[str, Any]): The results of run_benchmarks.
+		baseline (dict[str, Any]): The results of an earlier run_benchmarks.
+		tolerance (float): The allowed relative slowdown of the best time. Defaults to 0.2.
+
+	Returns:
+		list[dict[str, Any]]: The generator, size, benchmark, baseline and current best times and their ratio of every regression.
+	"""
+	baseline_seconds = {
+		(record["generator"], record["size"], record["benchmark"]): record["best_seconds"]
+		for record in baseline["results"]
+		if not record["skipped"]
+	}
+	regressions = []
+	
+	for record in results["results"]:
+		key = (record["generator"], record["size"], record["benchmark"])
+	
+		if record["skipped"] or key not in baseline_seconds:
+			continue
+	
+		ratio = record["best_seconds"] / baseline_seconds[key] if baseline_seconds[key] > 0 else 1.0
+	
+		if ratio > 1 + tolerance:
+			regressions.append(
+					{
+						"generator": record["generator"],
+						"size": record["size"],
+						"benchmark": record["benchmark"],
+						"baseline_seconds": baseline_seconds[key],
+						"best_seconds": record["best_seconds"],
+						"ratio": ratio,
+					}
+			)
+	
+	return regressions
+
+
+def main(arguments: Optional[list[str]] = None) -> int:
+	"""
+	Runs the benchmarks from the command line and writes the results as JSON.
+
+	Args:
+		arguments (Optional[list[str]]): The command line arguments. Defaults to sys.argv[1:].
+
+	Returns:
+		int: The exit code, 1 if a baseline was given and a benchmark regressed, otherwise 0.
+
+	:Usage:
+		python -m benchmarks.graph_2D --sizes 1000 100000 --output results.json
+		python -m benchmarks.graph_2D --output new.json --baseline results.json
+	"""
+	parser = argparse.ArgumentParser(description="Benchmarks PyVarTools.math.graph_2D on synthetic series.")
+	parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+	parser.add_argument("--generators", nargs="+", default=list(GENERATORS), choices=list(GENERATORS))
+	parser.add_argument("--benchmarks", nargs="+", default=list(BENCHMARKS), choices=list(BENCHMARKS))
+	parser.add_argument("--repeat", type=int, default=3)
+	parser.add_argument("--seed", type=int, default=0)
+	parser.add_argument("--max-loop-size", type=int, default=1_000_000)
+	parser.add_argument("--output", type=pathlib.Path, default=None, help="The JSON file, stdout if not given.")
+	parser.add_argument("--baseline", type=pathlib.Path, default=None, help="A JSON file of an earlier run to compare with.")
+	parser.add_argument("--tolerance", type=float, default=0.2)
+	parsed_arguments = parser.parse_args(arguments)
+	
+	results = run_benchmarks(
+			parsed_arguments.sizes,
+			parsed_arguments.generators,
+			parsed_arguments.benchmarks,
+			parsed_arguments.repeat,
+			parsed_arguments.seed,
+			parsed_arguments.max_loop_size
+	)
+	
+	if parsed_arguments.baseline is not None:
+		baseline = json.loads(parsed_arguments.baseline.read_text(encoding="utf-8"))
+		results["regressions"] = get_regressions(results, baseline, parsed_arguments.tolerance)
+	
+	output = json.dumps(results, indent=4)
+	
+	if parsed_arguments.output is None:
+		print(output)
+	else:
+		parsed_arguments.output.write_text(output, encoding="utf-8")
+	
+	return 1 if results.get("regressions") else 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
\ No newline at end of file
@@ -30,6 +30,6 @@ setup(
 		description=get_description(),
 		long_description=get_long_description(),
 		long_description_content_type="text/markdown",
-		packages=find_packages(exclude=["unit_tests*"]),
+		packages=find_packages(exclude=["unit_tests*", "benchmarks*"]),
 		install_requires=get_install_requires(),
 )
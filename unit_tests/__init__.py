@@ -1,3 +1,4 @@
+from unit_tests.benchmarks import benchmarks_test_suite
 from unit_tests.math import math_test_suite
 from unittest import (
 	TestSuite,
@@ -10,6 +11,7 @@ def main_test_suite() -> TestSuite:
 	
 	suite.addTest(math_test_suite())
 	suite.addTest(python_instances_tools_test_suite())
+	suite.addTest(benchmarks_test_suite())
 	
 	return suite
 
@@ -0,0 +1,18 @@
+from unittest import (
+	TestSuite,
+	TextTestRunner
+)
+from unit_tests.benchmarks.graph_2D import graph_2D_test_suite
+
+
+def benchmarks_test_suite() -> TestSuite:
+	suite = TestSuite()
+	
+	suite.addTest(graph_2D_test_suite())
+	
+	return suite
+
+
+if __name__ == "__main__":
+	runner = TextTestRunner()
+	runner.run(benchmarks_test_suite())
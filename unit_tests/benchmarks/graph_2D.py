@@ -0,0 +1,111 @@
+import json
+import numpy
+import pathlib
+import tempfile
+from benchmarks.generators import GENERATORS
+from benchmarks.graph_2D import (
+	BENCHMARKS,
+	main
+)
+from parameterized import parameterized
+from unittest import (
+	TestCase,
+	TestLoader,
+	TestSuite,
+	TextTestRunner
+)
+
+
+RECORD_KEYS = {"generator", "size", "benchmark", "skipped", "best_seconds", "mean_seconds", "repeat"}
+REGRESSION_KEYS = {"generator", "size", "benchmark", "baseline_seconds", "best_seconds", "ratio"}
+
+
+def run_main(directory: str, *arguments: str) -> tuple[int, dict]:
+	path = pathlib.Path(directory, "results.json")
+	exit_code = main(["--sizes", "200", "--repeat", "1", "--output", str(path), *arguments])
+	
+	return exit_code, json.loads(path.read_text(encoding="utf-8"))
+
+
+class TestGenerators(TestCase):
+	@parameterized.expand([(name,) for name in GENERATORS])
+	def test_series(self, name):
+		x_values, y_values = GENERATORS[name](500, 1)
+		
+		self.assertEqual((len(x_values), len(y_values)), (500, 500))
+		self.assertEqual(x_values.tolist(), list(range(500)))
+		self.assertTrue(numpy.all(numpy.isfinite(y_values)))
+		self.assertEqual(GENERATORS[name](500, 1)[1].tolist(), y_values.tolist())
+
+
+class TestMain(TestCase):
+	def test_json_schema(self):
+		with tempfile.TemporaryDirectory() as directory:
+			exit_code, results = run_main(
+					directory,
+					"--generators", "random_walk", "steps",
+					"--benchmarks", "from_arrays_columnar", "get_sections_iterative",
+					"--max-loop-size", "100"
+			)
+		
+		self.assertEqual(exit_code, 0)
+		self.assertEqual(set(results), {"metadata", "results"})
+		self.assertEqual(set(results["metadata"]), {"python", "numpy", "platform", "seed", "created"})
+		self.assertEqual(
+				[(record["generator"], record["benchmark"], record["skipped"]) for record in results["results"]],
+				[
+					("random_walk", "from_arrays_columnar", False),
+					("random_walk", "get_sections_iterative", True),
+					("steps", "from_arrays_columnar", False),
+					("steps", "get_sections_iterative", True),
+				]
+		)
+		
+		for record in results["results"]:
+			self.assertEqual(set(record), RECORD_KEYS if not record["skipped"] else {"generator", "size", "benchmark", "skipped"})
+			self.assertEqual(record["size"], 200)
+		
+			if not record["skipped"]:
+				self.assertGreaterEqual(record["mean_seconds"], record["best_seconds"])
+	
+	@parameterized.expand([(1e-12, 1), (1e9, 0)])
+	def test_baseline(self, baseline_seconds, expected_exit_code):
+		with tempfile.TemporaryDirectory() as directory:
+			baseline = {
+				"results": [
+					{"generator": "sawtooth", "size": 200, "benchmark": name, "skipped": False, "best_seconds": baseline_seconds}
+					for name in BENCHMARKS
+				]
+			}
+			baseline_path = pathlib.Path(directory, "baseline.json")
+			baseline_path.write_text(json.dumps(baseline), encoding="utf-8")
+		
+			exit_code, results = run_main(
+					directory,
+					"--generators", "sawtooth",
+					"--benchmarks", "calculate_average",
+					"--baseline", str(baseline_path),
+					"--tolerance", "0"
+			)
+		
+		self.assertEqual(exit_code, expected_exit_code)
+		self.assertEqual(len(results["regressions"]), expected_exit_code)
+		
+		for regression in results["regressions"]:
+			self.assertEqual(set(regression), REGRESSION_KEYS)
+			self.assertEqual(regression["benchmark"], "calculate_average")
+
+
+def graph_2D_test_suite() -> TestSuite:
+	suite = TestSuite()
+	test_loader = TestLoader()
+	
+	suite.addTest(test_loader.loadTestsFromTestCase(TestGenerators))
+	suite.addTest(test_loader.loadTestsFromTestCase(TestMain))
+	
+	return suite
+
+
+if __name__ == "__main__":
+	runner = TextTestRunner()
+	runner.run(graph_2D_test_suite())
@@ -4,6 +4,15 @@ from unittest import (
 	TextTestRunner
 )
 from unit_tests.math.basic_vars import basic_vars_test_suite
+from unit_tests.math.graph_2D import graph_2D_test_suite
+from unit_tests.math.graph_2D_align import graph_2D_align_test_suite
+from unit_tests.math.graph_2D_compression import graph_2D_compression_test_suite
+from unit_tests.math.graph_2D_downsample import graph_2D_downsample_test_suite
+from unit_tests.math.graph_2D_extrema import graph_2D_extrema_test_suite
+from unit_tests.math.graph_2D_merge import graph_2D_merge_test_suite
+from unit_tests.math.graph_2D_parallel import graph_2D_parallel_test_suite
+from unit_tests.math.graph_2D_range import graph_2D_range_test_suite
+from unit_tests.math.graph_2D_vectorized import graph_2D_vectorized_test_suite
 
 
 def math_test_suite() -> TestSuite:
@@ -11,6 +20,15 @@ def math_test_suite() -> TestSuite:
 	
 	suite.addTest(basic_vars_test_suite())
 	suite.addTest(vars_test_suite())
+	suite.addTest(graph_2D_test_suite())
+	suite.addTest(graph_2D_vectorized_test_suite())
+	suite.addTest(graph_2D_parallel_test_suite())
+	suite.addTest(graph_2D_range_test_suite())
+	suite.addTest(graph_2D_downsample_test_suite())
+	suite.addTest(graph_2D_extrema_test_suite())
+	suite.addTest(graph_2D_compression_test_suite())
+	suite.addTest(graph_2D_merge_test_suite())
+	suite.addTest(graph_2D_align_test_suite())
 	
 	return suite
 
@@ -0,0 +1,1110 @@
+import asyncio
+import numpy
+import pathlib
+import pickle
+import tempfile
+from pandas import DataFrame
+from parameterized import parameterized
+from PyVarTools.math.graph_2D_compression import SwingingDoorCompression
+from PyVarTools.math.graph_2D import (
+	Graph,
+	GraphPoint,
+	GraphSection,
+	RunningStatistics,
+	SectionDetector,
+	SegmentationStatistics,
+	SlidingStatistics,
+	ThresholdSensitivity,
+	get_sections_async
+)
+from unittest import (
+	TestCase,
+	TestLoader,
+	TestSuite,
+	TextTestRunner,
+	mock
+)
+
+
+def create_points(y_values: list[float]) -> list[GraphPoint]:
+	return [GraphPoint(x, y) for x, y in enumerate(y_values)]
+
+
+def get_sections_points(graph: Graph, *args) -> list[list[tuple[float, float]]]:
+	return [[(point.x, point.y) for point in section.points] for section in graph.get_sections(*args)]
+
+
+SECTIONS_Y_VALUES = [
+	[1, 2, 3, 2, 1, 0, 1, 2, 2, 2, 5, 3],
+	[5, 5, 5, 5, 6, 7, 8, 1, 1, 0.5, 2.5, 2.5, 3],
+	[0.1, 0.4, 0.35, 0.2, 0.9, 1.3, 1.2, 1.25, 0.7, 0.1, 0.15, 0.2],
+]
+
+
+class TestGraphPoint(TestCase):
+	def test_compare_and_unpack(self):
+		point = GraphPoint(1, 2.5)
+		x, y = point
+		
+		self.assertEqual((x, y), (1, 2.5))
+		self.assertEqual(point, GraphPoint(1, 2.5))
+		self.assertNotEqual(point, GraphPoint(1, 2))
+		self.assertEqual(hash(point), hash(GraphPoint(1, 2.5)))
+		self.assertEqual(len({point, GraphPoint(1, 2.5), GraphPoint(1, 2)}), 2)
+		self.assertEqual({point: 1}[GraphPoint(1, 2.5)], 1)
+		self.assertEqual(pickle.loads(pickle.dumps(point)), point)
+	
+	def test_immutable(self):
+		point = GraphPoint(1, 2)
+		
+		with self.assertRaises(AttributeError):
+			point.x = 3
+		
+		with self.assertRaises(AttributeError):
+			del point.y
+		
+		self.assertEqual(point, GraphPoint(1, 2))
+	
+	def test_slots(self):
+		point = GraphPoint(1, 2)
+		
+		self.assertFalse(hasattr(point, "__dict__"))
+		
+		with self.assertRaises(AttributeError):
+			point.z = 3
+
+
+class TestRunningStatistics(TestCase):
+	@parameterized.expand([(y_values, block_size) for y_values in SECTIONS_Y_VALUES for block_size in [1, 5, 100]])
+	def test_add_values(self, y_values, block_size):
+		statistics = RunningStatistics()
+		
+		for start in range(0, len(y_values), block_size):
+			statistics.add_values(y_values[start:start + block_size])
+		
+		expected = RunningStatistics.from_values(y_values)
+		
+		self.assertEqual(statistics.count, expected.count)
+		self.assertAlmostEqual(statistics.mean, expected.mean)
+		self.assertAlmostEqual(statistics.variance, expected.variance)
+		self.assertEqual(statistics.min_index, expected.min_index)
+		self.assertEqual(statistics.max_index, expected.max_index)
+	
+	@parameterized.expand([(y_values,) for y_values in SECTIONS_Y_VALUES])
+	def test_add(self, y_values):
+		statistics = RunningStatistics()
+		
+		for y in y_values:
+			statistics.add(y)
+		
+		self.assertEqual(statistics.count, len(y_values))
+		self.assertAlmostEqual(statistics.mean, numpy.mean(y_values).item())
+		self.assertAlmostEqual(statistics.variance, numpy.var(y_values).item())
+		self.assertAlmostEqual(statistics.std, numpy.std(y_values).item())
+		self.assertEqual(statistics.min_index, int(numpy.argmin(y_values)))
+		self.assertEqual(statistics.max_index, int(numpy.argmax(y_values)))
+	
+	def test_compensated_sum(self):
+		statistics = RunningStatistics()
+		
+		for y in [1e16, 1.0, -1e16] * 1000:
+			statistics.add(y)
+		
+		self.assertEqual(statistics.sum, 1000.0)
+	
+	def test_empty(self):
+		statistics = RunningStatistics()
+		
+		self.assertIsNone(statistics.mean)
+		self.assertIsNone(statistics.variance)
+		self.assertIsNone(statistics.std)
+		self.assertIsNone(statistics.min_index)
+	
+	@parameterized.expand([(y_values,) for y_values in SECTIONS_Y_VALUES])
+	def test_from_values(self, y_values):
+		incremental = RunningStatistics()
+		
+		for y in y_values:
+			incremental.add(y)
+		
+		statistics = RunningStatistics.from_values(y_values)
+		
+		self.assertAlmostEqual(statistics.mean, incremental.mean)
+		self.assertAlmostEqual(statistics.variance, incremental.variance)
+		self.assertEqual(statistics.min_index, incremental.min_index)
+		self.assertEqual(statistics.max_index, incremental.max_index)
+	
+	def test_ties_keep_first_index(self):
+		statistics = RunningStatistics.from_values([2, 1, 3, 1, 3])
+		
+		for y in [1, 3]:
+			statistics.add(y)
+		
+		self.assertEqual(statistics.min_index, 1)
+		self.assertEqual(statistics.max_index, 2)
+
+
+class TestSlidingStatistics(TestCase):
+	@parameterized.expand([(y_values, window) for y_values in SECTIONS_Y_VALUES for window in [1, 2, 5]])
+	def test_window(self, y_values, window):
+		statistics = SlidingStatistics()
+		
+		for index, y in enumerate(y_values):
+			statistics.add(y)
+		
+			if statistics.count > window:
+				statistics.remove_first(y_values[index - window])
+		
+			expected = RunningStatistics.from_values(y_values[max(index - window + 1, 0):index + 1])
+		
+			self.assertEqual(statistics.count, expected.count)
+			self.assertAlmostEqual(statistics.mean, expected.mean)
+			self.assertAlmostEqual(statistics.variance, expected.variance)
+			self.assertEqual((statistics.min_index, statistics.min_value), (expected.min_index, expected.min_value))
+			self.assertEqual((statistics.max_index, statistics.max_value), (expected.max_index, expected.max_value))
+	
+	def test_remove_all(self):
+		statistics = SlidingStatistics.from_values([1, 2])
+		statistics.remove_first(1)
+		statistics.remove_first(2)
+		
+		self.assertEqual(statistics.count, 0)
+		self.assertIsNone(statistics.min_value)
+		
+		statistics.add(5)
+		
+		self.assertEqual((statistics.min_index, statistics.max_index, statistics.mean), (0, 0, 5.0))
+	
+	def test_remove_empty(self):
+		with self.assertRaises(ValueError):
+			SlidingStatistics().remove_first(1)
+
+
+class TestGraphSection(TestCase):
+	def test_add(self):
+		section = GraphSection(create_points([1, 2]))
+		section.add(GraphPoint(2, 6))
+		
+		self.assertEqual(section.max.y, 6)
+		self.assertAlmostEqual(section.average, 3.0)
+		self.assertAlmostEqual(section.variance, numpy.var([1, 2, 6]).item())
+		self.assertAlmostEqual(section.std, numpy.std([1, 2, 6]).item())
+	
+	def test_add_to_view(self):
+		graph = Graph(create_points([1, 2, 3]))
+		section = GraphSection.from_graph(graph, 0, 2)
+		section.add(GraphPoint(5, 6))
+		
+		self.assertEqual([(point.x, point.y) for point in section.points], [(0, 1), (1, 2), (5, 6)])
+		self.assertEqual(section.max_index, 2)
+		self.assertEqual(len(graph), 3)
+	
+	def test_empty(self):
+		with self.assertRaises(ValueError):
+			GraphSection([])
+		
+		with self.assertRaises(ValueError):
+			GraphSection.from_graph(Graph(create_points([1, 2])), 1, 1)
+		
+		with self.assertRaises(IndexError):
+			GraphSection.from_graph(Graph(create_points([1, 2])), 0, 3)
+	
+	@parameterized.expand([("points",), ("columnar",)])
+	def test_from_graph(self, storage):
+		graph = Graph(create_points([5, 1, 4, 2, 3, 0]), storage=storage)
+		section = GraphSection.from_graph(graph, 1, 5)
+		
+		self.assertEqual(len(section), 4)
+		self.assertEqual((section.min_index, section.max_index), (1, 2))
+		self.assertEqual((section.max.x, section.max.y), (2, 4))
+		self.assertAlmostEqual(section.average, 2.5)
+		self.assertEqual([(point.x, point.y) for point in section.points], [(1, 1), (2, 4), (3, 2), (4, 3)])
+		
+		section.remove_point_after_max()
+		
+		self.assertEqual((section.start, section.stop), (1, 3))
+		self.assertEqual([point.y for point in section.points], [1, 4])
+		self.assertEqual(len(graph), 6)
+	
+	def test_from_graph_shares_points(self):
+		graph = Graph(create_points([1, 2, 3]))
+		
+		for section in [GraphSection.from_graph(graph, 0, 3), *graph.get_sections()]:
+			self.assertIs(section.source, graph)
+			self.assertIs(section.points[0], graph.points[section.start])
+	
+	def test_assign_points(self):
+		graph = Graph(create_points([1, 2, 3]))
+		section = GraphSection.from_graph(graph, 0, 2)
+		points = create_points([4, 0, 2])
+		section.points = points
+		
+		self.assertIs(section.points, points)
+		self.assertEqual((section.start, section.stop), (0, 3))
+		self.assertEqual(section.min_index, 1)
+		self.assertAlmostEqual(section.average, 2.0)
+		self.assertEqual(section.get_direction(), "decreasing")
+		
+		with self.assertRaises(ValueError):
+			section.points = []
+	
+	def test_assign_statistics(self):
+		section = GraphSection.from_graph(Graph(create_points([1, 5, 3])), 0, 3)
+		section.min, section.max, section.average = GraphPoint(0, 0), GraphPoint(9, 9), 7.0
+		
+		self.assertEqual((section.min, section.max, section.average), (GraphPoint(0, 0), GraphPoint(9, 9), 7.0))
+		
+		section.add(GraphPoint(3, 2))
+		
+		self.assertEqual((section.min, section.max, section.average), (GraphPoint(0, 1), GraphPoint(1, 5), 2.75))
+		
+		section.max = GraphPoint(9, 9)
+		section.remove_point_after_max()
+		
+		self.assertEqual(section.max, GraphPoint(1, 5))
+	
+	def test_remove_point_after_max(self):
+		section = GraphSection(create_points([1, 4, 2, 3]))
+		
+		self.assertEqual([point.y for point in section.get_graph_points_after_max()], [4, 2, 3])
+		
+		section.remove_point_after_max()
+		
+		self.assertEqual([point.y for point in section.points], [1, 4])
+		self.assertAlmostEqual(section.average, 2.5)
+		self.assertAlmostEqual(section.variance, 2.25)
+
+
+class TestSectionDetector(TestCase):
+	@parameterized.expand([(batch_size,) for batch_size in [1, 2, 5, 100]])
+	def test_batches_match_get_sections(self, batch_size):
+		for y_values in SECTIONS_Y_VALUES:
+			points = create_points(y_values)
+			section_detector = SectionDetector(ThresholdSensitivity(0.2, "relative"), 5.0)
+			sections = []
+		
+			for i in range(0, len(points), batch_size):
+				sections.extend(section_detector.push(points[i:i + batch_size]))
+		
+			sections.extend(section_detector.flush())
+		
+			self.assertEqual(
+					[[(point.x, point.y) for point in section.points] for section in sections],
+					get_sections_points(Graph(points), ThresholdSensitivity(0.2, "relative"), 5.0)
+			)
+	
+	def test_emits_finished_sections_immediately(self):
+		section_detector = SectionDetector()
+		
+		self.assertEqual(section_detector.push([(0, 1), (1, 2), (2, 3)]), [])
+		
+		sections = section_detector.push((3, 2))
+		
+		self.assertEqual([[(point.x, point.y) for point in section.points] for section in sections], [[(0, 1), (1, 2), (2, 3)]])
+		self.assertEqual([(point.x, point.y) for point in section_detector.section.points], [(2, 3), (3, 2)])
+	
+	def test_flush(self):
+		section_detector = SectionDetector()
+		
+		self.assertEqual(section_detector.flush(), [])
+		
+		section_detector.push(GraphPoint(0, 1))
+		
+		self.assertEqual(len(section_detector.flush()), 1)
+		self.assertIsNone(section_detector.section)
+	
+	def test_invalid_angle_sensitivity(self):
+		with self.assertRaises(ValueError):
+			SectionDetector(angle_sensitivity=-1.0)
+
+
+class TestSegmentationStatistics(TestCase):
+	@parameterized.expand([(y_values,) for y_values in SECTIONS_Y_VALUES])
+	def test_graph(self, y_values):
+		statistics = SegmentationStatistics()
+		sections = list(Graph(create_points(y_values)).get_sections(ThresholdSensitivity(0.5), statistics=statistics))
+		
+		self.assertEqual(statistics.num_points, len(y_values))
+		self.assertEqual(statistics.num_sections, len(sections))
+		self.assertEqual(sum(statistics.branch_counts.values()), len(y_values) - 1)
+		self.assertEqual(sum(statistics.carry_over_sizes.values()), len(sections) - 1)
+	
+	@parameterized.expand([(y_values,) for y_values in SECTIONS_Y_VALUES])
+	def test_section_detector(self, y_values):
+		graph_statistics = SegmentationStatistics()
+		list(Graph(create_points(y_values)).get_sections(statistics=graph_statistics))
+		
+		statistics = SegmentationStatistics()
+		section_detector = SectionDetector(statistics=statistics)
+		section_detector.push(create_points(y_values))
+		section_detector.flush()
+		
+		self.assertEqual(statistics.num_points, graph_statistics.num_points)
+		self.assertEqual(statistics.num_sections, graph_statistics.num_sections)
+		self.assertEqual(statistics.branch_counts, graph_statistics.branch_counts)
+		self.assertEqual(statistics.carry_over_sizes, graph_statistics.carry_over_sizes)
+	
+	def test_example(self):
+		statistics = SegmentationStatistics()
+		list(Graph(create_points([1, 2, 3, 2, 1, 0, 1, 2])).get_sections(statistics=statistics))
+		
+		self.assertEqual(statistics.num_sections, 3)
+		self.assertEqual(statistics.branch_counts, {"none": 1, "increasing": 3, "decreasing": 3, "straight": 0})
+		self.assertEqual(statistics.carry_over_sizes, {1: 2})
+		self.assertEqual(statistics.mean_carry_over, 1.0)
+		self.assertEqual(statistics.to_dict()["max_carry_over"], 1)
+		self.assertGreater(statistics.branch_seconds["increasing"], 0.0)
+	
+	def test_empty(self):
+		statistics = SegmentationStatistics()
+		
+		self.assertEqual(statistics.max_carry_over, 0)
+		self.assertIsNone(statistics.mean_carry_over)
+	
+	def test_vectorized_engine(self):
+		with self.assertRaises(ValueError):
+			Graph(create_points([1, 2])).get_sections(engine="vectorized", statistics=SegmentationStatistics())
+
+
+class TestGetSectionsAsync(TestCase):
+	@staticmethod
+	async def iterate_points(points):
+		for point in points:
+			yield point
+	
+	async def collect_sections(self, points, *args, **kwargs):
+		return [
+			[(point.x, point.y) for point in section.points]
+			async for section in get_sections_async(self.iterate_points(points), *args, **kwargs)
+		]
+	
+	def test_invalid_batch_size(self):
+		with self.assertRaises(ValueError):
+			asyncio.run(self.collect_sections([], batch_size=0))
+	
+	@parameterized.expand([(y_values,) for y_values in SECTIONS_Y_VALUES])
+	def test_matches_get_sections(self, y_values):
+		points = [(point.x, point.y) for point in create_points(y_values)]
+		
+		self.assertEqual(
+				asyncio.run(self.collect_sections(points, ThresholdSensitivity(0.5))),
+				get_sections_points(Graph(create_points(y_values)), ThresholdSensitivity(0.5))
+		)
+	
+	def test_yields_to_event_loop(self):
+		async def run():
+			ticks = []
+			
+			async def tick():
+				while True:
+					ticks.append(len(ticks))
+					await asyncio.sleep(0)
+			
+			ticker = asyncio.create_task(tick())
+			await asyncio.sleep(0)
+			num_ticks_before = len(ticks)
+			
+			await self.collect_sections(create_points(list(range(100))), batch_size=10)
+			
+			ticker.cancel()
+			
+			return len(ticks) - num_ticks_before
+		
+		self.assertGreaterEqual(asyncio.run(run()), 9)
+
+
+class TestGraph(TestCase):
+	@parameterized.expand([("points",), ("columnar",)])
+	def test_add(self, storage):
+		graph = Graph(storage=storage)
+		
+		for point in create_points([3, 1, 4, 1, 5, 9, 2, 6]):
+			graph.add(point)
+		
+		self.assertEqual(len(graph), 8)
+		self.assertEqual((graph.min.x, graph.min.y), (1, 1))
+		self.assertEqual((graph.max.x, graph.max.y), (5, 9))
+		self.assertAlmostEqual(graph.average, 3.875)
+		self.assertAlmostEqual(graph.variance, numpy.var([3, 1, 4, 1, 5, 9, 2, 6]).item())
+		self.assertAlmostEqual(graph.std, numpy.std([3, 1, 4, 1, 5, 9, 2, 6]).item())
+	
+	@parameterized.expand([("points",), ("columnar",), ("ring",)])
+	def test_assign_points(self, storage):
+		graph = Graph(create_points([5, 6]), storage=storage, capacity=3 if storage == "ring" else None)
+		graph.range_stats()
+		graph.aggregate(0, 2, 1)
+		graph.points = create_points([3, 1, 4, 1])
+		
+		self.assertEqual(graph.storage, storage)
+		self.assertEqual(graph.get_y_values().tolist(), [1, 4, 1] if storage == "ring" else [3, 1, 4, 1])
+		self.assertEqual(graph.max.y, 4)
+		self.assertEqual(graph.range_stats().max_value, 4)
+		self.assertEqual(graph.aggregate(0, 4, 1).max.tolist(), [4])
+		
+		graph.add(GraphPoint(4, 9))
+		
+		self.assertEqual((graph.max.x, graph.max.y), (4, 9))
+		self.assertEqual(graph.range_stats().max_value, 9)
+	
+	@parameterized.expand([(storage, points) for storage in ["points", "columnar", "ring"] for points in [[GraphPoint(0, 100)], []]])
+	def test_assign_points_keeps_sections(self, storage, points):
+		graph = Graph(create_points([5, 1, 4, 2]), storage=storage, capacity=4 if storage == "ring" else None)
+		sections = [GraphSection.from_graph(graph, 1, 3), *graph.get_sections()]
+		expected_graph = Graph(create_points([5, 1, 4, 2]))
+		expected_sections = [GraphSection.from_graph(expected_graph, 1, 3), *expected_graph.get_sections()]
+		expected = [([(point.x, point.y) for point in section.points], section.min, section.max) for section in expected_sections]
+		
+		graph.points = points
+		
+		self.assertEqual([([(point.x, point.y) for point in section.points], section.min, section.max) for section in sections], expected)
+	
+	def test_assign_points_memmap(self):
+		with tempfile.TemporaryDirectory() as directory:
+			file = pathlib.Path(directory) / "points.npy"
+			numpy.save(file, numpy.array([[0, 1], [1, 2]], dtype=numpy.float64))
+			graph = Graph.from_memmap(file)
+		
+			with self.assertRaises(ValueError):
+				graph.points = create_points([1])
+		
+			del graph
+	
+	def test_assign_statistics(self):
+		graph = Graph(create_points([1, 2, 3]))
+		graph.min, graph.max, graph.average = GraphPoint(0, 0), None, 5.0
+		
+		self.assertEqual(graph.min, GraphPoint(0, 0))
+		self.assertIsNone(graph.max)
+		self.assertEqual(graph.average, 5.0)
+		
+		graph.calculate_average()
+		
+		self.assertEqual((graph.min, graph.max, graph.average), (GraphPoint(0, 1), GraphPoint(2, 3), 2.0))
+		
+		graph.average = 0.0
+		graph.add(GraphPoint(3, 6))
+		
+		self.assertEqual(graph.average, 3.0)
+	
+	def test_columnar_growth(self):
+		graph = Graph(storage="columnar")
+		
+		for point in create_points(list(range(1000))):
+			graph.add(point)
+		
+		self.assertEqual(len(graph), 1000)
+		self.assertEqual(graph.get_y_values().tolist(), list(range(1000)))
+		self.assertGreaterEqual(len(graph._y_values), 1000)
+	
+	def test_columnar_keeps_int_values(self):
+		graph = Graph(create_points([1, 2, 3]), storage="columnar")
+		
+		self.assertIsInstance(graph.min.y, int)
+		self.assertEqual(str(graph), "(num_points: 3, min: (0, 1), max: (2, 3), average: 2.0000)")
+		
+		graph.add(GraphPoint(3, 0.5))
+		
+		self.assertEqual(graph.get_y_values().tolist(), [1.0, 2.0, 3.0, 0.5])
+		self.assertEqual((graph.min.x, graph.min.y), (3, 0.5))
+	
+	@parameterized.expand([("points",), ("columnar",)])
+	def test_downsample(self, storage):
+		graph = Graph(create_points([0, 5, 1, 2, 9, 3, 1, 0, 4, 2]), storage=storage)
+		downsampled_graph = graph.downsample(4, method="minmax")
+		
+		self.assertEqual(downsampled_graph.storage, storage)
+		self.assertEqual(downsampled_graph.points, [GraphPoint(0, 0), GraphPoint(4, 9), GraphPoint(7, 0), GraphPoint(8, 4)])
+		self.assertEqual(graph.downsample(4, output="indexes").tolist(), [0, 4, 6, 9])
+		
+		with self.assertRaises(ValueError):
+			graph.downsample(4, output="list")
+	
+	@parameterized.expand([("points",), ("columnar",)])
+	def test_align(self, storage):
+		graph = Graph.from_arrays([15, 0, 5, 10], [1, 1, 1, 1], storage=storage)
+		other_graph = Graph.from_arrays([2, 8, 12], [10, 20, 30])
+		
+		self.assertEqual(graph.align(other_graph).storage, storage)
+		self.assertEqual(graph.align(other_graph).points, [GraphPoint(15, 30), GraphPoint(5, 10), GraphPoint(10, 20)])
+		self.assertEqual(graph.align(other_graph, "nearest", tolerance=2).points, [GraphPoint(0, 10), GraphPoint(10, 20)])
+		self.assertEqual(graph.align(other_graph, "interpolate").points, [GraphPoint(5, 15.0), GraphPoint(10, 25.0)])
+		
+		with self.assertRaises(ValueError):
+			other_graph.align(graph)
+	
+	def test_arithmetic(self):
+		first_graph = Graph.from_arrays([0, 1, 2, 3], [2, 4, 6, 8])
+		second_graph = Graph.from_arrays([1, 3], [2, 0])
+		
+		self.assertEqual((first_graph + second_graph).points, [GraphPoint(1, 6), GraphPoint(2, 8), GraphPoint(3, 8)])
+		self.assertEqual((first_graph - second_graph).points, [GraphPoint(1, 2), GraphPoint(2, 4), GraphPoint(3, 8)])
+		self.assertEqual((first_graph * second_graph).points, [GraphPoint(1, 8), GraphPoint(2, 12), GraphPoint(3, 0)])
+		self.assertEqual((first_graph / second_graph).points, [GraphPoint(1, 2.0), GraphPoint(2, 3.0)])
+		self.assertEqual((second_graph / first_graph).points, [GraphPoint(1, 0.5), GraphPoint(3, 0.0)])
+		self.assertEqual(
+				first_graph.combine(second_graph, "add", method="interpolate").points,
+				[GraphPoint(1, 6.0), GraphPoint(2, 7.0), GraphPoint(3, 8.0)]
+		)
+		
+		self.assertEqual((first_graph + 1).get_y_values().tolist(), [3, 5, 7, 9])
+		self.assertEqual((1 - first_graph).get_y_values().tolist(), [-1, -3, -5, -7])
+		self.assertEqual((first_graph * 0.5).get_y_values().tolist(), [1.0, 2.0, 3.0, 4.0])
+		self.assertEqual((12 / first_graph).get_y_values().tolist(), [6.0, 3.0, 2.0, 1.5])
+		self.assertEqual(len(first_graph / 0), 0)
+		self.assertEqual((first_graph + 1).average, 6.0)
+		
+		with self.assertRaises(ValueError):
+			first_graph.combine(second_graph, "power")
+	
+	def test_arithmetic_invalid_operands(self):
+		graph = Graph.from_arrays([0, 1, 2], [2, 4, 6])
+		
+		self.assertEqual((numpy.float64(1) + graph).get_y_values().tolist(), [3.0, 5.0, 7.0])
+		
+		for operation in [
+			lambda: numpy.array([1, 2, 3]) + graph,
+			lambda: graph + numpy.array([1, 2, 3]),
+			lambda: graph + "a",
+			lambda: "a" * graph,
+			lambda: graph / [1, 2, 3],
+		]:
+			with self.assertRaises(TypeError):
+				operation()
+	
+	@parameterized.expand([("points",), ("columnar",), ("ring",)])
+	def test_aggregate(self, storage):
+		graph = Graph(create_points([3, 1, 4, 1, 5, 9, 2, 6]), storage=storage, **({"capacity": 8} if storage == "ring" else {}))
+		statistics = graph.aggregate(0, 8, 2)
+		
+		self.assertEqual(statistics.edges.tolist(), [0.0, 4.0, 8.0])
+		self.assertEqual(statistics.count.tolist(), [4, 4])
+		self.assertEqual(statistics.max.tolist(), [4.0, 9.0])
+		self.assertEqual(statistics.mean.tolist(), [2.25, 5.5])
+		
+		graph.add(GraphPoint(8, 10))
+		statistics = graph.aggregate(1, 8, 7)
+		
+		self.assertEqual(statistics.count.tolist(), [1, 1, 1, 1, 1, 1, 2])
+		self.assertEqual(statistics.max.tolist(), [1.0, 4.0, 1.0, 5.0, 9.0, 2.0, 10.0])
+		self.assertEqual(graph.aggregate(-2, -1, 1).count.tolist(), [0])
+		
+		with self.assertRaises(ValueError):
+			graph.aggregate(0, 8, 0)
+		
+		with self.assertRaises(ValueError):
+			graph.aggregate(8, 8, 2)
+		
+		with self.assertRaises(ValueError):
+			Graph.from_arrays([1, 0], [1, 2]).aggregate(0, 1, 1)
+	
+	@parameterized.expand([("points",), ("columnar",)])
+	def test_aggregate_integer_x(self, storage):
+		random_state = numpy.random.RandomState(0)
+		x_values = numpy.sort(random_state.randint(0, 1000, 500))
+		y_values = random_state.rand(500)
+		graph = Graph.from_arrays(x_values, y_values, storage)
+		expected = Graph.from_arrays(x_values.astype(numpy.float64), y_values)
+		
+		with mock.patch("numpy.searchsorted", wraps=numpy.searchsorted) as searchsorted:
+			statistics = graph.aggregate(-10.5, 1001.5, 97)
+		
+		if storage == "columnar":
+			self.assertEqual(searchsorted.call_count, 2)
+		
+			for call in searchsorted.call_args_list:
+				self.assertEqual(numpy.asarray(call.args[1]).dtype, numpy.int64)
+		
+		expected_statistics = expected.aggregate(-10.5, 1001.5, 97)
+		
+		self.assertEqual(statistics.count.tolist(), expected_statistics.count.tolist())
+		self.assertTrue(numpy.array_equal(statistics.max, expected_statistics.max, equal_nan=True))
+	
+	@parameterized.expand([("points",), ("columnar",), ("ring",)])
+	def test_compression(self, storage):
+		random_state = numpy.random.RandomState(0)
+		x_values = numpy.cumsum(random_state.randint(1, 3, 300))
+		y_values = numpy.cumsum(random_state.randn(300))
+		points = [GraphPoint(x, y) for x, y in zip(x_values.tolist(), y_values.tolist())]
+		capacity = {"capacity": 1000} if storage == "ring" else {}
+		
+		indexes = SwingingDoorCompression(1.0).compress(x_values, y_values).tolist() + [299]
+		graph = Graph(storage=storage, compression=SwingingDoorCompression(1.0), **capacity)
+		
+		for point in points:
+			graph.add(point)
+		
+		self.assertEqual(graph.points, [points[index] for index in indexes[:-1]])
+		
+		graph.flush_compression()
+		graph.flush_compression()
+		
+		self.assertEqual(graph.points, [points[index] for index in indexes])
+		self.assertAlmostEqual(graph.average, numpy.mean(y_values[indexes]))
+		
+		bulk_graph = Graph(points, storage=storage, compression=SwingingDoorCompression(1.0), **capacity)
+		bulk_graph.flush_compression()
+		
+		self.assertEqual(bulk_graph.points, graph.points)
+		
+		if storage != "ring":
+			array_graph = Graph.from_arrays(x_values, y_values, storage=storage, compression=SwingingDoorCompression(1.0))
+			array_graph.flush_compression()
+		
+			self.assertEqual(array_graph.points, graph.points)
+	
+	@parameterized.expand([("points",), ("columnar",), ("ring",)])
+	def test_simplify(self, storage):
+		graph = Graph(create_points([0, 0.1, 0, 5, 0, 0]), storage=storage, **({"capacity": 10} if storage == "ring" else {}))
+		simplified_graph = graph.simplify(1.0)
+		
+		self.assertEqual(simplified_graph.storage, "points" if storage == "points" else "columnar")
+		self.assertEqual(simplified_graph.points, [GraphPoint(0, 0), GraphPoint(2, 0), GraphPoint(3, 5), GraphPoint(5, 0)])
+		self.assertEqual(graph.simplify(0.05, output="indexes").tolist(), [0, 1, 2, 3, 4, 5])
+		
+		with self.assertRaises(ValueError):
+			graph.simplify(1.0, output="list")
+	
+	def test_empty(self):
+		graph = Graph(storage="columnar")
+		
+		self.assertEqual(len(graph), 0)
+		self.assertIsNone(graph.min)
+		self.assertIsNone(graph.max)
+		self.assertIsNone(graph.average)
+		self.assertEqual(graph.points, [])
+	
+	def test_invalid_storage(self):
+		with self.assertRaises(ValueError):
+			Graph(storage="dict")
+	
+	@parameterized.expand([("points",), ("columnar",)])
+	def test_from_arrays(self, storage):
+		graph = Graph.from_arrays(numpy.arange(8), numpy.array([3, 1, 4, 1, 5, 9, 2, 6]), storage)
+		expected = Graph(create_points([3, 1, 4, 1, 5, 9, 2, 6]))
+		
+		self.assertEqual(graph.storage, storage)
+		self.assertEqual(graph.points, expected.points)
+		self.assertEqual((graph.min, graph.max), (expected.min, expected.max))
+		self.assertAlmostEqual(graph.average, expected.average)
+		self.assertEqual(get_sections_points(graph), get_sections_points(expected))
+		
+		graph.add(GraphPoint(8, 0))
+		
+		self.assertEqual(graph.min, GraphPoint(8, 0))
+	
+	def test_from_arrays_invalid(self):
+		with self.assertRaises(ValueError):
+			Graph.from_arrays([0, 1, 2], [1, 2])
+		
+		with self.assertRaises(ValueError):
+			Graph.from_arrays([[0, 1]], [[1, 2]])
+	
+	def test_from_dataframe(self):
+		dataframe = DataFrame({"time": [10, 11, 12], "value": [2.0, 1.0, 3.0]}, index=[0, 1, 2])
+		
+		graph = Graph.from_dataframe(dataframe, x="time", y="value")
+		
+		self.assertEqual(graph.points, [GraphPoint(10, 2.0), GraphPoint(11, 1.0), GraphPoint(12, 3.0)])
+		self.assertEqual(graph.min, GraphPoint(11, 1.0))
+		self.assertEqual(Graph.from_dataframe(dataframe, x="time").points, graph.points)
+		self.assertEqual(Graph.from_dataframe(dataframe[["value"]]).get_x_values().tolist(), [0, 1, 2])
+		
+		with self.assertRaises(ValueError):
+			Graph.from_dataframe(dataframe)
+	
+	def test_from_iterable(self):
+		graph = Graph.from_iterable(iter([(0, 3), GraphPoint(1, 1), (2, 2)]))
+		
+		self.assertEqual(graph.points, [GraphPoint(0, 3), GraphPoint(1, 1), GraphPoint(2, 2)])
+		self.assertEqual(graph.min, GraphPoint(1, 1))
+		self.assertEqual(len(Graph.from_iterable([])), 0)
+	
+	@parameterized.expand([("points",), ("columnar",)])
+	def test_rolling(self, storage):
+		graph = Graph(create_points([3, 1, 4, 1, 5]), storage=storage)
+		statistics = graph.rolling(2)
+		
+		self.assertEqual(statistics.min.tolist(), [3, 1, 1, 1, 1])
+		self.assertEqual(statistics.max.tolist(), [3, 3, 4, 4, 5])
+		self.assertEqual(statistics.mean.tolist(), [3, 2, 2.5, 2.5, 3])
+		self.assertEqual(statistics.std.tolist(), [0, 1, 1.5, 1.5, 2])
+	
+	def test_rolling_x_span(self):
+		graph = Graph.from_arrays([0, 1, 2, 5, 6], [3, 1, 4, 1, 5])
+		statistics = graph.rolling(2.5, by="x")
+		
+		self.assertEqual(statistics.count.tolist(), [1, 2, 3, 1, 2])
+		self.assertEqual(statistics.max.tolist(), [3, 3, 4, 1, 5])
+	
+	def test_range_stats(self):
+		graph = Graph.from_arrays(numpy.arange(8), numpy.array([3, 1, 4, 1, 5, 9, 2, 6]))
+		statistics = graph.range_stats(2, 6)
+		
+		self.assertEqual((statistics.min_value, statistics.min_index), (1, 3))
+		self.assertEqual((statistics.max_value, statistics.max_index), (9, 5))
+		self.assertAlmostEqual(statistics.mean, 4.75)
+		self.assertIsInstance(statistics.min_value, int)
+	
+	@parameterized.expand([("points",), ("columnar",)])
+	def test_range_stats_after_add(self, storage):
+		graph = Graph(create_points([3, 1, 4]), storage=storage)
+		
+		self.assertEqual(graph.range_stats().min_index, 1)
+		
+		for y in [0, 7, -2]:
+			graph.add(GraphPoint(len(graph), y))
+		
+			statistics = graph.range_stats(1)
+		
+			self.assertEqual(statistics.min_value, min([1, 4, 0, 7, -2][:len(graph) - 1]))
+			self.assertEqual(statistics.count, len(graph) - 1)
+	
+	@parameterized.expand([("points",), ("columnar",)])
+	def test_is_x_sorted(self, storage):
+		graph = Graph([GraphPoint(0, 1), GraphPoint(1, 2), GraphPoint(1, 0)], storage=storage)
+		
+		self.assertTrue(graph.is_x_sorted)
+		
+		graph.add(GraphPoint(0.5, 3))
+		
+		self.assertFalse(graph.is_x_sorted)
+		self.assertFalse(Graph.from_arrays([2, 1], [0, 0]).is_x_sorted)
+		self.assertTrue(Graph(storage=storage).is_x_sorted)
+		
+		with self.assertRaises(ValueError):
+			graph.value_at(1)
+	
+	@parameterized.expand([("points",), ("columnar",)])
+	def test_nearest(self, storage):
+		graph = Graph(create_points([5, 3, 4]), storage=storage)
+		
+		self.assertEqual(graph.nearest(-1), GraphPoint(0, 5))
+		self.assertEqual(graph.nearest(0.5), GraphPoint(0, 5))
+		self.assertEqual(graph.nearest(1.6), GraphPoint(2, 4))
+		self.assertEqual(graph.nearest(9), GraphPoint(2, 4))
+		self.assertIsNone(Graph(storage=storage).nearest(1))
+	
+	@parameterized.expand([("columnar",), ("ring",)])
+	def test_integers_outside_int64(self, storage):
+		graph = Graph(create_points([1, 2]), storage=storage, **({"capacity": 4} if storage == "ring" else {}))
+		graph.add(GraphPoint(2, 2 ** 70))
+		graph.add(GraphPoint(2 ** 64, -2 ** 63))
+		
+		self.assertEqual(graph.get_y_values().dtype, numpy.float64)
+		self.assertEqual(graph.get_x_values().dtype, numpy.float64)
+		self.assertEqual(graph.get_y_values().tolist(), [1.0, 2.0, float(2 ** 70), float(-2 ** 63)])
+		self.assertEqual(graph.max, GraphPoint(2, float(2 ** 70)))
+		self.assertEqual(Graph.from_arrays([0, 1], numpy.array([1, 2 ** 63], dtype=numpy.uint64)).get_y_values().tolist(), [1.0, float(2 ** 63)])
+		self.assertEqual(Graph([GraphPoint(0, 2 ** 70)], storage="columnar").get_y_values().tolist(), [float(2 ** 70)])
+	
+	@parameterized.expand([("columnar",), ("ring",)])
+	def test_float_key_on_integer_x(self, storage):
+		x_values = [-5, 0, 0, 3, 4, 4, 4, 9]
+		graph = Graph(create_points([0] * len(x_values)), storage=storage, **({"capacity": 8} if storage == "ring" else {}))
+		graph.points = [GraphPoint(x, y) for x, y in zip(x_values, range(len(x_values)))]
+		expected = Graph.from_arrays(numpy.array(x_values, dtype=numpy.float64), numpy.arange(len(x_values)))
+		
+		self.assertEqual(graph.get_x_values().dtype, numpy.int64)
+		
+		for x in [-9.5, -5.0, -4.5, -0.5, 0.0, 3.5, 4.0, 4.5, 9.0, 9.5, 1e30, -1e30, numpy.inf, -numpy.inf]:
+			self.assertEqual(graph.get_index_range(x, x + 1.5), expected.get_index_range(x, x + 1.5))
+			self.assertEqual(graph.value_at(x, interpolate=True), expected.value_at(x, interpolate=True))
+			self.assertEqual(graph.slice_x(x, x + 4.5).points, expected.slice_x(x, x + 4.5).points)
+	
+	@parameterized.expand([("points",), ("columnar",)])
+	def test_slice_x(self, storage):
+		graph = Graph(create_points([5, 3, 4, 1, 2]), storage=storage)
+		sliced_graph = graph.slice_x(0.5, 3)
+		
+		self.assertEqual(sliced_graph.storage, storage)
+		self.assertEqual(sliced_graph.points, [GraphPoint(1, 3), GraphPoint(2, 4), GraphPoint(3, 1)])
+		self.assertEqual(sliced_graph.min, GraphPoint(3, 1))
+		self.assertEqual(graph.get_index_range(0.5, 3), (1, 4))
+		self.assertEqual(len(graph.slice_x(3, 1)), 0)
+		
+		sliced_graph.add(GraphPoint(4, 0))
+		
+		self.assertEqual(graph.get_point(4), GraphPoint(4, 2))
+	
+	def test_slice_x_shares_columnar_values(self):
+		graph = Graph.from_arrays(numpy.arange(5), numpy.arange(5.0))
+		
+		self.assertTrue(numpy.shares_memory(graph.slice_x(1, 3).get_y_values(), graph.get_y_values()))
+	
+	@parameterized.expand([("points",), ("columnar",)])
+	def test_sort_x(self, storage):
+		points = [GraphPoint(3, 1), GraphPoint(1, 2), GraphPoint(2, 0), GraphPoint(1, 5)]
+		graph = Graph(points, storage=storage, sort_x=True)
+		
+		self.assertTrue(graph.is_x_sorted)
+		self.assertEqual(graph.points, [GraphPoint(1, 2), GraphPoint(1, 5), GraphPoint(2, 0), GraphPoint(3, 1)])
+		self.assertEqual(points[0], GraphPoint(3, 1))
+		self.assertEqual(
+				Graph.from_arrays([3, 1, 2, 1], [1, 2, 0, 5], storage, sort_x=True).points,
+				graph.points
+		)
+	
+	@parameterized.expand([("points",), ("columnar",)])
+	def test_value_at(self, storage):
+		graph = Graph([GraphPoint(0, 1), GraphPoint(2, 5), GraphPoint(4, 3)], storage=storage)
+		
+		self.assertEqual(graph.value_at(2), 5)
+		self.assertIsNone(graph.value_at(1))
+		self.assertEqual(graph.value_at(1, interpolate=True), 3.0)
+		self.assertEqual(graph.value_at(3.5, interpolate=True), 3.5)
+		self.assertIsNone(graph.value_at(5, interpolate=True))
+		self.assertIsNone(graph.value_at(-1, interpolate=True))
+	
+	@parameterized.expand([(y_values, capacity) for y_values in SECTIONS_Y_VALUES for capacity in [1, 3, 100]])
+	def test_ring(self, y_values, capacity):
+		graph = Graph(storage="ring", capacity=capacity)
+		
+		for point in create_points(y_values):
+			graph.add(point)
+		
+		expected = Graph(create_points(y_values)[-capacity:])
+		
+		self.assertEqual(graph.points, expected.points)
+		self.assertEqual(graph.min, expected.min)
+		self.assertEqual(graph.max, expected.max)
+		self.assertAlmostEqual(graph.average, expected.average)
+		self.assertAlmostEqual(graph.variance, expected.variance)
+		self.assertEqual(get_sections_points(graph), get_sections_points(expected))
+	
+	def test_ring_initial_points(self):
+		graph = Graph(create_points([1, 5, 2, 4]), storage="ring", capacity=3)
+		graph.add(GraphPoint(4, 0.5))
+		
+		self.assertEqual([tuple(point) for point in graph.points], [(2, 2), (3, 4), (4, 0.5)])
+		self.assertEqual((graph.min.y, graph.max.y), (0.5, 4))
+		self.assertEqual(graph.range_stats(0, 2).max_value, 4)
+		self.assertEqual(graph.get_x_values().tolist(), [2, 3, 4])
+	
+	@parameterized.expand([(capacity,) for capacity in [1, 3, 16]])
+	def test_ring_queries_after_add(self, capacity):
+		random_state = numpy.random.RandomState(capacity)
+		y_values = random_state.randint(-20, 20, 5 * capacity + 7).tolist()
+		graph = Graph(storage="ring", capacity=capacity)
+		range_indexes = [None]
+		
+		for x, y in enumerate(y_values):
+			graph.add(GraphPoint(x, y))
+		
+			expected = Graph.from_arrays(numpy.arange(x + 1)[-capacity:], y_values[:x + 1][-capacity:])
+			start = random_state.randint(0, len(graph))
+		
+			for bounds in [(), (start,), (start, random_state.randint(start, len(graph) + 1))]:
+				statistics, expected_statistics = graph.range_stats(*bounds), expected.range_stats(*bounds)
+		
+				self.assertEqual(
+						(statistics.count, statistics.sum, statistics.min_value, statistics.min_index, statistics.max_value, statistics.max_index),
+						(expected_statistics.count, expected_statistics.sum, expected_statistics.min_value, expected_statistics.min_index, expected_statistics.max_value, expected_statistics.max_index)
+				)
+		
+			for buckets in [1, 3]:
+				bucket_statistics = graph.aggregate(x - capacity + 0.5, x + 1, buckets)
+				expected_bucket_statistics = expected.aggregate(x - capacity + 0.5, x + 1, buckets)
+		
+				self.assertEqual(bucket_statistics.count.tolist(), expected_bucket_statistics.count.tolist())
+				self.assertEqual(bucket_statistics.sum.tolist(), expected_bucket_statistics.sum.tolist())
+				self.assertTrue(numpy.array_equal(bucket_statistics.min, expected_bucket_statistics.min, equal_nan=True))
+				self.assertTrue(numpy.array_equal(bucket_statistics.max, expected_bucket_statistics.max, equal_nan=True))
+		
+			if graph._range_index is not range_indexes[-1]:
+				range_indexes.append(graph._range_index)
+		
+		self.assertLessEqual(len(range_indexes) - 1, len(y_values) // capacity + 2)
+	
+	@parameterized.expand([(engine,) for engine in ["iterative", "vectorized"]])
+	def test_ring_sections_after_add(self, engine):
+		graph = Graph(create_points([1, 2, 3, 2, 1, 0]), storage="ring", capacity=6)
+		sections = list(graph.get_sections(engine=engine))
+		expected = [(section.points, section.min, section.max, section.average) for section in sections]
+		
+		for x, y in enumerate([9, -9, 9, -9, 9, -9], 6):
+			graph.add(GraphPoint(x, y))
+		
+		self.assertEqual([(section.points, section.min, section.max, section.average) for section in sections], expected)
+		self.assertEqual([section.max for section in sections], [GraphPoint(2, 3), GraphPoint(2, 3)])
+		self.assertTrue(all(isinstance(section.source, list) for section in sections))
+	
+	def test_slice_x_ring_copies_values(self):
+		graph = Graph(create_points([5, 3, 4]), storage="ring", capacity=3)
+		sliced_graph = graph.slice_x(1, 2)
+		
+		graph.add(GraphPoint(3, 1))
+		graph.add(GraphPoint(4, 0))
+		
+		self.assertEqual(sliced_graph.storage, "columnar")
+		self.assertEqual(sliced_graph.points, [GraphPoint(1, 3), GraphPoint(2, 4)])
+		self.assertFalse(numpy.shares_memory(sliced_graph.get_y_values(), graph.get_y_values()))
+	
+	def test_ring_invalid_capacity(self):
+		for storage, capacity in [("ring", None), ("ring", 0), ("columnar", 5)]:
+			with self.assertRaises(ValueError):
+				Graph(storage=storage, capacity=capacity)
+	
+	def test_memmap_interleaved_file(self):
+		with tempfile.TemporaryDirectory() as directory:
+			path = pathlib.Path(directory, "points.bin")
+			numpy.array([[0, 3], [1, 1], [2, 4]], dtype=numpy.float32).tofile(path)
+		
+			graph = Graph.from_memmap(path, dtype=numpy.float32)
+		
+			self.assertEqual(graph.storage, "memmap")
+			self.assertEqual(len(graph), 3)
+			self.assertEqual((graph.min.x, graph.min.y), (1, 1))
+			self.assertEqual((graph.max.x, graph.max.y), (2, 4))
+		
+			del graph
+	
+	def test_memmap_invalid_files(self):
+		with tempfile.TemporaryDirectory() as directory:
+			numpy.save(pathlib.Path(directory, "x.npy"), numpy.arange(3.0))
+			numpy.save(pathlib.Path(directory, "y.npy"), numpy.arange(4.0))
+			numpy.arange(3.0).tofile(pathlib.Path(directory, "points.bin"))
+		
+			with self.assertRaises(ValueError):
+				Graph.from_memmap(pathlib.Path(directory, "x.npy"), pathlib.Path(directory, "y.npy"))
+		
+			with self.assertRaises(ValueError):
+				Graph.from_memmap(pathlib.Path(directory, "points.bin"))
+	
+	@parameterized.expand([(y_values,) for y_values in SECTIONS_Y_VALUES])
+	def test_memmap_matches_points(self, y_values):
+		points_graph = Graph(create_points(y_values))
+		
+		with tempfile.TemporaryDirectory() as directory:
+			numpy.save(pathlib.Path(directory, "x.npy"), numpy.arange(len(y_values), dtype=numpy.float64))
+			numpy.save(pathlib.Path(directory, "y.npy"), numpy.array(y_values, dtype=numpy.float64))
+		
+			graph = Graph.from_memmap(pathlib.Path(directory, "x.npy"), pathlib.Path(directory, "y.npy"))
+		
+			self.assertEqual((graph.min.x, graph.min.y), (points_graph.min.x, points_graph.min.y))
+			self.assertEqual((graph.max.x, graph.max.y), (points_graph.max.x, points_graph.max.y))
+			self.assertAlmostEqual(graph.average, points_graph.average)
+			self.assertEqual(get_sections_points(graph), get_sections_points(points_graph))
+			self.assertEqual(
+					get_sections_points(graph, ThresholdSensitivity(), 0.0, "vectorized"),
+					get_sections_points(points_graph)
+			)
+		
+			with self.assertRaises(ValueError):
+				graph.add(GraphPoint(0, 0))
+		
+			del graph
+	
+	@parameterized.expand(
+			[
+				(y_values, threshold_sensitivity, angle_sensitivity)
+				for y_values in SECTIONS_Y_VALUES
+				for threshold_sensitivity in [ThresholdSensitivity(), ThresholdSensitivity(0.5), ThresholdSensitivity(0.2, "relative")]
+				for angle_sensitivity in [0.0, 10.0]
+			]
+	)
+	def test_sections_match_between_storages(self, y_values, threshold_sensitivity, angle_sensitivity):
+		points_graph = Graph(create_points(y_values))
+		columnar_graph = Graph(create_points(y_values), storage="columnar")
+		
+		self.assertEqual(
+				get_sections_points(points_graph, threshold_sensitivity, angle_sensitivity),
+				get_sections_points(columnar_graph, threshold_sensitivity, angle_sensitivity)
+		)
+	
+	@parameterized.expand(
+			[
+				(y_values, storage, threshold_sensitivity, angle_sensitivity)
+				for y_values in SECTIONS_Y_VALUES[:2]
+				for storage in ["points", "columnar"]
+				for threshold_sensitivity in [ThresholdSensitivity(), ThresholdSensitivity(0.5), ThresholdSensitivity(0.2, "relative")]
+				for angle_sensitivity in [0.0, 10.0]
+			]
+	)
+	def test_sections_vectorized_engine(self, y_values, storage, threshold_sensitivity, angle_sensitivity):
+		graph = Graph(create_points(y_values), storage=storage)
+		
+		self.assertEqual(
+				get_sections_points(graph, threshold_sensitivity, angle_sensitivity, "vectorized"),
+				get_sections_points(graph, threshold_sensitivity, angle_sensitivity, "iterative")
+		)
+	
+	@parameterized.expand(
+			[
+				(y_values, storage, expected_bounds)
+				for y_values, expected_bounds in [
+					([0.5, 0.2, 0.0, 0.1, 0.2], [(0, 5)]),
+					([0.3, 0.0, 0.5, 0.4, 0.3, 0.1, 0.0, 0.0, 0.5], [(0, 9)]),
+					([0.5, 0.1, 0.1, 0.3, 0.1, 0.3, 0.0, 0.2], [(0, 7), (7, 8)]),
+					([0.5, 0.5, 0.1, 0.2, 0.0, 0.1, 0.0, 0.2, 0.2], [(0, 7), (7, 9)]),
+				]
+				for storage in ["points", "columnar"]
+			]
+	)
+	def test_sections_compare_to_numpy_mean(self, y_values, storage, expected_bounds):
+		graph = Graph(create_points(y_values), storage=storage)
+		
+		self.assertEqual(
+				[(section.start, section.stop) for section in graph.get_sections(angle_sensitivity=90.0)],
+				expected_bounds
+		)
+	
+	@parameterized.expand([(engine,) for engine in ["iterative", "vectorized"]])
+	def test_sections_array_output(self, engine):
+		graph = Graph(create_points([1, 2, 3, 2, 1, 0, 1, 2]), storage="columnar")
+		summaries = graph.get_sections(engine=engine, output="array")
+		
+		self.assertEqual(summaries[["start", "stop"]].tolist(), [(0, 3), (2, 6), (5, 8)])
+		self.assertEqual(summaries["min_index"].tolist(), [0, 5, 5])
+		self.assertEqual(summaries["max_value"].tolist(), [3.0, 3.0, 2.0])
+		self.assertEqual(summaries["mean"].tolist(), [2.0, 1.5, 1.0])
+		
+		dataframe = graph.get_sections(engine=engine, output="dataframe")
+		
+		self.assertEqual(list(dataframe.columns), list(summaries.dtype.names))
+		self.assertEqual(dataframe["direction"].tolist(), summaries["direction"].tolist())
+	
+	def test_sections_invalid_output(self):
+		with self.assertRaises(ValueError):
+			Graph(create_points([1, 2])).get_sections(output="list")
+	
+	def test_sections_invalid_engine(self):
+		with self.assertRaises(ValueError):
+			Graph(create_points([1, 2])).get_sections(engine="recursive")
+	
+	def test_sections(self):
+		graph = Graph(create_points([1, 2, 3, 2, 1, 0, 1, 2]))
+		
+		self.assertEqual(
+				get_sections_points(graph),
+				[[(0, 1), (1, 2), (2, 3)], [(2, 3), (3, 2), (4, 1), (5, 0)], [(5, 0), (6, 1), (7, 2)]]
+		)
+	
+	@parameterized.expand([(y_values,) for y_values in SECTIONS_Y_VALUES])
+	def test_statistics_match_between_storages(self, y_values):
+		points_graph = Graph(create_points(y_values))
+		columnar_graph = Graph(create_points(y_values), storage="columnar")
+		
+		self.assertEqual((points_graph.min.x, points_graph.min.y), (columnar_graph.min.x, columnar_graph.min.y))
+		self.assertEqual((points_graph.max.x, points_graph.max.y), (columnar_graph.max.x, columnar_graph.max.y))
+		self.assertEqual(points_graph.average, columnar_graph.average)
+
+
+def graph_2D_test_suite() -> TestSuite:
+	suite = TestSuite()
+	test_loader = TestLoader()
+	
+	suite.addTest(test_loader.loadTestsFromTestCase(TestGraphPoint))
+	suite.addTest(test_loader.loadTestsFromTestCase(TestRunningStatistics))
+	suite.addTest(test_loader.loadTestsFromTestCase(TestSlidingStatistics))
+	suite.addTest(test_loader.loadTestsFromTestCase(TestGraphSection))
+	suite.addTest(test_loader.loadTestsFromTestCase(TestSectionDetector))
+	suite.addTest(test_loader.loadTestsFromTestCase(TestSegmentationStatistics))
+	suite.addTest(test_loader.loadTestsFromTestCase(TestGetSectionsAsync))
+	suite.addTest(test_loader.loadTestsFromTestCase(TestGraph))
+	
+	return suite
+
+
+if __name__ == "__main__":
+	runner = TextTestRunner()
+	runner.run(graph_2D_test_suite())
\ No newline at end of file
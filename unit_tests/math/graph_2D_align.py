@@ -0,0 +1,77 @@
+import bisect
+import numpy
+from parameterized import parameterized
+from PyVarTools.math.graph_2D import Graph
+from PyVarTools.math.graph_2D_align import get_aligned_values
+from unittest import (
+	TestCase,
+	TestLoader,
+	TestSuite,
+	TextTestRunner
+)
+
+
+def get_reference_aligned_values(x_values: list[float], y_values: list[float], target_x_values: list[float], method: str) -> dict[int, float]:
+	graph = Graph.from_arrays(x_values, y_values)
+	aligned_values = {}
+	
+	for index, x in enumerate(target_x_values):
+		if method == "asof":
+			position = bisect.bisect_right(x_values, x) - 1
+			value = y_values[position] if position >= 0 else None
+		elif method == "nearest":
+			value = graph.nearest(x).y
+		else:
+			value = graph.value_at(x, interpolate=True)
+	
+		if value is not None:
+			aligned_values[index] = value
+	
+	return aligned_values
+
+
+class TestGetAlignedValues(TestCase):
+	def test_empty(self):
+		indexes, values = get_aligned_values([], [], [1, 2])
+		
+		self.assertEqual(indexes.tolist(), [])
+		self.assertEqual(values.tolist(), [])
+	
+	def test_invalid(self):
+		with self.assertRaises(ValueError):
+			get_aligned_values([0], [0], [0], method="linear")
+		
+		with self.assertRaises(ValueError):
+			get_aligned_values([0], [0], [0], tolerance=-1)
+	
+	@parameterized.expand([(method,) for method in ["asof", "nearest", "interpolate"]])
+	def test_matches_reference(self, method):
+		random_state = numpy.random.RandomState(0)
+		x_values = numpy.sort(random_state.randint(0, 50, 40)).tolist()
+		y_values = random_state.randint(-10, 10, 40).tolist()
+		target_x_values = (random_state.rand(100) * 60 - 5).tolist() + list(range(-2, 55))
+		
+		indexes, values = get_aligned_values(x_values, y_values, target_x_values, method)
+		
+		self.assertEqual(dict(zip(indexes.tolist(), values.tolist())), get_reference_aligned_values(x_values, y_values, target_x_values, method))
+	
+	@parameterized.expand([("asof", [1, 3], [1, 2]), ("nearest", [0, 1, 3], [1, 1, 2])])
+	def test_tolerance(self, method, expected_indexes, expected_values):
+		indexes, values = get_aligned_values([0, 10], [1, 2], [-1, 2, 5, 11], method, tolerance=2)
+		
+		self.assertEqual(indexes.tolist(), expected_indexes)
+		self.assertEqual(values.tolist(), expected_values)
+
+
+def graph_2D_align_test_suite() -> TestSuite:
+	suite = TestSuite()
+	test_loader = TestLoader()
+	
+	suite.addTest(test_loader.loadTestsFromTestCase(TestGetAlignedValues))
+	
+	return suite
+
+
+if __name__ == "__main__":
+	runner = TextTestRunner()
+	runner.run(graph_2D_align_test_suite())
\ No newline at end of file
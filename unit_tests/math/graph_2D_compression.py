@@ -0,0 +1,162 @@
+import numpy
+from parameterized import parameterized
+from PyVarTools.math.graph_2D_compression import (
+	CompressionPolicy,
+	DeadbandCompression,
+	SwingingDoorCompression
+)
+from unittest import (
+	TestCase,
+	TestLoader,
+	TestSuite,
+	TextTestRunner
+)
+
+
+def get_reference_swinging_door_indexes(x_values: list[float], y_values: list[float], tolerance: float) -> list[int]:
+	indexes = [0]
+	
+	for index in range(2, len(y_values)):
+		anchor = indexes[-1]
+		window = range(anchor + 1, index + 1)
+		upper_slope = max((y_values[point] - y_values[anchor] - tolerance) / (x_values[point] - x_values[anchor]) for point in window)
+		lower_slope = min((y_values[point] - y_values[anchor] + tolerance) / (x_values[point] - x_values[anchor]) for point in window)
+	
+		if upper_slope > lower_slope:
+			indexes.append(index - 1)
+	
+	return indexes
+
+
+def get_reference_deadband_indexes(y_values: list[float], tolerance: float) -> list[int]:
+	indexes = [0]
+	
+	for index in range(1, len(y_values)):
+		if abs(y_values[index] - y_values[indexes[-1]]) > tolerance:
+			indexes.append(index)
+	
+	return indexes
+
+
+def get_random_series(num_values: int) -> tuple[numpy.ndarray, numpy.ndarray]:
+	random_state = numpy.random.RandomState(num_values)
+	x_values = numpy.cumsum(random_state.randint(1, 4, num_values))
+	y_values = numpy.cumsum(random_state.randn(num_values))
+	
+	return x_values, y_values
+
+
+class TestCompressionPolicy(TestCase):
+	def test_abstract(self):
+		with self.assertRaises(TypeError):
+			CompressionPolicy(1.0)
+	
+	def test_invalid(self):
+		with self.assertRaises(ValueError):
+			DeadbandCompression(-1.0)
+		
+		with self.assertRaises(ValueError):
+			SwingingDoorCompression(-0.5)
+		
+		compression = SwingingDoorCompression(1.0)
+		compression.offer(0, 0)
+		compression.offer(1, 0)
+		
+		with self.assertRaises(ValueError):
+			compression.offer(1, 0)
+	
+	@parameterized.expand([(DeadbandCompression,), (SwingingDoorCompression,)])
+	def test_offer_matches_compress(self, policy_type: type[CompressionPolicy]):
+		x_values, y_values = get_random_series(500)
+		compression = policy_type(1.0)
+		stored_points = []
+		
+		for x, y in zip(x_values.tolist(), y_values.tolist()):
+			stored_point = compression.offer(x, y)
+		
+			if stored_point is not None:
+				stored_points.append(stored_point)
+		
+		indexes = policy_type(1.0).compress(x_values, y_values)
+		
+		self.assertEqual(stored_points, list(zip(x_values[indexes].tolist(), y_values[indexes].tolist())))
+	
+	@parameterized.expand([(DeadbandCompression,), (SwingingDoorCompression,)])
+	def test_flush(self, policy_type: type[CompressionPolicy]):
+		compression = policy_type(1.0)
+		
+		self.assertIsNone(compression.flush())
+		self.assertEqual(compression.offer(0, 0.0), (0, 0.0))
+		self.assertIsNone(compression.flush())
+		self.assertIsNone(compression.offer(1, 0.5))
+		self.assertEqual(compression.flush(), (1, 0.5))
+		self.assertIsNone(compression.flush())
+		self.assertIsNone(compression.offer(2, 0.7))
+	
+	def test_compress_resets(self):
+		compression = SwingingDoorCompression(0.5)
+		compression.offer(10, 5)
+		
+		self.assertEqual(compression.compress([0, 1, 2, 3, 4, 5], [0, 1, 2, 3, 3, 3]).tolist(), [0, 4])
+		self.assertEqual(compression.flush(), (5, 3))
+		self.assertEqual(compression.compress([], []).tolist(), [])
+		self.assertIsNone(compression.flush())
+
+
+class TestDeadbandCompression(TestCase):
+	@parameterized.expand([(num_values, tolerance) for num_values in [1, 10, 1000] for tolerance in [0.0, 0.5, 3.0]])
+	def test_matches_reference(self, num_values, tolerance):
+		x_values, y_values = get_random_series(num_values)
+		
+		self.assertEqual(
+				DeadbandCompression(tolerance).compress(x_values, y_values).tolist(),
+				get_reference_deadband_indexes(y_values.tolist(), tolerance)
+		)
+
+
+class TestSwingingDoorCompression(TestCase):
+	@parameterized.expand(
+			[
+				(1.0, [0, 1, 2, 3, 4, 5], [0, 1, 2, 1, 0, 0], [(0, 0), (3, 1), (5, 0)]),
+				(0.5, [0, 2, 3, 5], [1, 1, 3, 3], [(0, 1), (2, 1), (3, 3), (5, 3)]),
+				(0.0, [0, 1, 2, 3, 4], [0, 0, 5, 0, 0], [(0, 0), (1, 0), (2, 5), (3, 0), (4, 0)]),
+				(2.0, [0, 1, 2, 3, 4, 5, 6], [0, 1, 0, 1, 0, 1, 0], [(0, 0), (6, 0)]),
+			]
+	)
+	def test_example(self, tolerance, x_values, y_values, expected_points):
+		compression = SwingingDoorCompression(tolerance)
+		stored_points = [compression.offer(x, y) for x, y in zip(x_values, y_values)] + [compression.flush()]
+		
+		self.assertEqual([point for point in stored_points if point is not None], expected_points)
+	
+	def test_line(self):
+		x_values = numpy.arange(100)
+		compression = SwingingDoorCompression(0.0)
+		
+		self.assertEqual(compression.compress(x_values, 2 * x_values + 1).tolist(), [0])
+		self.assertEqual(compression.flush(), (99, 199))
+	
+	@parameterized.expand([(num_values, tolerance) for num_values in [1, 2, 10, 1000] for tolerance in [0.0, 0.5, 3.0]])
+	def test_matches_reference(self, num_values, tolerance):
+		x_values, y_values = get_random_series(num_values)
+		
+		self.assertEqual(
+				SwingingDoorCompression(tolerance).compress(x_values, y_values).tolist(),
+				get_reference_swinging_door_indexes(x_values.tolist(), y_values.tolist(), tolerance)
+		)
+
+
+def graph_2D_compression_test_suite() -> TestSuite:
+	suite = TestSuite()
+	test_loader = TestLoader()
+	
+	suite.addTest(test_loader.loadTestsFromTestCase(TestCompressionPolicy))
+	suite.addTest(test_loader.loadTestsFromTestCase(TestDeadbandCompression))
+	suite.addTest(test_loader.loadTestsFromTestCase(TestSwingingDoorCompression))
+	
+	return suite
+
+
+if __name__ == "__main__":
+	runner = TextTestRunner()
+	runner.run(graph_2D_compression_test_suite())
\ No newline at end of file
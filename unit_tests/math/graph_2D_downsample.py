@@ -0,0 +1,154 @@
+import math
+import numpy
+from parameterized import parameterized
+from PyVarTools.math.graph_2D_downsample import (
+	get_downsample_indexes,
+	get_lttb_indexes,
+	get_m4_indexes,
+	get_minmax_indexes,
+	get_rdp_indexes
+)
+from unittest import (
+	TestCase,
+	TestLoader,
+	TestSuite,
+	TextTestRunner
+)
+
+
+def get_reference_lttb_indexes(x_values: list[float], y_values: list[float], num_points: int) -> list[int]:
+	edges = numpy.linspace(1, len(y_values) - 1, num_points - 1).astype(int).tolist()
+	indexes = [0]
+	
+	for bucket in range(num_points - 2):
+		if bucket + 2 < len(edges):
+			next_bucket = range(edges[bucket + 1], edges[bucket + 2])
+			next_x = sum(x_values[index] for index in next_bucket) / len(next_bucket)
+			next_y = sum(y_values[index] for index in next_bucket) / len(next_bucket)
+		else:
+			next_x, next_y = x_values[-1], y_values[-1]
+	
+		selected_x, selected_y = x_values[indexes[-1]], y_values[indexes[-1]]
+		areas = [
+			abs((selected_x - next_x) * (y_values[index] - selected_y) - (selected_x - x_values[index]) * (next_y - selected_y))
+			for index in range(edges[bucket], edges[bucket + 1])
+		]
+		indexes.append(edges[bucket] + areas.index(max(areas)))
+	
+	return indexes + [len(y_values) - 1]
+
+
+def get_reference_rdp_indexes(x_values: list[float], y_values: list[float], epsilon: float, start: int, stop: int) -> list[int]:
+	delta_x, delta_y = x_values[stop] - x_values[start], y_values[stop] - y_values[start]
+	norm = math.hypot(delta_x, delta_y)
+	distances = [
+		abs(delta_y * (x_values[index] - x_values[start]) - delta_x * (y_values[index] - y_values[start])) / norm
+		if norm > 0
+		else math.hypot(x_values[index] - x_values[start], y_values[index] - y_values[start])
+		for index in range(start + 1, stop)
+	]
+	
+	if not distances or max(distances) <= epsilon:
+		return [start, stop]
+	
+	split = start + 1 + distances.index(max(distances))
+	
+	return get_reference_rdp_indexes(x_values, y_values, epsilon, start, split)[:-1] + get_reference_rdp_indexes(x_values, y_values, epsilon, split, stop)
+
+
+class TestGetRdpIndexes(TestCase):
+	def test_invalid(self):
+		with self.assertRaises(ValueError):
+			get_rdp_indexes(numpy.arange(3), numpy.arange(3), -1.0)
+	
+	@parameterized.expand([(num_values,) for num_values in [0, 1, 2]])
+	def test_short(self, num_values):
+		self.assertEqual(get_rdp_indexes(numpy.arange(num_values), numpy.zeros(num_values), 1.0).tolist(), list(range(num_values)))
+	
+	def test_closed_polyline(self):
+		x_values = numpy.array([0, 1, 2, 1, 0.5, 0])
+		y_values = numpy.array([0, 1, 0, -3, 0.1, 0])
+		
+		self.assertEqual(get_rdp_indexes(x_values, y_values, 1.0).tolist(), [0, 2, 3, 5])
+	
+	@parameterized.expand(
+			[
+				(num_values, epsilon)
+				for num_values in [3, 10, 200, 2000]
+				for epsilon in [0.0, 0.5, 2.0, 10.0]
+			]
+	)
+	def test_matches_reference(self, num_values, epsilon):
+		# Integer coordinates keep the cross products exact, so ties break the same way as in the reference.
+		random_state = numpy.random.RandomState(num_values)
+		x_values = numpy.cumsum(random_state.randint(0, 3, num_values)).astype(numpy.float64)
+		y_values = numpy.cumsum(random_state.randint(-3, 4, num_values)).astype(numpy.float64)
+		
+		self.assertEqual(
+				get_rdp_indexes(x_values, y_values, epsilon).tolist(),
+				get_reference_rdp_indexes(x_values.tolist(), y_values.tolist(), epsilon, 0, num_values - 1)
+		)
+
+
+class TestGetDownsampleIndexes(TestCase):
+	def test_invalid(self):
+		y_values = numpy.arange(10)
+		
+		with self.assertRaises(ValueError):
+			get_downsample_indexes(y_values, y_values, 5, "average")
+		
+		with self.assertRaises(ValueError):
+			get_lttb_indexes(y_values, y_values, 2)
+		
+		with self.assertRaises(ValueError):
+			get_minmax_indexes(y_values, 1)
+		
+		with self.assertRaises(ValueError):
+			get_m4_indexes(y_values, 3)
+	
+	@parameterized.expand([(method,) for method in ["lttb", "minmax", "m4"]])
+	def test_keeps_all_points_when_short(self, method):
+		y_values = numpy.array([3, 1, 2])
+		
+		self.assertEqual(get_downsample_indexes(numpy.arange(3), y_values, 4, method).tolist(), [0, 1, 2])
+	
+	@parameterized.expand([(num_values, num_points) for num_values in [10, 101, 1000] for num_points in [3, 7, 50] if num_points < num_values])
+	def test_lttb_matches_reference(self, num_values, num_points):
+		random_state = numpy.random.RandomState(num_values + num_points)
+		x_values = numpy.sort(random_state.rand(num_values))
+		y_values = numpy.cumsum(random_state.randn(num_values))
+		
+		self.assertEqual(
+				get_lttb_indexes(x_values, y_values, num_points).tolist(),
+				get_reference_lttb_indexes(x_values.tolist(), y_values.tolist(), num_points)
+		)
+	
+	def test_m4(self):
+		y_values = numpy.array([1, 5, 0, 2, 3, 3, 9, 3, 7, 1])
+		
+		self.assertEqual(get_m4_indexes(y_values, 8).tolist(), [0, 1, 2, 4, 5, 6, 9])
+	
+	@parameterized.expand([(num_points,) for num_points in [2, 10, 64]])
+	def test_minmax_keeps_extremes(self, num_points):
+		y_values = numpy.random.RandomState(num_points).randn(1000)
+		indexes = get_minmax_indexes(y_values, num_points)
+		
+		self.assertLessEqual(len(indexes), num_points)
+		self.assertIn(int(numpy.argmin(y_values)), indexes)
+		self.assertIn(int(numpy.argmax(y_values)), indexes)
+		self.assertTrue(numpy.all(numpy.diff(indexes) > 0))
+
+
+def graph_2D_downsample_test_suite() -> TestSuite:
+	suite = TestSuite()
+	test_loader = TestLoader()
+	
+	suite.addTest(test_loader.loadTestsFromTestCase(TestGetDownsampleIndexes))
+	suite.addTest(test_loader.loadTestsFromTestCase(TestGetRdpIndexes))
+	
+	return suite
+
+
+if __name__ == "__main__":
+	runner = TextTestRunner()
+	runner.run(graph_2D_downsample_test_suite())
\ No newline at end of file
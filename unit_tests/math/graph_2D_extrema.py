@@ -0,0 +1,222 @@
+import numpy
+from parameterized import parameterized
+from PyVarTools.math.graph_2D import Graph
+from PyVarTools.math.graph_2D_extrema import (
+	filter_by_distance,
+	find_extrema_indexes,
+	get_local_maxima_indexes,
+	get_previous_greater_indexes,
+	get_prominences,
+	get_range_extrema
+)
+from unittest import (
+	TestCase,
+	TestLoader,
+	TestSuite,
+	TextTestRunner
+)
+
+
+def get_reference_maxima_indexes(values: list[float]) -> list[int]:
+	indexes = []
+	index = 1
+	
+	while index < len(values) - 1:
+		if values[index - 1] < values[index]:
+			next_index = index + 1
+	
+			while next_index < len(values) - 1 and values[next_index] == values[index]:
+				next_index += 1
+	
+			if values[next_index] < values[index]:
+				indexes.append((index + next_index - 1) // 2)
+				index = next_index
+	
+		index += 1
+	
+	return indexes
+
+
+def get_reference_prominences(values: list[float], peak_indexes: list[int]) -> list[float]:
+	prominences = []
+	
+	for peak_index in peak_indexes:
+		bases = []
+	
+		for step in [-1, 1]:
+			index, base = peak_index, values[peak_index]
+	
+			while 0 <= index < len(values) and values[index] <= values[peak_index]:
+				base = min(base, values[index])
+				index += step
+	
+			bases.append(base)
+	
+		prominences.append(values[peak_index] - max(bases))
+	
+	return prominences
+
+
+def get_reference_distance_indexes(peak_indexes: list[int], heights: list[float], distance: int) -> list[int]:
+	keep = [True] * len(peak_indexes)
+	
+	for peak in sorted(range(len(peak_indexes)), key=lambda peak: (heights[peak], peak), reverse=True):
+		if keep[peak]:
+			for other_peak in range(len(peak_indexes)):
+				if other_peak != peak and abs(peak_indexes[other_peak] - peak_indexes[peak]) < distance:
+					keep[other_peak] = False
+	
+	return [peak_index for peak_index, is_kept in zip(peak_indexes, keep) if is_kept]
+
+
+def create_values(seed: int, num_values: int = 300) -> numpy.ndarray:
+	random_state = numpy.random.RandomState(seed)
+	
+	return random_state.randint(0, random_state.randint(2, 8), num_values).astype(float)
+
+
+class TestGetLocalMaximaIndexes(TestCase):
+	@parameterized.expand([(seed,) for seed in range(20)])
+	def test_matches_reference(self, seed):
+		values = create_values(seed)
+		
+		self.assertEqual(get_local_maxima_indexes(values).tolist(), get_reference_maxima_indexes(values.tolist()))
+	
+	def test_plateau(self):
+		self.assertEqual(get_local_maxima_indexes(numpy.array([0, 2, 2, 2, 2, 1, 3, 3])).tolist(), [2])
+	
+	def test_short(self):
+		for values in [[], [1], [1, 2], [2, 2, 2]]:
+			self.assertEqual(get_local_maxima_indexes(numpy.array(values)).tolist(), [])
+
+
+class TestGetProminences(TestCase):
+	@parameterized.expand([(seed,) for seed in range(20)])
+	def test_matches_reference(self, seed):
+		values = create_values(seed, 500)
+		peak_indexes = get_reference_maxima_indexes(values.tolist())
+		
+		self.assertEqual(
+				get_prominences(values, numpy.array(peak_indexes, dtype=numpy.int64)).tolist(),
+				get_reference_prominences(values.tolist(), peak_indexes)
+		)
+	
+	def test_not_maximum(self):
+		with self.assertRaises(ValueError):
+			get_prominences(numpy.array([0, 3, 1, 5, 0]), numpy.array([2]))
+
+
+class TestFilterByDistance(TestCase):
+	@parameterized.expand([(seed, distance) for seed in range(10) for distance in [1, 2, 5, 40]])
+	def test_matches_reference(self, seed, distance):
+		values = create_values(seed, 500)
+		peak_indexes = get_local_maxima_indexes(values)
+		
+		self.assertEqual(
+				filter_by_distance(peak_indexes, values[peak_indexes], distance).tolist(),
+				get_reference_distance_indexes(peak_indexes.tolist(), values[peak_indexes].tolist(), distance)
+		)
+	
+	def test_rising_chain(self):
+		values = numpy.zeros(2001)
+		values[1::2] = numpy.arange(1000)
+		peak_indexes = get_local_maxima_indexes(values)
+		
+		self.assertEqual(filter_by_distance(peak_indexes, values[peak_indexes], 3).tolist(), list(range(1999, 0, -4))[::-1])
+	
+	def test_invalid_distance(self):
+		with self.assertRaises(ValueError):
+			filter_by_distance(numpy.array([1, 3]), numpy.array([1, 1]), 0)
+
+
+class TestRangeHelpers(TestCase):
+	@parameterized.expand([(seed,) for seed in range(5)])
+	def test_get_range_extrema(self, seed):
+		random_state = numpy.random.RandomState(seed)
+		values = random_state.standard_normal(1000)
+		starts = random_state.randint(0, 1000, 300)
+		stops = numpy.minimum(starts + random_state.randint(1, 400, 300), 1000)
+		
+		self.assertEqual(get_range_extrema(values, starts, stops).tolist(), [values[start:stop].min() for start, stop in zip(starts, stops)])
+		self.assertEqual(
+				get_range_extrema(values, starts, stops, "max").tolist(),
+				[values[start:stop].max() for start, stop in zip(starts, stops)]
+		)
+	
+	@parameterized.expand([(seed,) for seed in range(5)])
+	def test_get_previous_greater_indexes(self, seed):
+		values = create_values(seed, 400)
+		expected = [
+			next((other for other in range(index - 1, -1, -1) if values[other] > values[index]), -1)
+			for index in range(len(values))
+		]
+		
+		self.assertEqual(get_previous_greater_indexes(values).tolist(), expected)
+
+
+class TestFindExtremaIndexes(TestCase):
+	@parameterized.expand(
+			[
+				(seed, height, distance, prominence)
+				for seed in range(4)
+				for height in [None, 3.0]
+				for distance in [None, 4]
+				for prominence in [None, 2.0]
+			]
+	)
+	def test_filters(self, seed, height, distance, prominence):
+		values = create_values(seed, 500)
+		expected = get_reference_maxima_indexes(values.tolist())
+		
+		if height is not None:
+			expected = [index for index in expected if values[index] >= height]
+		
+		if distance is not None:
+			expected = get_reference_distance_indexes(expected, values[expected].tolist(), distance)
+		
+		if prominence is not None:
+			prominences = get_reference_prominences(values.tolist(), expected)
+			expected = [index for index, index_prominence in zip(expected, prominences) if index_prominence >= prominence]
+		
+		self.assertEqual(find_extrema_indexes(values, "maxima", height, distance, prominence).tolist(), expected)
+	
+	def test_minima(self):
+		values = create_values(0, 500)
+		
+		self.assertEqual(
+				find_extrema_indexes(values, "minima", height=2.0, distance=3, prominence=1.0).tolist(),
+				find_extrema_indexes(-values, "maxima", height=-2.0, distance=3, prominence=1.0).tolist()
+		)
+	
+	def test_graph(self):
+		graph = Graph.from_arrays(range(7), [0, 3, 1, 5, 2, 4, 0])
+		
+		self.assertEqual(graph.find_extrema().tolist(), [1, 3, 5])
+		self.assertEqual(graph.find_extrema(prominence=2.5).tolist(), [3])
+		self.assertEqual(graph.find_extrema(kind="minima").tolist(), [2, 4])
+		self.assertEqual(Graph().find_extrema().tolist(), [])
+	
+	def test_invalid(self):
+		with self.assertRaises(ValueError):
+			find_extrema_indexes(numpy.arange(3), kind="peaks")
+		
+		with self.assertRaises(ValueError):
+			find_extrema_indexes(numpy.arange(3), distance=0)
+
+
+def graph_2D_extrema_test_suite() -> TestSuite:
+	suite = TestSuite()
+	test_loader = TestLoader()
+	
+	suite.addTest(test_loader.loadTestsFromTestCase(TestGetLocalMaximaIndexes))
+	suite.addTest(test_loader.loadTestsFromTestCase(TestGetProminences))
+	suite.addTest(test_loader.loadTestsFromTestCase(TestFilterByDistance))
+	suite.addTest(test_loader.loadTestsFromTestCase(TestRangeHelpers))
+	suite.addTest(test_loader.loadTestsFromTestCase(TestFindExtremaIndexes))
+	
+	return suite
+
+
+if __name__ == "__main__":
+	runner = TextTestRunner()
+	runner.run(graph_2D_extrema_test_suite())
\ No newline at end of file
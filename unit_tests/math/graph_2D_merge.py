@@ -0,0 +1,81 @@
+import numpy
+from parameterized import parameterized
+from PyVarTools.math.graph_2D import (
+	Graph,
+	GraphPoint
+)
+from PyVarTools.math.graph_2D_merge import merge_graphs
+from unittest import (
+	TestCase,
+	TestLoader,
+	TestSuite,
+	TextTestRunner
+)
+
+
+class TestMergeGraphs(TestCase):
+	def test_empty(self):
+		self.assertEqual(len(merge_graphs()), 0)
+		self.assertEqual(merge_graphs(Graph(), [], storage="points").storage, "points")
+		self.assertEqual(list(merge_graphs([], output="generator")), [])
+	
+	def test_invalid(self):
+		with self.assertRaises(ValueError):
+			merge_graphs(Graph(), duplicates="max")
+		
+		with self.assertRaises(ValueError):
+			merge_graphs(Graph(), output="list")
+		
+		with self.assertRaises(ValueError):
+			merge_graphs(Graph.from_arrays([1, 0], [0, 0]))
+		
+		with self.assertRaises(ValueError):
+			list(merge_graphs([(0, 0), (2, 0), (1, 0)], output="generator"))
+	
+	@parameterized.expand(
+			[
+				("keep", [(0, 1), (1, 5), (2, 1), (2, 3), (2, 7), (3, 5), (4, 1)]),
+				("first", [(0, 1), (1, 5), (2, 1), (3, 5), (4, 1)]),
+				("last", [(0, 1), (1, 5), (2, 7), (3, 5), (4, 1)]),
+				("mean", [(0, 1), (1, 5), (2, 11 / 3), (3, 5), (4, 1)]),
+			]
+	)
+	def test_duplicates(self, duplicates, expected_points):
+		first_graph = Graph.from_arrays([0, 2, 4], [1, 1, 1])
+		second_graph = Graph([GraphPoint(1, 5), GraphPoint(2, 3), GraphPoint(3, 5)])
+		third_points = iter([(2, 7)])
+		
+		merged_points = list(merge_graphs(first_graph, second_graph, third_points, duplicates=duplicates, output="generator"))
+		
+		self.assertEqual(merged_points, [GraphPoint(x, y) for x, y in expected_points])
+	
+	@parameterized.expand([("points",), ("columnar",)])
+	def test_matches_sorted_concatenation(self, storage):
+		random_state = numpy.random.RandomState(0)
+		sources = [numpy.sort(random_state.randint(0, 100, size)) for size in [50, 200, 0, 75]]
+		graphs = [Graph.from_arrays(x_values, random_state.rand(len(x_values)), storage=storage) for x_values in sources]
+		
+		merged_graph = merge_graphs(*graphs[:2], (point for point in graphs[2].points), graphs[3].points, storage=storage)
+		x_values = numpy.concatenate([graph.get_x_values() for graph in graphs])
+		y_values = numpy.concatenate([graph.get_y_values() for graph in graphs])
+		order = numpy.argsort(x_values, kind="stable")
+		
+		self.assertEqual(merged_graph.storage, storage)
+		self.assertTrue(merged_graph.is_x_sorted)
+		self.assertEqual(merged_graph.get_x_values().tolist(), x_values[order].tolist())
+		self.assertEqual(merged_graph.get_y_values().tolist(), y_values[order].tolist())
+		self.assertAlmostEqual(merged_graph.average, y_values.mean())
+
+
+def graph_2D_merge_test_suite() -> TestSuite:
+	suite = TestSuite()
+	test_loader = TestLoader()
+	
+	suite.addTest(test_loader.loadTestsFromTestCase(TestMergeGraphs))
+	
+	return suite
+
+
+if __name__ == "__main__":
+	runner = TextTestRunner()
+	runner.run(graph_2D_merge_test_suite())
\ No newline at end of file
@@ -0,0 +1,158 @@
+import numpy
+from parameterized import parameterized
+from PyVarTools.math.graph_2D import (
+	Graph,
+	GraphPoint,
+	ThresholdSensitivity
+)
+from PyVarTools.math.graph_2D_parallel import (
+	get_sections_batch,
+	get_sections_parallel
+)
+from PyVarTools.math.graph_2D_vectorized import get_section_bounds
+from unittest import (
+	TestCase,
+	TestLoader,
+	TestSuite,
+	TextTestRunner
+)
+
+
+def create_arrays(num_points: int, seed: int) -> tuple[numpy.ndarray, numpy.ndarray]:
+	random_state = numpy.random.RandomState(seed)
+	
+	return numpy.arange(num_points), numpy.cumsum(random_state.randint(-3, 4, num_points))
+
+
+def get_sections_points(sections) -> list[list[tuple[float, float]]]:
+	return [[(point.x, point.y) for point in section.points] for section in sections]
+
+
+class TestGetSectionsBatch(TestCase):
+	def setUp(self):
+		self.arrays = [create_arrays(200 + 10 * seed, seed) for seed in range(12)]
+		self.graphs = [
+			Graph([GraphPoint(x, y) for x, y in zip(x_values.tolist(), y_values.tolist())])
+			for x_values, y_values in self.arrays
+		]
+	
+	def test_invalid_output(self):
+		with self.assertRaises(ValueError):
+			get_sections_batch(self.graphs, output="dataframe")
+	
+	@parameterized.expand([(1, None), (2, None), (2, 5)])
+	def test_matches_get_sections(self, max_workers, chunksize):
+		results = get_sections_batch(
+				self.graphs[:6] + self.arrays[6:],
+				ThresholdSensitivity(1),
+				10.0,
+				max_workers=max_workers,
+				chunksize=chunksize
+		)
+		
+		self.assertEqual(len(results), len(self.graphs))
+		
+		for graph, sections in zip(self.graphs, results):
+			self.assertEqual(
+					get_sections_points(sections),
+					get_sections_points(graph.get_sections(ThresholdSensitivity(1), 10.0))
+			)
+	
+	@parameterized.expand([(max_workers, angle_sensitivity) for max_workers in [1, 2] for angle_sensitivity in [0.0, 90.0]])
+	def test_matches_get_sections_with_tenths(self, max_workers, angle_sensitivity):
+		graphs = [
+			Graph.from_arrays(numpy.arange(300), numpy.random.RandomState(seed).randint(0, 6, 300) / 10)
+			for seed in range(8)
+		]
+		results = get_sections_batch(graphs, angle_sensitivity=angle_sensitivity, max_workers=max_workers)
+		
+		for graph, sections in zip(graphs, results):
+			self.assertEqual(
+					get_sections_points(sections),
+					get_sections_points(graph.get_sections(angle_sensitivity=angle_sensitivity))
+			)
+	
+	def test_bounds_output(self):
+		results = get_sections_batch(self.arrays, ThresholdSensitivity(1), max_workers=2, output="bounds")
+		
+		for (x_values, y_values), bounds in zip(self.arrays, results):
+			sections = list(Graph([GraphPoint(x, y) for x, y in zip(x_values.tolist(), y_values.tolist())]).get_sections(ThresholdSensitivity(1)))
+		
+			self.assertEqual(bounds.shape, (len(sections), 2))
+			self.assertEqual(bounds[:, 1].tolist(), [section.points[-1].x + 1 for section in sections])
+
+
+class TestGetSectionsParallel(TestCase):
+	def test_empty(self):
+		self.assertEqual(get_sections_parallel((numpy.array([]), numpy.array([])), max_workers=1), [])
+	
+	def test_invalid_overlap(self):
+		with self.assertRaises(ValueError):
+			get_sections_parallel(create_arrays(10, 0), overlap=-1)
+	
+	@parameterized.expand(
+			[
+				(seed, threshold_sensitivity, num_chunks, overlap)
+				for seed in range(4)
+				for threshold_sensitivity in [ThresholdSensitivity(), ThresholdSensitivity(1), ThresholdSensitivity(0.2, "relative")]
+				for num_chunks in [2, 7]
+				for overlap in [0, 3, 50]
+			]
+	)
+	def test_matches_sequential_bounds(self, seed, threshold_sensitivity, num_chunks, overlap):
+		x_values, y_values = create_arrays(500, seed)
+		
+		self.assertEqual(
+				get_sections_parallel(
+						(x_values, y_values),
+						threshold_sensitivity,
+						10.0,
+						num_chunks=num_chunks,
+						overlap=overlap,
+						max_workers=1,
+						output="bounds"
+				).tolist(),
+				get_section_bounds(
+						x_values,
+						y_values,
+						threshold_sensitivity.threshold_sensitivity,
+						threshold_sensitivity.type_,
+						10.0
+				).tolist()
+		)
+	
+	def test_ring_sections_after_add(self):
+		x_values, y_values = create_arrays(50, 0)
+		graph = Graph([GraphPoint(x, y) for x, y in zip(x_values.tolist(), y_values.tolist())], storage="ring", capacity=50)
+		sections = get_sections_parallel(graph, num_chunks=2, overlap=5, max_workers=1)
+		expected = get_sections_points(sections)
+		
+		for x in range(50, 100):
+			graph.add(GraphPoint(x, 100))
+		
+		self.assertEqual(get_sections_points(sections), expected)
+		self.assertTrue(all(section.max in section.points for section in sections))
+	
+	def test_matches_get_sections_with_processes(self):
+		x_values, y_values = create_arrays(3000, 0)
+		graph = Graph([GraphPoint(x, y) for x, y in zip(x_values.tolist(), y_values.tolist())])
+		
+		self.assertEqual(
+				get_sections_points(get_sections_parallel(graph, ThresholdSensitivity(2), num_chunks=4, overlap=100, max_workers=2)),
+				get_sections_points(graph.get_sections(ThresholdSensitivity(2)))
+		)
+
+
+def graph_2D_parallel_test_suite() -> TestSuite:
+	suite = TestSuite()
+	test_loader = TestLoader()
+	
+	suite.addTest(test_loader.loadTestsFromTestCase(TestGetSectionsBatch))
+	suite.addTest(test_loader.loadTestsFromTestCase(TestGetSectionsParallel))
+	
+	return suite
+
+
+if __name__ == "__main__":
+	runner = TextTestRunner()
+	runner.run(graph_2D_parallel_test_suite())
\ No newline at end of file
@@ -0,0 +1,205 @@
+import numpy
+from parameterized import parameterized
+from PyVarTools.math.graph_2D_range import (
+	AggregationPyramid,
+	SegmentTree,
+	SparseTable,
+	get_rolling_statistics,
+	get_window_starts
+)
+from unittest import (
+	TestCase,
+	TestLoader,
+	TestSuite,
+	TextTestRunner
+)
+
+
+def get_expected_statistics(values: numpy.ndarray, start: int, stop: int) -> tuple[int, int, int, float]:
+	return (
+		stop - start,
+		start + int(numpy.argmin(values[start:stop])),
+		start + int(numpy.argmax(values[start:stop])),
+		float(numpy.sum(values[start:stop]))
+	)
+
+
+def get_random_ranges(num_values: int, num_ranges: int, seed: int) -> list[tuple[int, int]]:
+	random_state = numpy.random.RandomState(seed)
+	starts = random_state.randint(0, num_values, num_ranges)
+	
+	return [(start, random_state.randint(start + 1, num_values + 1)) for start in starts.tolist()]
+
+
+class TestAggregationPyramid(TestCase):
+	def test_empty(self):
+		statistics = AggregationPyramid().query([0, 0, 3])
+		
+		self.assertEqual(statistics.count.tolist(), [0, 0])
+		self.assertEqual(statistics.sum.tolist(), [0.0, 0.0])
+		self.assertTrue(numpy.all(numpy.isnan(statistics.min)))
+		self.assertTrue(numpy.all(numpy.isnan(statistics.mean)))
+	
+	@parameterized.expand([(num_values, seed) for num_values in [1, 7, 64, 1000, 5000] for seed in [0, 1]])
+	def test_matches_numpy(self, num_values, seed):
+		random_state = numpy.random.RandomState(seed)
+		values = random_state.randn(num_values)
+		
+		# Build from a block, then append one at a time across several buffer flushes, then extend again.
+		pyramid = AggregationPyramid(values[:num_values // 3])
+		
+		for value in values[num_values // 3:2 * num_values // 3].tolist():
+			pyramid.append(value)
+		
+		pyramid.extend(values[2 * num_values // 3:])
+		
+		self.assertEqual(len(pyramid), num_values)
+		
+		bounds = numpy.sort(random_state.randint(0, num_values + 1, 50))
+		statistics = pyramid.query(bounds)
+		
+		for index, (start, stop) in enumerate(zip(bounds[:-1].tolist(), bounds[1:].tolist())):
+			self.assertEqual(statistics.count[index], stop - start)
+		
+			if stop > start:
+				self.assertEqual(statistics.min[index], values[start:stop].min())
+				self.assertEqual(statistics.max[index], values[start:stop].max())
+				self.assertAlmostEqual(statistics.sum[index], values[start:stop].sum())
+				self.assertAlmostEqual(statistics.mean[index], values[start:stop].mean())
+			else:
+				self.assertTrue(numpy.isnan(statistics.max[index]))
+	
+	def test_query_after_append(self):
+		pyramid = AggregationPyramid([3, 1, 4])
+		
+		self.assertEqual(pyramid.query([0, 3]).max.tolist(), [4.0])
+		
+		pyramid.append(9)
+		statistics = pyramid.query([0, 2, 4], edges=[0.0, 0.5, 1.0])
+		
+		self.assertEqual(statistics.edges.tolist(), [0.0, 0.5, 1.0])
+		self.assertEqual(statistics.max.tolist(), [3.0, 9.0])
+		self.assertEqual(statistics.sum.tolist(), [4.0, 13.0])
+
+
+class TestGetRollingStatistics(TestCase):
+	@parameterized.expand([(window, seed) for window in [1, 3, 10] for seed in range(3)])
+	def test_count_windows_match_numpy(self, window, seed):
+		values = numpy.random.RandomState(seed).randint(-5, 6, 50) * 0.5
+		statistics = get_rolling_statistics(values, get_window_starts(numpy.arange(50), window))
+		
+		for index in range(50):
+			window_values = values[max(0, index - window + 1):index + 1]
+		
+			self.assertEqual(statistics.count[index], len(window_values))
+			self.assertEqual(statistics.min[index], window_values.min())
+			self.assertEqual(statistics.max[index], window_values.max())
+			self.assertAlmostEqual(statistics.mean[index], window_values.mean())
+			self.assertAlmostEqual(statistics.std[index], window_values.std())
+	
+	def test_invalid_windows(self):
+		with self.assertRaises(ValueError):
+			get_window_starts(numpy.arange(3), 0)
+		
+		with self.assertRaises(ValueError):
+			get_window_starts(numpy.arange(3), 1.5)
+		
+		with self.assertRaises(ValueError):
+			get_window_starts(numpy.array([0, 2, 1]), 1.5, "x")
+		
+		with self.assertRaises(ValueError):
+			get_window_starts(numpy.arange(3), 1, "time")
+	
+	def test_min_count(self):
+		statistics = get_rolling_statistics(numpy.array([1, 2, 3]), get_window_starts(numpy.arange(3), 2), 2)
+		
+		self.assertTrue(numpy.isnan(statistics.mean[0]))
+		self.assertEqual(statistics.mean[1:].tolist(), [1.5, 2.5])
+	
+	def test_x_windows(self):
+		x_values = numpy.array([0, 0.5, 1, 4, 4.2, 9])
+		
+		self.assertEqual(get_window_starts(x_values, 1, "x").tolist(), [0, 0, 1, 3, 3, 5])
+		self.assertEqual(get_window_starts(x_values, 5, "x").tolist(), [0, 0, 0, 0, 0, 4])
+
+
+class TestSegmentTree(TestCase):
+	@parameterized.expand([(num_values, capacity) for num_values in [1, 7, 64, 300] for capacity in [1, 16]])
+	def test_append_matches_numpy(self, num_values, capacity):
+		values = numpy.random.RandomState(num_values).randint(-5, 6, num_values)
+		segment_tree = SegmentTree(values[:num_values // 2], capacity)
+		
+		for value in values[num_values // 2:].tolist():
+			segment_tree.append(value)
+		
+		self.assertEqual(len(segment_tree), num_values)
+		
+		for start, stop in get_random_ranges(num_values, 50, num_values):
+			statistics = segment_tree.query(start, stop)
+		
+			self.assertEqual(
+					(statistics.count, statistics.min_index, statistics.max_index, statistics.sum),
+					get_expected_statistics(values, start, stop)
+			)
+	
+	def test_empty_range(self):
+		statistics = SegmentTree([1, 2, 3]).query(2, 2)
+		
+		self.assertEqual(statistics.count, 0)
+		self.assertIsNone(statistics.mean)
+		self.assertIsNone(statistics.min_index)
+	
+	def test_update(self):
+		segment_tree = SegmentTree([3, 1, 4, 1, 5])
+		segment_tree.update(4, 0)
+		segment_tree.update(2, 7)
+		
+		statistics = segment_tree.query(0, 5)
+		
+		self.assertEqual((statistics.min_index, statistics.max_index, statistics.sum), (4, 2, 12.0))
+		
+		with self.assertRaises(IndexError):
+			segment_tree.update(5, 0)
+
+
+class TestSparseTable(TestCase):
+	def test_empty(self):
+		self.assertEqual(SparseTable([]).query(0, 0).count, 0)
+		
+		with self.assertRaises(ValueError):
+			SparseTable([1], block_size=0)
+	
+	@parameterized.expand([(num_values, block_size) for num_values in [1, 7, 64, 1000] for block_size in [1, 4, 32]])
+	def test_matches_numpy(self, num_values, block_size):
+		values = numpy.random.RandomState(num_values).randint(-5, 6, num_values)
+		sparse_table = SparseTable(values, block_size)
+		
+		for start, stop in get_random_ranges(num_values, 50, num_values):
+			statistics = sparse_table.query(start, stop)
+		
+			self.assertEqual(
+					(statistics.count, statistics.min_index, statistics.max_index, statistics.sum),
+					get_expected_statistics(values, start, stop)
+			)
+	
+	def test_negative_indexes(self):
+		statistics = SparseTable([3, 1, 4, 1, 5]).query(-3, -1)
+		
+		self.assertEqual((statistics.min_value, statistics.max_value, statistics.mean), (1.0, 4.0, 2.5))
+
+
+def graph_2D_range_test_suite() -> TestSuite:
+	suite = TestSuite()
+	test_loader = TestLoader()
+	
+	suite.addTest(test_loader.loadTestsFromTestCase(TestAggregationPyramid))
+	suite.addTest(test_loader.loadTestsFromTestCase(TestGetRollingStatistics))
+	suite.addTest(test_loader.loadTestsFromTestCase(TestSegmentTree))
+	suite.addTest(test_loader.loadTestsFromTestCase(TestSparseTable))
+	
+	return suite
+
+
+if __name__ == "__main__":
+	runner = TextTestRunner()
+	runner.run(graph_2D_range_test_suite())
\ No newline at end of file
@@ -0,0 +1,267 @@
+import numpy
+from parameterized import parameterized
+from PyVarTools.math.graph_2D import (
+	Graph,
+	GraphPoint,
+	ThresholdSensitivity,
+	calculate_angle_degree
+)
+from PyVarTools.math.graph_2D_vectorized import (
+	DIRECTION_DECREASING,
+	DIRECTION_INCREASING,
+	DIRECTION_NONE,
+	DIRECTION_STRAIGHT,
+	get_angles,
+	get_directions,
+	get_point_angles,
+	get_section_bounds,
+	get_section_summaries,
+	get_slope_threshold
+)
+from unittest import (
+	TestCase,
+	TestLoader,
+	TestSuite,
+	TextTestRunner
+)
+
+
+def create_y_values(kind: str, num_points: int, seed: int) -> numpy.ndarray:
+	random_state = numpy.random.RandomState(seed)
+	
+	if kind == "integers":
+		return random_state.randint(-5, 6, num_points)
+	
+	if kind == "random_walk":
+		return numpy.cumsum(random_state.randint(-3, 4, num_points))
+	
+	if kind == "quarters":
+		return random_state.randint(0, 9, num_points) / 4
+	
+	if kind == "tenths":
+		return random_state.randint(0, 6, num_points) / 10
+	
+	return numpy.repeat(random_state.randint(0, 4, num_points // 10 + 1), 10)[:num_points] + numpy.arange(num_points) // 7
+
+
+def get_iterative_bounds(
+		x_values: numpy.ndarray,
+		y_values: numpy.ndarray,
+		threshold_sensitivity: ThresholdSensitivity,
+		angle_sensitivity: float
+) -> list[list[int]]:
+	graph = Graph([GraphPoint(x, y) for x, y in zip(x_values.tolist(), y_values.tolist())])
+	index_by_x = {x: i for i, x in enumerate(x_values.tolist())}
+	
+	return [
+		[index_by_x[section.points[0].x], index_by_x[section.points[-1].x] + 1]
+		for section in graph.get_sections(threshold_sensitivity, angle_sensitivity)
+	]
+
+
+THRESHOLD_SENSITIVITIES = [
+	ThresholdSensitivity(),
+	ThresholdSensitivity(1),
+	ThresholdSensitivity(0.5),
+	ThresholdSensitivity(0.2, "relative"),
+]
+
+
+class TestGetSectionBounds(TestCase):
+	def test_empty(self):
+		self.assertEqual(get_section_bounds(numpy.array([]), numpy.array([])).shape, (0, 2))
+	
+	def test_example(self):
+		bounds = get_section_bounds(numpy.arange(6), numpy.array([1, 2, 3, 2, 1, 2]))
+		
+		self.assertEqual(bounds.tolist(), [[0, 3], [2, 5], [4, 6]])
+	
+	def test_invalid_block_size(self):
+		with self.assertRaises(ValueError):
+			get_section_bounds(numpy.arange(3), numpy.arange(3), block_size=0)
+	
+	@parameterized.expand(
+			[
+				(kind, seed, threshold_sensitivity, angle_sensitivity, block_size)
+				for kind in ["integers", "random_walk", "quarters", "tenths", "steps"]
+				for seed in range(3)
+				for threshold_sensitivity in THRESHOLD_SENSITIVITIES
+				for angle_sensitivity in [0.0, 10.0, 45.0]
+				for block_size in [1, 4, 64]
+			]
+	)
+	def test_matches_iterative_engine(self, kind, seed, threshold_sensitivity, angle_sensitivity, block_size):
+		y_values = create_y_values(kind, 300, seed)
+		x_values = numpy.arange(300) if seed % 2 == 0 else numpy.cumsum(numpy.random.RandomState(seed).randint(1, 4, 300))
+		
+		self.assertEqual(
+				get_section_bounds(
+						x_values,
+						y_values,
+						threshold_sensitivity.threshold_sensitivity,
+						threshold_sensitivity.type_,
+						angle_sensitivity,
+						block_size
+				).tolist(),
+				get_iterative_bounds(x_values, y_values, threshold_sensitivity, angle_sensitivity)
+		)
+	
+	@parameterized.expand([(seed, block_size) for seed in range(10) for block_size in [1, 4, 64]])
+	def test_straight_sections_of_tenths(self, seed, block_size):
+		y_values = create_y_values("tenths", 200, seed)
+		
+		self.assertEqual(
+				get_section_bounds(numpy.arange(200), y_values, angle_sensitivity=90.0, block_size=block_size).tolist(),
+				get_iterative_bounds(numpy.arange(200), y_values, ThresholdSensitivity(), 90.0)
+		)
+	
+	@parameterized.expand([(block_size,) for block_size in [1, 4, 64]])
+	def test_straight_sections_of_tenths_example(self, block_size):
+		y_values = numpy.array([0.3, 0.5, 0.1, 0.4, 0.0, 0.5, 0.1, 0.2, 0.5, 0.5, 0.2, 0.3, 0.5, 0.1, 0.3, 0.3, 0.0, 0.3, 0.2, 0.0, 0.2, 0.1])
+		
+		self.assertEqual(
+				get_section_bounds(numpy.arange(22), y_values, angle_sensitivity=90.0, block_size=block_size).tolist(),
+				[[0, 22]]
+		)
+		self.assertEqual(get_iterative_bounds(numpy.arange(22), y_values, ThresholdSensitivity(), 90.0), [[0, 22]])
+	
+	def test_single_point(self):
+		self.assertEqual(get_section_bounds(numpy.array([0]), numpy.array([1])).tolist(), [[0, 1]])
+
+
+class TestGetAngles(TestCase):
+	@parameterized.expand([(seed,) for seed in range(3)])
+	def test_matches_calculate_angle_degree(self, seed):
+		random_state = numpy.random.RandomState(seed)
+		x_values = random_state.randint(-3, 4, 200)
+		y_values = numpy.concatenate([random_state.randint(-3, 4, 100), random_state.standard_normal(100)])
+		start_indexes = random_state.randint(0, 200, 500)
+		end_indexes = random_state.randint(0, 200, 500)
+		
+		angles = get_point_angles(x_values, y_values, start_indexes, end_indexes)
+		
+		for angle, start, end in zip(angles.tolist(), start_indexes.tolist(), end_indexes.tolist()):
+			self.assertEqual(
+					angle,
+					calculate_angle_degree(
+							GraphPoint(x_values[start].item(), y_values[start].item()),
+							GraphPoint(x_values[end].item(), y_values[end].item())
+					)
+			)
+	
+	def test_edge_cases(self):
+		self.assertEqual(get_angles([0, 0, 2, 1], [0, -3, 0, -1]).tolist(), [0.0, 90.0, 0.0, -45.0])
+	
+	def test_consecutive_points(self):
+		graph = Graph([GraphPoint(0, 0), GraphPoint(1, 1), GraphPoint(2, 1), GraphPoint(3, 0)], storage="columnar")
+		
+		self.assertEqual(graph.get_angles().tolist(), [45.0, 0.0, -45.0])
+		self.assertEqual(Graph().get_angles().tolist(), [])
+	
+	def test_invalid_indexes(self):
+		with self.assertRaises(ValueError):
+			get_point_angles(numpy.arange(3), numpy.arange(3), [0, 1], [2])
+
+
+class TestGetDirections(TestCase):
+	@parameterized.expand([(angle_sensitivity,) for angle_sensitivity in [0.0, 1e-9, 10.0, 30.0, 45.0, 60.0, 89.99, 90.0, 135.0]])
+	def test_tangent_space(self, angle_sensitivity):
+		random_state = numpy.random.RandomState(0)
+		delta_x = numpy.concatenate([random_state.randint(-5, 6, 1000), random_state.standard_normal(1000), numpy.ones(4)])
+		threshold = get_slope_threshold(angle_sensitivity)
+		delta_y = numpy.concatenate(
+				[
+					random_state.randint(-5, 6, 1000),
+					random_state.standard_normal(1000),
+					numpy.nextafter(threshold, [-numpy.inf, numpy.inf]) if numpy.isfinite(threshold) else [1, -1],
+					[threshold, -threshold] if numpy.isfinite(threshold) else [0, 0],
+				]
+		)
+		
+		self.assertEqual(
+				get_directions(delta_x, delta_y, angle_sensitivity, "tangent").tolist(),
+				get_directions(delta_x, delta_y, angle_sensitivity, "angle").tolist()
+		)
+	
+	def test_invalid(self):
+		with self.assertRaises(ValueError):
+			get_directions(numpy.ones(1), numpy.ones(1), 0.0, "slope")
+		
+		with self.assertRaises(ValueError):
+			get_slope_threshold(-1.0)
+
+
+DIRECTION_CODES = {
+	None: DIRECTION_NONE,
+	"increasing": DIRECTION_INCREASING,
+	"decreasing": DIRECTION_DECREASING,
+	"straight": DIRECTION_STRAIGHT,
+}
+
+
+class TestGetSectionSummaries(TestCase):
+	def test_empty(self):
+		summaries = get_section_summaries(numpy.array([]), numpy.array([]), numpy.empty((0, 2), dtype=numpy.int64))
+		
+		self.assertEqual(len(summaries), 0)
+	
+	@parameterized.expand(
+			[
+				(kind, seed, angle_sensitivity)
+				for kind in ["integers", "random_walk", "quarters", "steps"]
+				for seed in range(3)
+				for angle_sensitivity in [0.0, 45.0]
+			]
+	)
+	def test_matches_sections(self, kind, seed, angle_sensitivity):
+		y_values = create_y_values(kind, 300, seed)
+		x_values = numpy.cumsum(numpy.random.RandomState(seed).randint(0, 3, 300))
+		graph = Graph.from_arrays(x_values, y_values)
+		sections = list(graph.get_sections(ThresholdSensitivity(1), angle_sensitivity))
+		
+		summaries = get_section_summaries(
+				x_values,
+				y_values,
+				numpy.array([(section.start, section.stop) for section in sections]),
+				angle_sensitivity
+		)
+		
+		self.assertEqual(len(summaries), len(sections))
+		
+		for summary, section in zip(summaries, sections):
+			angle = section.get_angle_degree()
+		
+			self.assertEqual((summary["start"], summary["stop"]), (section.start, section.stop))
+			self.assertEqual(summary["direction"], DIRECTION_CODES[section.get_direction()])
+			self.assertEqual((summary["min_index"], summary["min_value"]), (section.min_index, section.min.y))
+			self.assertEqual((summary["max_index"], summary["max_value"]), (section.max_index, section.max.y))
+			self.assertAlmostEqual(summary["mean"], section.average)
+		
+			if angle is None:
+				self.assertTrue(numpy.isnan(summary["angle"]))
+			else:
+				self.assertAlmostEqual(summary["angle"], angle)
+	
+	def test_single_point_section(self):
+		summaries = get_section_summaries(numpy.array([0, 1]), numpy.array([2, 5]), numpy.array([[0, 1], [0, 2]]))
+		
+		self.assertEqual(summaries["direction"].tolist(), [DIRECTION_NONE, DIRECTION_INCREASING])
+		self.assertTrue(numpy.isnan(summaries["angle"][0]))
+		self.assertEqual(summaries["max_index"].tolist(), [0, 1])
+
+
+def graph_2D_vectorized_test_suite() -> TestSuite:
+	suite = TestSuite()
+	test_loader = TestLoader()
+	
+	suite.addTest(test_loader.loadTestsFromTestCase(TestGetSectionBounds))
+	suite.addTest(test_loader.loadTestsFromTestCase(TestGetSectionSummaries))
+	suite.addTest(test_loader.loadTestsFromTestCase(TestGetAngles))
+	suite.addTest(test_loader.loadTestsFromTestCase(TestGetDirections))
+	
+	return suite
+
+
+if __name__ == "__main__":
+	runner = TextTestRunner()
+	runner.run(graph_2D_vectorized_test_suite())
\ No newline at end of file